@@ -0,0 +1,142 @@
+import os
+import pygame
+from collections import OrderedDict
+
+class AssetRegistry:
+    """Central image store shared by every sprite and UI element
+
+    Source images, scaled variants and generated fallback surfaces share
+    one LRU bounded by a memory budget. Sources are keyed (filename, None)
+    and touched whenever one of their variants is asked for, so a file is
+    only read from disk again once it and its recent variants have gone
+    unused long enough to be evicted.
+    """
+    def __init__(self, asset_dir="assets", max_bytes=32 * 1024 * 1024):
+        self.asset_dir = asset_dir
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+
+        # cache key -> (Surface, size in bytes), oldest first
+        self.images = OrderedDict()
+
+        # Filenames that are missing or unreadable, so they aren't retried
+        self.missing = set()
+
+        # object type -> function(list of object data) that warms the cache
+        self.preloaders = {}
+
+        # Stats
+        self.disk_loads = 0
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, filename):
+        """Load a source image, returning None if it is unavailable"""
+        if filename in self.missing:
+            return None
+
+        key = (filename, None)
+        entry = self.images.get(key)
+        if entry:
+            self.images.move_to_end(key)
+            return entry[0]
+
+        image = None
+        path = os.path.join(self.asset_dir, filename)
+        if os.path.exists(path):
+            try:
+                image = pygame.image.load(path).convert_alpha()
+                self.disk_loads += 1
+            except pygame.error as e:
+                print(f"Error loading {path}: {e}")
+
+        if image is None:
+            self.missing.add(filename)
+        else:
+            self._store(key, image)
+        return image
+
+    def get_image(self, filename, size, fallback=None, fallback_style=None):
+        """Get an image scaled to size, or a cached fallback if it is missing
+
+        Args:
+            filename (str): Image file relative to the asset directory
+            size (int or tuple): Output size; an int means a square image
+            fallback (callable): Draws a replacement surface given (width, height)
+            fallback_style: Hashable description of the fallback, so callers
+                drawing different fallbacks for one filename get their own
+
+        Returns:
+            pygame.Surface: Shared surface - copy it before drawing on it
+        """
+        if isinstance(size, int):
+            size = (size, size)
+        else:
+            size = tuple(size)
+
+        source = self.load(filename)
+        if source is None:
+            key = (filename, size, fallback_style)
+        else:
+            key = (filename, size)
+
+        entry = self.images.get(key)
+        if entry:
+            self.images.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        if source is not None:
+            image = source
+            if source.get_size() != size:
+                image = pygame.transform.scale(source, size)
+        elif fallback:
+            image = fallback(*size)
+        else:
+            image = pygame.Surface(size, pygame.SRCALPHA)
+
+        self._store(key, image)
+        return image
+
+    def register_preloader(self, object_type, preloader):
+        """Register a function that warms the cache for one map object type"""
+        self.preloaders[object_type] = preloader
+
+    def preload(self, area_data):
+        """Load and scale the images an area will need before it is spawned"""
+        if not area_data:
+            return
+
+        objects_by_type = {}
+        for obj in area_data.get("objects", []):
+            objects_by_type.setdefault(obj["type"], []).append(obj)
+
+        # Generated asteroid fields spawn asteroids without object data
+        if area_data.get("type") == "asteroid_field":
+            objects_by_type.setdefault("asteroid", [])
+
+        for object_type, objects in objects_by_type.items():
+            preloader = self.preloaders.get(object_type)
+            if preloader:
+                preloader(objects)
+
+    def clear(self):
+        """Drop all cached images"""
+        self.images.clear()
+        self.missing.clear()
+        self.used_bytes = 0
+
+    def _store(self, key, image):
+        """Add an image to the LRU, evicting old entries over budget"""
+        size = image.get_width() * image.get_height() * image.get_bytesize()
+        self.images[key] = (image, size)
+        self.used_bytes += size
+
+        # Evict least recently used images, always keeping the newest
+        while self.used_bytes > self.max_bytes and len(self.images) > 1:
+            _, (_, evicted_size) = self.images.popitem(last=False)
+            self.used_bytes -= evicted_size
+
+# Shared registry used by all image loading
+asset_registry = AssetRegistry()
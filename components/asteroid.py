@@ -3,73 +3,47 @@ import random
 import math
 from game_config import *
 from components.items import ORE_TYPES
+from components.asset_registry import asset_registry
+
+# Predefined asteroid sizes and number of asteroid images
+ASTEROID_SIZES = [32, 48, 64, 80, 96]
+ASTEROID_VARIANTS = 5
+
+def draw_asteroid_fallback(width, height):
+    """Draw a grey circle for asteroids without an image"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.circle(surface, GREY, (width // 2, height // 2), min(width, height) // 2)
+    return surface
+
+def get_asteroid_image(variant, size):
+    """Get the shared, unrotated image for an asteroid variant and size"""
+    return asset_registry.get_image(f"asteroid_{variant}.png", size, draw_asteroid_fallback)
+
+def preload_asteroid_images(objects):
+    """Warm the asset cache with every asteroid image and size"""
+    for variant in range(1, ASTEROID_VARIANTS + 1):
+        for size in ASTEROID_SIZES:
+            get_asteroid_image(variant, size)
+
+asset_registry.register_preloader("asteroid", preload_asteroid_images)
 
 class Asteroid(pygame.sprite.Sprite):
-    # Track destroyed asteroids for respawning
-    respawn_queue = []
-    
-    @classmethod
-    def update_respawns(cls, all_sprites, asteroids_group):
-        # Process respawn queue
-        for i in range(len(cls.respawn_queue) - 1, -1, -1):
-            asteroid_data = cls.respawn_queue[i]
-            asteroid_data["timer"] -= 1
-            
-            if asteroid_data["timer"] <= 0:
-                # Respawn at random edge
-                new_asteroid = Asteroid(asteroid_type=asteroid_data["type"])
-                
-                # Choose edge (0=top, 1=right, 2=bottom, 3=left)
-                edge = random.randint(0, 3)
-                if edge == 0:  # Top
-                    x = random.randint(0, WORLD_WIDTH)
-                    y = 0
-                elif edge == 1:  # Right
-                    x = WORLD_WIDTH
-                    y = random.randint(0, WORLD_HEIGHT)
-                elif edge == 2:  # Bottom
-                    x = random.randint(0, WORLD_WIDTH)
-                    y = WORLD_HEIGHT
-                else:  # Left
-                    x = 0
-                    y = random.randint(0, WORLD_HEIGHT)
-                
-                # Set position
-                new_asteroid.rect.center = (x, y)
-                new_asteroid.position = pygame.math.Vector2(new_asteroid.rect.center)
-                
-                # Add to sprite groups
-                all_sprites.add(new_asteroid)
-                asteroids_group.add(new_asteroid)
-                
-                # Remove from queue
-                cls.respawn_queue.pop(i)
-    
-    def __init__(self, asteroid_type="regular"):
+    def __init__(self, asteroid_type="regular", size=None, variant=None, angle=None):
         super().__init__()
         # Set asteroid type (affects ore drops)
         self.asteroid_type = asteroid_type
         
-        # Choose from predefined sizes
-        size_options = [32, 48, 64, 80, 96]
-        self.size = random.choice(size_options)
+        # Choose from predefined sizes (unless restoring a saved asteroid)
+        self.size = size or random.choice(ASTEROID_SIZES)
         
         # Choose random asteroid image (1-5)
-        asteroid_num = random.randint(1, 5)
+        self.variant = variant or random.randint(1, ASTEROID_VARIANTS)
         
-        try:
-            # Try loading asteroid image
-            self.original_image = pygame.image.load(f"assets/asteroid_{asteroid_num}.png").convert_alpha()
-            scale_factor = self.size / 480  # Assuming 480x480 source image
-            new_size = int(480 * scale_factor)
-            self.original_image = pygame.transform.scale(self.original_image, (new_size, new_size))
-        except:
-            # Fallback to circle if image not found
-            self.original_image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(self.original_image, GREY, (self.size // 2, self.size // 2), self.size // 2)
+        # Shared image, already scaled to this size
+        self.original_image = get_asteroid_image(self.variant, self.size)
         
         # Set fixed random rotation angle
-        self.angle = random.randint(0, 359)
+        self.angle = random.randint(0, 359) if angle is None else angle
         
         # Apply the rotation once
         self.image = pygame.transform.rotate(self.original_image, self.angle)
@@ -86,40 +60,22 @@ class Asteroid(pygame.sprite.Sprite):
         angle = random.uniform(0, math.pi * 2)
         self.velocity = pygame.math.Vector2(math.cos(angle), math.sin(angle))
         self.speed = random.uniform(0.1, 0.3)
-    
-    def update(self, game_state):
-        # Skip updates if not in gameplay state
-        if game_state != 0:  # GAME_RUNNING = 0
-            return
         
-        # Update position
-        self.position += self.velocity * self.speed
-        
-        # Wrap around world boundaries
-        if self.position.x < 0:
-            self.position.x = WORLD_WIDTH
-        elif self.position.x > WORLD_WIDTH:
-            self.position.x = 0
-            
-        if self.position.y < 0:
-            self.position.y = WORLD_HEIGHT
-        elif self.position.y > WORLD_HEIGHT:
-            self.position.y = 0
-        
-        # Update rect position without rotating again
-        self.rect.center = self.position
+        # AsteroidField moving this asteroid and its slot in the field's arrays
+        self.field = None
+        self.field_index = None
+        self.field_event = None
+    
+    def kill(self):
+        """Remove from all sprite groups and the asteroid field"""
+        if self.field:
+            self.field.remove(self)
+        super().kill()
     
     def damage(self, amount=1):
         self.health -= amount
         return self.health <= 0
     
-    def schedule_respawn(self, time_frames):
-        """Add to respawn queue"""
-        Asteroid.respawn_queue.append({
-            "type": self.asteroid_type,
-            "timer": time_frames
-        })
-    
     def get_ore_drops(self):
         """Returns ore items dropped by asteroid"""
         # Number of drops based on size
@@ -0,0 +1,199 @@
+import heapq
+import itertools
+from array import array
+import pygame
+from game_config import *
+
+class AsteroidField:
+    """Moves every asteroid in an area from packed arrays instead of per-sprite updates
+
+    Asteroids drift in a straight line and wrap around the world, so each
+    one's position is a function of the tick: (origin + velocity * tick)
+    modulo the world size. Origins and velocities are stored as parallel
+    arrays and nothing is recomputed per asteroid per tick. Instead the
+    field keeps a heap of the ticks at which asteroids cross into a new
+    grid cell and only re-buckets those. Sprite rects are brought up to
+    date when a query returns them, so only asteroids near the camera or a
+    laser ever have their rect touched.
+    """
+    def __init__(self, grid, width=WORLD_WIDTH, height=WORLD_HEIGHT):
+        self.grid = grid
+        self.width = width
+        self.height = height
+
+        # Ticks the field has been stepped
+        self.tick = 0
+
+        # Position at tick 0 and velocity per tick, indexed by asteroid.field_index
+        self.origin_x = array('d')
+        self.origin_y = array('d')
+        self.velocity_x = array('d')
+        self.velocity_y = array('d')
+        self.sprites = []
+
+        # Heap of (due tick, sequence, asteroid) grid cell crossings
+        self.crossings = []
+        self.sequence = itertools.count()
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def __contains__(self, asteroid):
+        return asteroid.field is self
+
+    def add(self, asteroid):
+        """Start moving an asteroid from its current position"""
+        velocity = asteroid.velocity * asteroid.speed
+
+        asteroid.field = self
+        asteroid.field_index = len(self.sprites)
+        self.sprites.append(asteroid)
+        self.origin_x.append(asteroid.position.x - velocity.x * self.tick)
+        self.origin_y.append(asteroid.position.y - velocity.y * self.tick)
+        self.velocity_x.append(velocity.x)
+        self.velocity_y.append(velocity.y)
+
+        self.sync(asteroid)
+        self.grid.insert(asteroid)
+        self.schedule_crossing(asteroid)
+
+    def remove(self, asteroid):
+        """Stop moving an asteroid and take it out of the grid"""
+        if asteroid.field is not self:
+            return
+
+        # Move the last asteroid into the freed slot
+        index = asteroid.field_index
+        last = self.sprites.pop()
+        if last is not asteroid:
+            self.sprites[index] = last
+            last.field_index = index
+            self.origin_x[index] = self.origin_x[-1]
+            self.origin_y[index] = self.origin_y[-1]
+            self.velocity_x[index] = self.velocity_x[-1]
+            self.velocity_y[index] = self.velocity_y[-1]
+        self.origin_x.pop()
+        self.origin_y.pop()
+        self.velocity_x.pop()
+        self.velocity_y.pop()
+
+        asteroid.field = None
+        asteroid.field_index = None
+        self.grid.remove(asteroid)
+
+    def clear(self):
+        """Remove every asteroid"""
+        for asteroid in self.sprites:
+            asteroid.field = None
+            asteroid.field_index = None
+
+        self.sprites = []
+        self.origin_x = array('d')
+        self.origin_y = array('d')
+        self.velocity_x = array('d')
+        self.velocity_y = array('d')
+        self.crossings = []
+        self.grid.clear()
+
+    def step(self):
+        """Advance one tick, re-bucketing asteroids that crossed into a new cell"""
+        self.tick += 1
+
+        crossings = self.crossings
+        while crossings and crossings[0][0] <= self.tick:
+            _, sequence, asteroid = heapq.heappop(crossings)
+
+            # Skip crossings of removed asteroids or superseded events
+            if asteroid.field is not self or asteroid.field_event != sequence:
+                continue
+
+            self.sync(asteroid)
+            self.grid.move(asteroid)
+            self.schedule_crossing(asteroid)
+
+    def advance(self, ticks):
+        """Jump ahead by any number of ticks in one pass
+
+        Positions are a function of the tick, so catching up after an hour
+        costs the same as after a second: every asteroid is re-bucketed
+        once at its new position and its next crossing rescheduled.
+        """
+        if ticks <= 0:
+            return
+        self.tick += ticks
+
+        self.crossings = []
+        for asteroid in self.sprites:
+            self.sync(asteroid)
+            self.grid.move(asteroid)
+            self.schedule_crossing(asteroid)
+
+    def get_position(self, index, tick):
+        """Get the position of the asteroid at an index on a given tick"""
+        x = (self.origin_x[index] + self.velocity_x[index] * tick) % self.width
+        y = (self.origin_y[index] + self.velocity_y[index] * tick) % self.height
+        return x, y
+
+    def sync(self, asteroid):
+        """Bring an asteroid's position and rect up to the current tick"""
+        index = asteroid.field_index
+        x, y = self.get_position(index, self.tick)
+
+        # Remember last tick's position for render interpolation
+        asteroid.previous_center = self.get_position(index, self.tick - 1)
+        asteroid.position.update(x, y)
+        asteroid.rect.center = (int(x), int(y))
+
+    def sync_all(self):
+        """Bring every asteroid up to the current tick (e.g. before saving)"""
+        for asteroid in self.sprites:
+            self.sync(asteroid)
+
+    def schedule_crossing(self, asteroid):
+        """Queue the tick at which an asteroid next leaves its grid cell"""
+        index = asteroid.field_index
+        x, y = self.get_position(index, self.tick)
+        ticks = min(self._ticks_to_edge(x, self.velocity_x[index], self.width),
+                    self._ticks_to_edge(y, self.velocity_y[index], self.height))
+        if ticks == float('inf'):
+            asteroid.field_event = None
+            return
+
+        sequence = next(self.sequence)
+        asteroid.field_event = sequence
+        heapq.heappush(self.crossings, (self.tick + int(ticks) + 1, sequence, asteroid))
+
+    def _ticks_to_edge(self, position, velocity, limit):
+        """Ticks until a coordinate moving at velocity reaches its cell's edge"""
+        cell_size = self.grid.cell_size
+        if velocity > 0:
+            edge = min((int(position) // cell_size + 1) * cell_size, limit)
+            return (edge - position) / velocity
+        if velocity < 0:
+            edge = int(position) // cell_size * cell_size
+            return (position - edge) / -velocity
+        return float('inf')
+
+    def candidates(self, rect):
+        """Yield up-to-date asteroids in grid cells that could overlap the rect"""
+        for asteroid in self.grid.candidates(rect):
+            self.sync(asteroid)
+            yield asteroid
+
+    def query_rect(self, rect):
+        """Return asteroids whose rect overlaps the given world rect"""
+        return [asteroid for asteroid in self.candidates(rect) if asteroid.rect.colliderect(rect)]
+
+    def query_radius(self, position, radius):
+        """Return asteroids whose centre lies within radius of position"""
+        area = pygame.Rect(0, 0, radius * 2, radius * 2)
+        area.center = (int(position[0]), int(position[1]))
+
+        radius_sq = radius * radius
+        found = []
+        for asteroid in self.candidates(area):
+            dx = asteroid.rect.centerx - position[0]
+            dy = asteroid.rect.centery - position[1]
+            if dx * dx + dy * dy <= radius_sq:
+                found.append(asteroid)
+        return found
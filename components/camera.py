@@ -6,8 +6,19 @@ class Camera:
         self.rect = pygame.Rect(0, 0, width, height)
         self.width = width
         self.height = height
+        
+        # Render interpolation between the previous and current tick
+        # (0 = previous tick, 1 = current tick)
+        self.previous_topleft = self.rect.topleft
+        self.interpolation = 1.0
+        
+        # Culling stats from the last visible-set query
+        self.drawn_sprites = 0
+        self.culled_sprites = 0
     
     def update(self, target):
+        self.previous_topleft = self.rect.topleft
+        
         # Keep target centered
         x = -target.rect.centerx + SCREEN_WIDTH // 2
         y = -target.rect.centery + SCREEN_HEIGHT // 2
@@ -22,4 +33,51 @@ class Camera:
         self.rect.y = y
     
     def apply(self, entity):
-        return entity.rect.move(self.rect.topleft)
+        rect = entity.rect.move(self.rect.topleft)
+        if self.interpolation >= 1.0:
+            return rect
+        
+        # Offset back towards where the camera and entity were last tick
+        dx = self.previous_topleft[0] - self.rect.x
+        dy = self.previous_topleft[1] - self.rect.y
+        if abs(dx) > MAX_INTERPOLATION_STEP or abs(dy) > MAX_INTERPOLATION_STEP:
+            dx = dy = 0
+        
+        previous_center = getattr(entity, "previous_center", None)
+        if previous_center:
+            ex = previous_center[0] - entity.rect.centerx
+            ey = previous_center[1] - entity.rect.centery
+            if abs(ex) <= MAX_INTERPOLATION_STEP and abs(ey) <= MAX_INTERPOLATION_STEP:
+                dx += ex
+                dy += ey
+        
+        blend = 1.0 - self.interpolation
+        return rect.move(round(dx * blend), round(dy * blend))
+    
+    def get_view_rect(self):
+        """Return the visible area in world coordinates"""
+        return pygame.Rect(-self.rect.x, -self.rect.y, self.width, self.height)
+    
+    def get_visible_sprites(self, spatial_hashes, groups):
+        """Return sprites overlapping the camera view
+        
+        Sprites in a spatial hash are found with a grid query, while sprites
+        in the plain groups are tested one by one, so keep those groups small.
+        """
+        view_rect = self.get_view_rect()
+        visible = []
+        total = 0
+        
+        for spatial_hash in spatial_hashes:
+            visible.extend(spatial_hash.query_rect(view_rect))
+            total += len(spatial_hash)
+        
+        for group in groups:
+            for sprite in group:
+                if sprite.rect.colliderect(view_rect):
+                    visible.append(sprite)
+            total += len(group)
+        
+        self.drawn_sprites = len(visible)
+        self.culled_sprites = total - self.drawn_sprites
+        return visible
@@ -1,8 +1,8 @@
 from .flags import FlagSystem
+from .compiler import DialogueCompiler
 from .dialogue import DialogueSystem
 from .npc import NPC
 from .station_dialogue import StationDialogueHandler
-from .quests import QuestSystem
 from .npc_interaction import NPCInteraction
 from .integration import add_dialogue_to_station
 
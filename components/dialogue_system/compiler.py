@@ -0,0 +1,159 @@
+import json
+import os
+import pickle
+
+# Bump when the compiled format changes so stale disk caches are ignored
+COMPILER_VERSION = 1
+
+# next_node value for options that end the conversation
+END_NODE = -1
+
+class CompiledNode:
+    """A dialogue node with its options resolved and pre-split."""
+    def __init__(self, node_id, name, npc_text="..."):
+        self.id = node_id
+        self.name = name
+        self.npc_text = npc_text
+        
+        # Indexed like the JSON options: (next node id, triggers as (flag, value) tuples)
+        self.options = []
+        
+        # Display dicts for options without conditions, and
+        # (display dict, condition as (flag, value) tuples) for the rest
+        self.static_options = []
+        self.conditional_options = []
+
+class CompiledDialogue:
+    """A dialogue file compiled into nodes addressed by interned int ids."""
+    def __init__(self, dialogue_id):
+        self.dialogue_id = dialogue_id
+        self.node_ids = {}
+        self.nodes = []
+    
+    def intern(self, name):
+        """Get the id for a node name, adding an empty node if it's new"""
+        node_id = self.node_ids.get(name)
+        if node_id is None:
+            node_id = len(self.nodes)
+            self.node_ids[name] = node_id
+            self.nodes.append(CompiledNode(node_id, name))
+        return node_id
+    
+    def get_node(self, name):
+        """Get a node by name, or None if the file doesn't define it"""
+        node_id = self.node_ids.get(name)
+        return self.nodes[node_id] if node_id is not None else None
+
+def compile_dialogue(dialogue_id, data):
+    """Compile parsed dialogue JSON into a CompiledDialogue"""
+    dialogue = CompiledDialogue(dialogue_id)
+    
+    for name, node_data in data.items():
+        node = dialogue.nodes[dialogue.intern(name)]
+        node.npc_text = node_data.get("npc_text", "...")
+        
+        for idx, option in enumerate(node_data.get("options", [])):
+            next_node = option.get("next_node")
+            if next_node == "end":
+                next_id = END_NODE
+            elif next_node is None:
+                next_id = None
+            else:
+                next_id = dialogue.intern(next_node)
+            
+            node.options.append((next_id, tuple(option.get("triggers", {}).items())))
+            
+            # Option as shown to the player, with index for selection
+            display = {key: value for key, value in option.items() if key != "condition"}
+            display["index"] = idx
+            
+            condition = option.get("condition")
+            if condition:
+                node.conditional_options.append((display, tuple(condition.items())))
+            else:
+                node.static_options.append(display)
+    
+    return dialogue
+
+class DialogueCompiler:
+    """Compiles dialogue files once and serves them from memory
+    
+    Each file is recompiled only when its modification time changes, so
+    starting a conversation costs a stat() instead of reading and parsing
+    JSON. Compiled dialogues are also pickled to cache_dir so the next run
+    can skip parsing too.
+    """
+    def __init__(self, dialogue_dir="dialogue", cache_dir=None):
+        self.dialogue_dir = dialogue_dir
+        self.cache_dir = cache_dir if cache_dir is not None else os.path.join(dialogue_dir, ".compiled")
+        
+        # dialogue id -> (source mtime_ns, CompiledDialogue)
+        self.compiled = {}
+        
+        # Stats
+        self.hits = 0
+        self.compiles = 0
+        self.disk_loads = 0
+    
+    def get_path(self, dialogue_id):
+        """Get the source JSON path of a dialogue"""
+        return os.path.join(self.dialogue_dir, f"{dialogue_id}.json")
+    
+    def get(self, dialogue_id):
+        """Get a compiled dialogue, or None if its file doesn't exist"""
+        try:
+            mtime = os.stat(self.get_path(dialogue_id)).st_mtime_ns
+        except OSError:
+            self.compiled.pop(dialogue_id, None)
+            return None
+        
+        entry = self.compiled.get(dialogue_id)
+        if entry and entry[0] == mtime:
+            self.hits += 1
+            return entry[1]
+        
+        dialogue = self._load_cached(dialogue_id, mtime)
+        if dialogue:
+            self.disk_loads += 1
+        else:
+            with open(self.get_path(dialogue_id), 'r') as f:
+                dialogue = compile_dialogue(dialogue_id, json.load(f))
+            self.compiles += 1
+            self._store_cached(dialogue_id, mtime, dialogue)
+        
+        self.compiled[dialogue_id] = (mtime, dialogue)
+        return dialogue
+    
+    def clear(self):
+        """Drop all compiled dialogues from memory"""
+        self.compiled.clear()
+    
+    def _get_cache_path(self, dialogue_id):
+        return os.path.join(self.cache_dir, f"{dialogue_id}.pickle")
+    
+    def _load_cached(self, dialogue_id, mtime):
+        """Load a compiled dialogue from disk if it matches the source file"""
+        try:
+            with open(self._get_cache_path(dialogue_id), 'rb') as f:
+                version, cached_mtime, dialogue = pickle.load(f)
+        except Exception:
+            # The cache is disposable: a stale or corrupt file is just recompiled
+            return None
+        
+        if version != COMPILER_VERSION or cached_mtime != mtime:
+            return None
+        return dialogue
+    
+    def _store_cached(self, dialogue_id, mtime, dialogue):
+        """Write a compiled dialogue to disk (failures only cost startup time)"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = self._get_cache_path(dialogue_id) + ".tmp"
+            with open(temp_path, 'wb') as f:
+                pickle.dump((COMPILER_VERSION, mtime, dialogue), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._get_cache_path(dialogue_id))
+        except OSError as e:
+            print(f"Error caching compiled dialogue: {e}")
+
+# Shared compiler used by every DialogueSystem
+dialogue_compiler = DialogueCompiler()
\ No newline at end of file
@@ -0,0 +1,68 @@
+class ConditionEvaluator:
+    """Evaluates dialogue option conditions and memoizes the options shown per node.
+    
+    While filtering a node's options it records which flags the conditions
+    actually read. The cached list for that node is dropped only when
+    FlagSystem reports a change to one of them. Conditions on quest
+    progress read flags the quest engine keeps up to date, such as
+    has_enough_ore.
+    """
+    def __init__(self, flags_system):
+        self.flags = flags_system
+        
+        # Compiled node -> available options
+        self.cache = {}
+        
+        # Flag name -> nodes whose cached options read it
+        self.flag_readers = {}
+        
+        # Stats
+        self.hits = 0
+        self.misses = 0
+        
+        self.flags.add_listener(self.on_flag_changed)
+    
+    def get_available_options(self, node):
+        """Get the options of a compiled node whose conditions are met."""
+        options = self.cache.get(node)
+        if options is None:
+            self.misses += 1
+            options = self.filter_options(node)
+            self.cache[node] = options
+        else:
+            self.hits += 1
+        return list(options)
+    
+    def filter_options(self, node):
+        """Evaluate a node's conditional options, recording what they read."""
+        available_options = list(node.static_options)
+        for option, condition in node.conditional_options:
+            if self.check(condition, node):
+                available_options.append(option)
+        
+        # Keep the original option order
+        available_options.sort(key=lambda option: option["index"])
+        return available_options
+    
+    def check(self, condition, node=None):
+        """Check a compiled condition: a tuple of (flag name, required value)."""
+        for flag_name, required_value in condition:
+            if node is not None:
+                self.flag_readers.setdefault(flag_name, set()).add(node)
+            if self.flags.get_flag(flag_name) != required_value:
+                return False
+        return True
+    
+    def on_flag_changed(self, flag_name):
+        """Drop cached options that read a flag (or all, if it's unknown)."""
+        if flag_name is None:
+            self.clear()
+            return
+        
+        for node in self.flag_readers.pop(flag_name, ()):
+            self.cache.pop(node, None)
+    
+    def clear(self):
+        """Drop every cached option list."""
+        self.cache.clear()
+        self.flag_readers.clear()
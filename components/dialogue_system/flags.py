@@ -1,12 +1,51 @@
 import json
 import os
+import time
+import atexit
+import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+# Live flag systems, held weakly so the exit hook doesn't keep them alive
+_flag_systems = weakref.WeakSet()
+
+def _close_flag_systems():
+    """Write pending changes of every flag system still alive at exit"""
+    for flag_system in list(_flag_systems):
+        flag_system.close()
+
+atexit.register(_close_flag_systems)
 
 class FlagSystem:
-    """Simple flag system to track game state."""
-    def __init__(self, flags_file="flags/game_flags.json"):
+    """Simple flag system to track game state.
+    
+    Changes are written behind: setting a flag only marks the store dirty,
+    and the file is rewritten at most once per save interval (or when
+    flush() is called, e.g. on a state change) by a background thread.
+    Files are replaced atomically, so a crash mid-write never leaves a
+    truncated flags file.
+    """
+    def __init__(self, flags_file="flags/game_flags.json", save_interval=2.0):
         self.flags_file = flags_file
         self.flags = {}
+        
+        # Write-behind state
+        self.save_interval = save_interval
+        self.dirty = False
+        self.dirty_since = 0.0
+        self.writer = None
+        
+        # Weak references to bound methods called as listener(flag_name) on change
+        self.listeners = []
+        
+        # Stats
+        self.save_requests = 0  # Changes that used to write the file
+        self.writes = 0  # Snapshots handed to the writer
+        
         self.load_flags()
+        
+        # Don't lose pending changes on exit
+        _flag_systems.add(self)
     
     def load_flags(self):
         """Load flags from file."""
@@ -19,14 +58,90 @@ class FlagSystem:
             print(f"Error loading flags: {e}")
             # Continue with empty flags if file can't be loaded
     
+    def add_listener(self, callback):
+        """Call a bound method with the flag name whenever a flag changes.
+        
+        The name is None when flags were changed directly and any of them
+        may differ. Listeners are held weakly, so they don't keep their
+        owner alive.
+        """
+        self.listeners.append(weakref.WeakMethod(callback))
+    
+    def notify(self, flag_name=None):
+        """Tell listeners a flag changed, dropping listeners that are gone."""
+        alive = []
+        for listener in self.listeners:
+            callback = listener()
+            if callback:
+                callback(flag_name)
+                alive.append(listener)
+        self.listeners = alive
+    
     def save_flags(self):
-        """Save flags to file."""
+        """Mark flags as changed; they are written on the next flush."""
+        self.notify()
+        self.mark_dirty()
+    
+    def mark_dirty(self):
+        """Schedule a write without notifying listeners."""
+        self.save_requests += 1
+        if not self.dirty:
+            self.dirty = True
+            self.dirty_since = time.monotonic()
+    
+    def update(self):
+        """Flush if changes have been pending for longer than the save interval."""
+        if self.dirty and time.monotonic() - self.dirty_since >= self.save_interval:
+            self.flush()
+    
+    def flush(self):
+        """Write pending changes on the background writer thread."""
+        if not self.dirty:
+            return
+        
+        if not self.writer:
+            self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="flag-writer")
+        self.writer.submit(self._write, self._snapshot())
+    
+    def close(self):
+        """Wait for the writer, then write any pending changes on this thread."""
+        if self.writer:
+            self.writer.shutdown(wait=True)
+            self.writer = None
+        
+        # The writer can't take new work once the interpreter is exiting
+        if self.dirty:
+            self._write(self._snapshot())
+    
+    def _snapshot(self):
+        """Serialize the flags and mark them clean."""
+        # Serialized on the calling thread so later changes can't tear the write
+        data = json.dumps(self.flags, indent=4)
+        self.dirty = False
+        self.writes += 1
+        return data
+    
+    def get_writes_avoided(self):
+        """Get how many file writes coalescing has saved."""
+        return self.save_requests - self.writes
+    
+    def _write(self, data):
+        """Atomically replace the flags file (runs on the writer thread)."""
         try:
             # Ensure directory exists
-            os.makedirs(os.path.dirname(self.flags_file), exist_ok=True)
-            with open(self.flags_file, 'w') as f:
-                json.dump(self.flags, f, indent=4)
-        except Exception as e:
+            directory = os.path.dirname(self.flags_file) or "."
+            os.makedirs(directory, exist_ok=True)
+            
+            # Write a temporary file next to the real one, then swap it in
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(data)
+                os.replace(temp_path, self.flags_file)
+            except OSError:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
             print(f"Error saving flags: {e}")
     
     def get_flag(self, flag_name, default=0):
@@ -34,12 +149,15 @@ class FlagSystem:
         return self.flags.get(flag_name, default)
     
     def set_flag(self, flag_name, value):
-        """Set flag value and save immediately."""
-        self.flags[flag_name] = value
-        self.save_flags()
+        """Set flag value and schedule a save."""
+        if flag_name not in self.flags or self.flags[flag_name] != value:
+            self.flags[flag_name] = value
+            self.notify(flag_name)
+        self.mark_dirty()
     
     def increment_flag(self, flag_name, amount=1):
         """Increment a numeric flag."""
         current_value = self.get_flag(flag_name, 0)
         self.flags[flag_name] = current_value + amount
-        self.save_flags()
\ No newline at end of file
+        self.notify(flag_name)
+        self.mark_dirty()
\ No newline at end of file
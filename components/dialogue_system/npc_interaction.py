@@ -1,11 +1,9 @@
 from .npc import NPC
 from .flags import FlagSystem
-from .quests import QuestSystem
 
 class NPCInteraction:
     def __init__(self):
         self.flags = FlagSystem()
-        self.quest_system = QuestSystem(flags_system=self.flags)
         self.current_npc = None
     
     def interact_with_npc(self, npc_name, dialogue_id):
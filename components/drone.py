@@ -1,10 +1,29 @@
 import pygame
 import math
+import random
 from game_config import *
-from components.weapon import create_weapon, LASER_BASIC
+from components.module import WEAPON_BASIC_LASER
+from components.rotation_cache import rotation_cache
+from components.asset_registry import asset_registry
+
+def draw_drone_fallback(drone_type, width, height):
+    """Draw a triangle colored by drone type for drones without an image"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    if drone_type == "scout":
+        color = BLUE
+    elif drone_type == "fighter":
+        color = RED
+    elif drone_type == "miner":
+        color = GREEN
+    else:
+        color = YELLOW
+        
+    # Draw a simple triangle shape
+    pygame.draw.polygon(surface, color, [(width // 2, 0), (0, height), (width, height)])
+    return surface
 
 class DroneStats:
-    def __init__(self, speed=3.0, agility=2.0, shield=30, max_shield=30, hull=50, max_hull=50, weapon=LASER_BASIC, energy=50, max_energy=50, energy_regen=0.5):
+    def __init__(self, speed=3.0, agility=2.0, shield=30, max_shield=30, hull=50, max_hull=50, weapon=WEAPON_BASIC_LASER, energy=50, max_energy=50, energy_regen=0.5):
         self.speed = speed
         self.agility = agility
         self.shield = shield
@@ -33,27 +52,11 @@ class Drone(pygame.sprite.Sprite):
             # Default stats
             self.stats = DroneStats()
         
-        # Try to load drone image or use a default shape
-        try:
-            self.original_image = pygame.image.load(f"assets/drone_{drone_type}.png").convert_alpha()
-            # Scale to appropriate size (assume 320x320 source image)
-            scale_factor = 20 / 320  # Drones are smaller than the player
-            new_size = int(320 * scale_factor)
-            self.original_image = pygame.transform.scale(self.original_image, (new_size, new_size))
-        except:
-            # Create simple drone shape
-            self.original_image = pygame.Surface((20, 20), pygame.SRCALPHA)
-            if drone_type == "scout":
-                color = BLUE
-            elif drone_type == "fighter":
-                color = RED
-            elif drone_type == "miner":
-                color = GREEN
-            else:
-                color = YELLOW
-                
-            # Draw a simple triangle shape
-            pygame.draw.polygon(self.original_image, color, [(10, 0), (0, 20), (20, 20)])
+        # Shared drone image, or a simple shape if the image is missing
+        self.original_image = asset_registry.get_image(
+            f"drone_{drone_type}.png", 20,
+            lambda width, height: draw_drone_fallback(drone_type, width, height)
+        )
         
         self.image = self.original_image
         
@@ -87,6 +90,9 @@ class Drone(pygame.sprite.Sprite):
         if game_state != 0:  # GAME_RUNNING = 0
             return
         
+        # Remember last tick's position for render interpolation
+        self.previous_center = self.rect.center
+        
         # Energy regeneration
         current_time = pygame.time.get_ticks()
         if current_time - self.last_energy_regen > 1000:  # Every second
@@ -121,7 +127,7 @@ class Drone(pygame.sprite.Sprite):
             self.angle = math.degrees(math.atan2(-self.direction.x, -self.direction.y))
         
         # Update image and rectangle
-        self.image = pygame.transform.rotate(self.original_image, self.angle)
+        self.image = rotation_cache.get(self.original_image, self.angle)
         self.rect = self.image.get_rect(center=self.position)
     
     def follow_owner(self):
@@ -189,7 +195,7 @@ class Drone(pygame.sprite.Sprite):
             
             # Try to shoot
             current_time = pygame.time.get_ticks()
-            if current_time - self.last_shot_time > self.stats.weapon.cooldown:
+            if current_time - self.last_shot_time > self.stats.weapon.stats.get("cooldown", 300):
                 # Would shoot here in the future
                 self.last_shot_time = current_time
     
@@ -0,0 +1,115 @@
+from collections import deque
+
+class Event:
+    """Base class for gameplay events; subscribing to it receives every event"""
+    __slots__ = ()
+
+class OreCollected(Event):
+    """Ore was added to the player's inventory"""
+    __slots__ = ("item", "count")
+    
+    def __init__(self, item, count=1):
+        self.item = item
+        self.count = count
+
+class AsteroidDestroyed(Event):
+    """An asteroid was shot apart"""
+    __slots__ = ("asteroid_type", "position", "area_id")
+    
+    def __init__(self, asteroid_type, position, area_id=None):
+        self.asteroid_type = asteroid_type
+        self.position = position
+        self.area_id = area_id
+
+class AreaChanged(Event):
+    """The player arrived in a new area"""
+    __slots__ = ("area_id", "previous_area_id", "direction")
+    
+    def __init__(self, area_id, previous_area_id=None, direction=None):
+        self.area_id = area_id
+        self.previous_area_id = previous_area_id
+        self.direction = direction
+
+class FlagChanged(Event):
+    """A game flag changed (flag_name is None when any flag may have)"""
+    __slots__ = ("flag_name", "value")
+    
+    def __init__(self, flag_name, value=None):
+        self.flag_name = flag_name
+        self.value = value
+
+class ItemSold(Event):
+    """The player sold items to a merchant"""
+    __slots__ = ("item", "count", "silver")
+    
+    def __init__(self, item, count, silver):
+        self.item = item
+        self.count = count
+        self.silver = silver
+
+class EventBus:
+    """Synchronous publish/subscribe for gameplay events
+    
+    Subscribers are called with the event as soon as it's published. An
+    event published by a subscriber is queued and delivered after the
+    current event has reached all of its subscribers, so handlers never
+    re-enter each other and events arrive in publish order.
+    
+    Subscribing to a class also receives its subclasses' events. The
+    subscriber list for each concrete event type is resolved once and
+    reused until the subscriptions change.
+    """
+    def __init__(self):
+        # Event class -> callbacks subscribed to exactly that class
+        self.subscribers = {}
+        
+        # Concrete event type -> tuple of callbacks including base classes
+        self.resolved = {}
+        
+        # Events published while dispatching
+        self.queue = deque()
+        self.dispatching = False
+        
+        # Stats
+        self.published = 0
+    
+    def subscribe(self, event_type, callback):
+        """Call callback(event) for every event of event_type or a subclass"""
+        self.subscribers.setdefault(event_type, []).append(callback)
+        self.resolved.clear()
+    
+    def unsubscribe(self, event_type, callback):
+        """Stop calling a subscribed callback"""
+        callbacks = self.subscribers.get(event_type)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            self.resolved.clear()
+    
+    def get_subscribers(self, event_type):
+        """Get every callback for an event type, resolving it on first use"""
+        callbacks = self.resolved.get(event_type)
+        if callbacks is None:
+            callbacks = tuple(callback for base in event_type.__mro__
+                              for callback in self.subscribers.get(base, ()))
+            self.resolved[event_type] = callbacks
+        return callbacks
+    
+    def publish(self, event):
+        """Deliver an event, or queue it if another is being delivered"""
+        self.published += 1
+        self.queue.append(event)
+        if self.dispatching:
+            return
+        
+        self.dispatching = True
+        try:
+            while self.queue:
+                event = self.queue.popleft()
+                for callback in self.get_subscribers(type(event)):
+                    callback(event)
+        except BaseException:
+            # Don't deliver the rest late, out of order with later publishes
+            self.queue.clear()
+            raise
+        finally:
+            self.dispatching = False
\ No newline at end of file
@@ -0,0 +1,301 @@
+import heapq
+import weakref
+from game_config import *
+
+class Inventory:
+    """Grid of item stacks with indexes for fast counts and first-fit inserts
+    
+    The grid is a list of rows of {"item", "count"} slot dicts, and can be
+    indexed and iterated like one. Slots must only be changed through
+    add() and remove() (or the all-or-nothing add_many(), remove_many()
+    and exchange()), which keep per-item totals, a per-item index of
+    stacks with room left, and a heap of empty slots up to date.
+    """
+    def __init__(self, rows=INVENTORY_ROWS, cols=INVENTORY_COLS):
+        self.rows = rows
+        self.cols = cols
+        self.capacity = rows * cols
+        
+        self.grid = [[{"item": None, "count": 0} for _ in range(cols)] for _ in range(rows)]
+        
+        # Slot dicts in row-major order; slot index = row * cols + col
+        self.slots = [slot for row in self.grid for slot in row]
+        
+        # Item name -> total count, first item object seen, and slot indexes
+        self.totals = {}
+        self.items = {}
+        self.item_slots = {}
+        
+        # Item name -> indexes of stacks that aren't full
+        self.partial_slots = {}
+        
+        # Empty slot indexes, lowest first. Rolled back transactions can
+        # leave stale indexes of filled slots, which are skipped when popped
+        self.free_slots = list(range(self.capacity))
+        self.free_count = self.capacity
+        
+        # (index, item, count) of each slot changed by the running
+        # transaction, or None outside one
+        self.journal = None
+        
+        # Bumped on every change; listeners are weak bound methods called
+        # with the set of item names that changed
+        self.version = 0
+        self.listeners = []
+    
+    def __getitem__(self, row):
+        return self.grid[row]
+    
+    def __iter__(self):
+        return iter(self.grid)
+    
+    def __len__(self):
+        return self.rows
+    
+    def count(self, item_name):
+        """Count how many of an item are held"""
+        return self.totals.get(item_name, 0)
+    
+    def used_slots(self):
+        """Count slots holding an item"""
+        return self.capacity - self.free_count
+    
+    def get_items(self):
+        """Get one item object per kind held, in the order they were first added"""
+        return list(self.items.values())
+    
+    def get_room(self, item):
+        """Count how many more of an item would fit"""
+        room = self.free_count * item.max_stack
+        for index in self.partial_slots.get(item.name, ()):
+            room += item.max_stack - self.slots[index]["count"]
+        return room
+    
+    def add(self, item, count=1):
+        """Add items first-fit: top up existing stacks, then fill empty slots
+        
+        Returns:
+            int: How many were added (less than count if the inventory filled up)
+        """
+        added = self._add(item, count)
+        if added:
+            self.notify({item.name})
+        return added
+    
+    def remove(self, item_name, count=1):
+        """Remove items, taking from the lowest slots first
+        
+        Returns:
+            int: How many were removed (less than count if there weren't enough)
+        """
+        removed = self._remove(item_name, count)
+        if removed:
+            self.notify({item_name})
+        return removed
+    
+    def add_many(self, item, count):
+        """Add count of an item, or nothing if they don't all fit
+        
+        Returns:
+            bool: Whether the items were added
+        """
+        if self.get_room(item) < count:
+            return False
+        self.add(item, count)
+        return True
+    
+    def remove_many(self, item_name, count):
+        """Remove count of an item, or nothing if there aren't that many
+        
+        Returns:
+            bool: Whether the items were removed
+        """
+        if self.count(item_name) < count:
+            return False
+        self.remove(item_name, count)
+        return True
+    
+    def exchange(self, inputs, outputs):
+        """Swap items for others, or change nothing if the swap can't complete
+        
+        Inputs are removed before outputs are added, so slots they free can
+        hold the outputs.
+        
+        Args:
+            inputs: (item name, count) pairs to remove
+            outputs: (item, count) pairs to add
+        
+        Returns:
+            bool: Whether the exchange happened
+        """
+        for item_name, count in inputs:
+            if self.count(item_name) < count:
+                return False
+        
+        self.journal = []
+        try:
+            for item_name, count in inputs:
+                self._remove(item_name, count)
+            for item, count in outputs:
+                if self._add(item, count) < count:
+                    self._rollback()
+                    return False
+        except Exception:
+            self._rollback()
+            raise
+        finally:
+            self.journal = None
+        
+        names = {item_name for item_name, count in inputs}
+        names.update(item.name for item, count in outputs)
+        if names:
+            self.notify(names)
+        return True
+    
+    def _add(self, item, count):
+        """Add items without notifying listeners"""
+        remaining = count
+        partial = self.partial_slots.get(item.name)
+        
+        # Top up the lowest stacks with room first
+        while remaining > 0 and partial:
+            index = min(partial)
+            slot = self.slots[index]
+            added = min(remaining, item.max_stack - slot["count"])
+            self._set_slot(index, slot["item"], slot["count"] + added)
+            remaining -= added
+            partial = self.partial_slots.get(item.name)
+        
+        # Start new stacks in the lowest empty slots
+        while remaining > 0 and self.free_count:
+            index = heapq.heappop(self.free_slots)
+            if self.slots[index]["item"]:
+                continue  # Stale index
+            added = min(remaining, item.max_stack)
+            self._set_slot(index, item, added)
+            remaining -= added
+        
+        return count - remaining
+    
+    def _remove(self, item_name, count):
+        """Remove items without notifying listeners"""
+        remaining = count
+        slot_indexes = self.item_slots.get(item_name)
+        while remaining > 0 and slot_indexes:
+            index = min(slot_indexes)
+            slot = self.slots[index]
+            removed = min(remaining, slot["count"])
+            self._set_slot(index, slot["item"], slot["count"] - removed)
+            remaining -= removed
+            slot_indexes = self.item_slots.get(item_name)
+        
+        return count - remaining
+    
+    def _rollback(self):
+        """Restore every slot changed by the running transaction"""
+        journal = self.journal
+        self.journal = None
+        for index, item, count in reversed(journal):
+            self._set_slot(index, item, count)
+    
+    def clear(self):
+        """Empty every slot"""
+        names = set(self.totals)
+        for index, slot in enumerate(self.slots):
+            if slot["item"]:
+                self._set_slot(index, None, 0)
+        if names:
+            self.notify(names)
+    
+    def get_slot_data(self):
+        """Get [item name, count] for each slot in order, or None for empty slots"""
+        return [[slot["item"].name, slot["count"]] if slot["item"] else None for slot in self.slots]
+    
+    def load_slot_data(self, slot_data, items):
+        """Replace the contents with get_slot_data() output
+        
+        Args:
+            slot_data: Output of get_slot_data()
+            items: Item name -> item object (unknown names are dropped)
+        """
+        names = set(self.totals)
+        for index, slot in enumerate(self.slots):
+            if slot["item"]:
+                self._set_slot(index, None, 0)
+        
+        for index, data in enumerate(slot_data[:self.capacity]):
+            if not data:
+                continue
+            item = items.get(data[0])
+            if not item:
+                print(f"Unknown item '{data[0]}' in saved inventory")
+                continue
+            self._set_slot(index, item, min(data[1], item.max_stack))
+        
+        # Drop stale empty-slot entries rather than carrying them forward
+        self.free_slots = [index for index, slot in enumerate(self.slots) if not slot["item"]]
+        
+        names.update(self.totals)
+        if names:
+            self.notify(names)
+    
+    def add_listener(self, callback):
+        """Call a bound method with the changed item names on every change"""
+        self.listeners.append(weakref.WeakMethod(callback))
+    
+    def notify(self, item_names):
+        """Record a change and tell listeners which items changed"""
+        self.version += 1
+        
+        alive = []
+        for listener in self.listeners:
+            callback = listener()
+            if callback:
+                callback(item_names)
+                alive.append(listener)
+        self.listeners = alive
+    
+    def _set_slot(self, index, item, count):
+        """Change one slot and keep the indexes in sync"""
+        slot = self.slots[index]
+        if self.journal is not None:
+            self.journal.append((index, slot["item"], slot["count"]))
+        
+        # Take the old stack out of the indexes
+        old_item = slot["item"]
+        if old_item:
+            name = old_item.name
+            self.totals[name] -= slot["count"]
+            
+            partial = self.partial_slots.get(name)
+            if partial is not None:
+                partial.discard(index)
+                if not partial:
+                    del self.partial_slots[name]
+            
+            self.item_slots[name].discard(index)
+        
+        if count <= 0:
+            item = None
+            count = 0
+        
+        slot["item"] = item
+        slot["count"] = count
+        
+        if item:
+            name = item.name
+            self.totals[name] = self.totals.get(name, 0) + count
+            self.items.setdefault(name, item)
+            self.item_slots.setdefault(name, set()).add(index)
+            if count < item.max_stack:
+                self.partial_slots.setdefault(name, set()).add(index)
+            if not old_item:
+                self.free_count -= 1
+        elif old_item:
+            heapq.heappush(self.free_slots, index)
+            self.free_count += 1
+        
+        # Forget items that are no longer held anywhere
+        if old_item and not self.item_slots[old_item.name]:
+            name = old_item.name
+            del self.totals[name], self.items[name], self.item_slots[name]
\ No newline at end of file
@@ -129,4 +129,15 @@ MERCHANT_ITEMS = [
     MINING_LASER_UPGRADE,
     SHIELD_BOOSTER,
     CARGO_EXPANDER
-]
\ No newline at end of file
+]
+
+# Every item by name, for loading saved inventories
+ITEMS = {item.name: item for item in [
+    LOW_GRADE_ORE,
+    HIGH_GRADE_ORE,
+    RARE_ORE,
+    RAW_SILVER,
+    BASIC_METAL,
+    ALLOY,
+    ELECTRONICS
+] + MERCHANT_ITEMS}
\ No newline at end of file
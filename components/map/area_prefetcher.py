@@ -0,0 +1,165 @@
+import pygame
+from concurrent.futures import ThreadPoolExecutor
+from game_config import *
+from components.spatial_hash import SpatialHash
+from components.asteroid_field import AsteroidField
+from components.asset_registry import asset_registry
+
+class PreparedArea:
+    """An area's asteroids built into their own group, grid and field, ready to swap in"""
+    def __init__(self, area_id, cell_size):
+        self.area_id = area_id
+        self.area_data = None  # Parsed map data
+        self.from_saved_state = False  # Rebuilt from a visited area's AreaState
+        self.seed_count = None  # Asteroids made by the sector generator, if it made them
+        
+        self.asteroids = pygame.sprite.Group()
+        self.asteroid_grid = SpatialHash(cell_size=cell_size)
+        self.asteroid_field = AsteroidField(self.asteroid_grid)
+        
+        # Object data still to build (None until it's parsed), and station
+        # data (stations are few and spawned on swap)
+        self.pending = None
+        self.stations = []
+
+class AreaPrefetcher:
+    """Prepares the area a jump leads to before the player takes it
+    
+    The map file, or a visited area's snapshot, is read and unpacked on a
+    worker thread. The sprites can't be built there (pygame surfaces and
+    the asset cache belong to the main thread), so once the data arrives
+    the area's images are warmed and its asteroids are built into a
+    separate group, grid and field a batch per tick. change_area then swaps the prepared objects in instead of
+    spawning them all at once.
+    """
+    def __init__(self, map_system, batch_size=PREFETCH_BATCH):
+        self.map_system = map_system
+        self.batch_size = batch_size
+        self.worker = None
+        
+        # Area being prepared, and the pending read of its map file or snapshot
+        self.prepared = None
+        self.future = None
+        
+        # Stats
+        self.requests = 0
+        self.swaps = 0
+        self.misses = 0
+    
+    def prefetch(self, area_id):
+        """Start (or keep) preparing an area and build the next batch of it"""
+        if not self.prepared or self.prepared.area_id != area_id:
+            self.start(area_id)
+        self.step()
+    
+    def start(self, area_id):
+        """Drop any other prepared area and begin preparing this one"""
+        self.cancel()
+        self.requests += 1
+        
+        map_system = self.map_system
+        self.prepared = PreparedArea(area_id, map_system.spawn_manager.asteroid_grid.cell_size)
+        
+        if not self.worker:
+            self.worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="area-prefetch")
+        
+        # Visited areas are rebuilt from their saved state instead of the map file
+        area_state = map_system.area_states.get(area_id)
+        if area_state and area_state.has_saved_state():
+            self.prepared.from_saved_state = True
+            self.future = self.worker.submit(area_state.read_spawn_data)
+        else:
+            self.future = self.worker.submit(map_system.map_loader.read_area, area_id)
+    
+    def step(self, limit=None):
+        """Build up to limit (default: one batch) of the prepared area's asteroids"""
+        prepared = self.prepared
+        if not prepared:
+            return
+        
+        # Wait for the read to finish on a later tick
+        if prepared.pending is None:
+            if not self.future.done():
+                return
+            self.finish_read()
+        
+        spawn_manager = self.map_system.spawn_manager
+        pending = prepared.pending
+        for _ in range(min(len(pending), limit or self.batch_size)):
+            asteroid = spawn_manager.create_asteroid(pending.pop())
+            prepared.asteroids.add(asteroid)
+            prepared.asteroid_field.add(asteroid)
+    
+    def finish_read(self):
+        """Hand the worker's map data or saved objects to the prepared area"""
+        prepared = self.prepared
+        future = self.future
+        self.future = None
+        if not prepared.from_saved_state:
+            self.receive(future.result())
+            return
+        
+        try:
+            asteroids, prepared.stations = future.result()
+        except (OSError, ValueError):
+            # Leave it to change_area's own load to report and recover
+            prepared.from_saved_state = False
+            prepared.pending = []
+            return
+        
+        # Built by popping from the end, so reverse to keep saved order
+        asteroids.reverse()
+        prepared.pending = asteroids
+    
+    def receive(self, area_data):
+        """Split parsed map data into asteroids to build and stations to spawn"""
+        prepared = self.prepared
+        prepared.area_data = area_data
+        prepared.pending = []
+        if not area_data:
+            return
+        
+        self.map_system.map_loader.cache_area(prepared.area_id, area_data)
+        asset_registry.preload(area_data)
+        
+        objects = area_data.get("objects")
+        if not objects and area_data["type"] == "asteroid_field":
+            objects = self.map_system.generator.generate(prepared.area_id)
+            prepared.seed_count = len(objects)
+        
+        for obj in objects or []:
+            if obj["type"] == "asteroid":
+                prepared.pending.append(obj)
+            elif obj["type"] == "station":
+                prepared.stations.append(obj)
+        
+        # Built by popping from the end, so reverse to keep file order
+        prepared.pending.reverse()
+    
+    def take(self, area_id):
+        """Get the prepared area for area_id, finishing it now if needed
+        
+        Returns None if a different area (or nothing) was being prepared,
+        or if its map file couldn't be read.
+        """
+        prepared = self.prepared
+        if not prepared or prepared.area_id != area_id:
+            self.misses += 1
+            return None
+        
+        if prepared.pending is None:
+            self.finish_read()
+        self.step(len(prepared.pending))
+        
+        self.prepared = None
+        if prepared.area_data is None and not prepared.from_saved_state:
+            return None
+        self.swaps += 1
+        return prepared
+    
+    def cancel(self):
+        """Forget the area being prepared"""
+        if self.future:
+            self.future.cancel()
+        self.future = None
+        self.prepared = None
\ No newline at end of file
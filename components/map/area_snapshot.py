@@ -0,0 +1,173 @@
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+# Bump when the binary layout changes; older snapshots are rejected
+SNAPSHOT_VERSION = 2
+SNAPSHOT_MAGIC = b"SDAS"
+
+# Magic, version, asteroid count, then byte lengths of the type table and station blob
+HEADER = struct.Struct("<4sHIII")
+
+# Asteroid columns in file order, with their array typecodes (position and
+# drift are doubles so restored asteroids continue exactly where they were)
+COLUMNS = (
+    ("x", "d"),
+    ("y", "d"),
+    ("dx", "d"),
+    ("dy", "d"),
+    ("speed", "d"),
+    ("health", "h"),
+    ("size", "H"),
+    ("angle", "H"),
+    ("variant", "B"),
+    ("type_code", "B"),
+)
+
+class AreaSnapshot:
+    """An unloaded area's objects packed into typed arrays
+
+    Each asteroid is one entry in parallel arrays of position, heading,
+    speed, health, size, angle, image variant and a type code into a small
+    table of asteroid type names (about 48 bytes per asteroid instead of a
+    tuple of boxed values). Stations are few and kept as tuples.
+
+    to_bytes() writes a versioned little-endian layout: the header, the
+    type table and stations as JSON, then each column's raw bytes. read()
+    memory-maps a file and copies each column out with one frombytes call.
+    """
+    def __init__(self):
+        for name, typecode in COLUMNS:
+            setattr(self, name, array(typecode))
+
+        # Asteroid type names indexed by type_code
+        self.types = []
+        self.type_codes = {}
+
+        # (x, y, name, dialog) per station
+        self.stations = []
+
+    def __len__(self):
+        return len(self.x)
+
+    def capture(self, asteroid_field, stations):
+        """Pack the asteroids moved by a field and a group of stations"""
+        asteroid_field.sync_all()
+        for asteroid in asteroid_field.sprites:
+            self.x.append(asteroid.position.x)
+            self.y.append(asteroid.position.y)
+            self.dx.append(asteroid.velocity.x)
+            self.dy.append(asteroid.velocity.y)
+            self.speed.append(asteroid.speed)
+            self.health.append(asteroid.health)
+            self.size.append(asteroid.size)
+            self.angle.append(asteroid.angle)
+            self.variant.append(asteroid.variant)
+            self.type_code.append(self.get_type_code(asteroid.asteroid_type))
+
+        for station in stations:
+            self.stations.append((station.position.x, station.position.y, station.name, station.dialog))
+
+    def get_type_code(self, asteroid_type):
+        """Get the code for an asteroid type, adding it to the table if it's new"""
+        code = self.type_codes.get(asteroid_type)
+        if code is None:
+            code = len(self.types)
+            self.types.append(asteroid_type)
+            self.type_codes[asteroid_type] = code
+        return code
+
+    def get_spawn_data(self):
+        """Get object data to rebuild the area: (asteroids, stations)"""
+        types = self.types
+        asteroids = []
+        for x, y, dx, dy, speed, health, size, angle, variant, type_code in zip(
+                self.x, self.y, self.dx, self.dy, self.speed, self.health,
+                self.size, self.angle, self.variant, self.type_code):
+            asteroids.append({
+                "type": "asteroid",
+                "x": x,
+                "y": y,
+                "asteroid_type": types[type_code],
+                "health": health,
+                "velocity": (dx, dy),
+                "speed": speed,
+                "size": size,
+                "variant": variant,
+                "angle": angle
+            })
+
+        stations = []
+        for x, y, name, dialog in self.stations:
+            stations.append({
+                "type": "station",
+                "x": x,
+                "y": y,
+                "name": name,
+                "dialog": dialog
+            })
+
+        return asteroids, stations
+
+    def get_memory_size(self):
+        """Get the bytes held by the asteroid columns"""
+        return sum(len(column) * column.itemsize for column in self.get_columns())
+
+    def get_columns(self):
+        """Get the asteroid columns in file order"""
+        return [getattr(self, name) for name, _ in COLUMNS]
+
+    def to_bytes(self):
+        """Encode the snapshot in the versioned binary layout"""
+        types = json.dumps(self.types).encode("utf-8")
+        stations = json.dumps(self.stations).encode("utf-8")
+        parts = [HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(self), len(types), len(stations)),
+                 types, stations]
+
+        for column in self.get_columns():
+            if sys.byteorder == "big":
+                column = array(column.typecode, column)
+                column.byteswap()
+            parts.append(column.tobytes())
+        return b"".join(parts)
+
+    def from_bytes(self, data):
+        """Replace the snapshot's contents with ones decoded from to_bytes() output"""
+        with memoryview(data) as view:
+            if len(view) < HEADER.size:
+                raise ValueError("Truncated area snapshot")
+            magic, version, count, types_size, stations_size = HEADER.unpack_from(view)
+            if magic != SNAPSHOT_MAGIC:
+                raise ValueError("Not an area snapshot")
+            if version != SNAPSHOT_VERSION:
+                raise ValueError(f"Unsupported area snapshot version {version}")
+
+            offset = HEADER.size
+            self.types = json.loads(bytes(view[offset:offset + types_size]))
+            self.type_codes = {asteroid_type: code for code, asteroid_type in enumerate(self.types)}
+            offset += types_size
+            self.stations = [tuple(station) for station in json.loads(bytes(view[offset:offset + stations_size]))]
+            offset += stations_size
+
+            for name, typecode in COLUMNS:
+                column = array(typecode)
+                end = offset + count * column.itemsize
+                if end > len(view):
+                    raise ValueError("Truncated area snapshot")
+                column.frombytes(view[offset:end])
+                if sys.byteorder == "big":
+                    column.byteswap()
+                setattr(self, name, column)
+                offset = end
+
+    def write(self, path):
+        """Write the snapshot to a file"""
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    def read(self, path):
+        """Load the snapshot from a file written by write()"""
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            self.from_bytes(mapped)
@@ -1,65 +1,190 @@
+from components.map.area_snapshot import AreaSnapshot
+
 class AreaState:
-    """Component for tracking and saving area states"""
-    def __init__(self, area_id, spawn_manager):
+    """Component for tracking and saving area states
+    
+    An area that's left is hibernated: its sprite groups, grids and field
+    are detached intact, so returning reattaches them without rebuilding a
+    single asteroid. MapSystem caps how many areas stay hibernated and
+    freezes the rest into a packed AreaSnapshot that restore() respawns
+    from.
+    
+    Nothing in an unloaded area is stepped. On return the asteroid field
+    jumps ahead by the ticks elapsed since the area was left, and overdue
+    respawns are placed where they would have drifted to by now.
+    
+    Areas made by the SectorGenerator that are still untouched (nothing
+    shot or destroyed) aren't snapshotted when frozen or saved. Only the
+    field ticks they had run are kept; MapSystem regenerates them from the
+    seed and catch_up() replays those ticks.
+    """
+    def __init__(self, area_id, spawn_manager, respawn_scheduler=None):
         self.area_id = area_id
         self.spawn_manager = spawn_manager
+        self.respawn_scheduler = respawn_scheduler
+        self.saved_state = None
+        self.saved_file = None  # Save game snapshot file, read when first needed
+        self.hibernated = None  # AreaObjects detached from the spawn manager
+        self.left_tick = None  # Simulation tick the area was saved or hibernated at
+        
+        # Seeded areas: asteroids generated (None once the area is changed),
+        # the field tick they were placed at, and for a discarded area the
+        # field ticks it had run
+        self.seed_count = None
+        self.seed_tick = 0
+        self.field_ticks = None
+    
+    def save(self, tick=0):
+        """Save the current state of the area as a snapshot"""
+        spawn_manager = self.spawn_manager
+        self.saved_state = self.snapshot(spawn_manager.asteroid_field, spawn_manager.stations)
+        self.saved_file = None
+        self.hibernated = None
+        self.seed_count = None
+        self.field_ticks = None
+        self.left_tick = tick
+    
+    def hibernate(self, tick=0):
+        """Detach the area's live objects so they can be reattached unchanged"""
+        self.hibernated = self.spawn_manager.detach()
         self.saved_state = None
+        self.saved_file = None
+        self.field_ticks = None
+        self.left_tick = tick
+    
+    def freeze(self):
+        """Replace hibernated objects with a snapshot to free their memory"""
+        if not self.hibernated:
+            return
+        
+        objects = self.hibernated
+        field_ticks = self.get_pristine_ticks(objects.asteroid_field)
+        if field_ticks is not None:
+            # Regenerated from the seed on return instead
+            self.field_ticks = field_ticks
+        else:
+            self.saved_state = self.snapshot(objects.asteroid_field, objects.stations)
+        self.hibernated = None
+        objects.asteroid_field.clear()
+    
+    def get_object_count(self):
+        """Count the asteroids held by hibernation"""
+        if self.hibernated:
+            return len(self.hibernated.asteroid_field)
+        return 0
     
-    def save(self):
-        """Save the current state of the area"""
-        self.saved_state = {
-            "asteroids": [],
-            "stations": []
-        }
+    def get_pristine_ticks(self, asteroid_field):
+        """Get the field ticks run since a seeded area was generated, or None if it's changed"""
+        if self.seed_count is None or len(asteroid_field) != self.seed_count:
+            return None
+        for asteroid in asteroid_field.sprites:
+            if asteroid.health != asteroid.size // 10:
+                return None
+        return asteroid_field.tick - self.seed_tick
+    
+    def get_seed_ticks(self, live=False):
+        """Get the field ticks to replay if the area can be regenerated for a save game, or None"""
+        if live:
+            return self.get_pristine_ticks(self.spawn_manager.asteroid_field)
+        if self.hibernated:
+            return self.get_pristine_ticks(self.hibernated.asteroid_field)
+        return self.field_ticks
+    
+    def is_discarded(self):
+        """Check if the area was dropped to be regenerated from its seed"""
+        return self.field_ticks is not None
+    
+    def snapshot(self, asteroid_field, stations):
+        """Pack a field's asteroids and a group of stations into an AreaSnapshot"""
+        snapshot = AreaSnapshot()
+        snapshot.capture(asteroid_field, stations)
+        return snapshot
+    
+    def get_save_snapshot(self, live=False):
+        """Get an AreaSnapshot of the area for a save game
         
-        # Save asteroid positions, types and health
-        for asteroid in self.spawn_manager.asteroids:
-            self.saved_state["asteroids"].append({
-                "position": (asteroid.position.x, asteroid.position.y),
-                "type": asteroid.asteroid_type,
-                "health": asteroid.health
-            })
+        live is True for the area currently loaded, which is captured
+        from the spawn manager. Snapshots aren't changed once made, so
+        the one returned can be encoded off the main thread.
+        """
+        if live:
+            spawn_manager = self.spawn_manager
+            return self.snapshot(spawn_manager.asteroid_field, spawn_manager.stations)
+        if self.hibernated:
+            return self.snapshot(self.hibernated.asteroid_field, self.hibernated.stations)
+        self.load_saved_state()
+        return self.saved_state
+    
+    def has_saved_state(self):
+        """Check if the area can be rebuilt from a snapshot"""
+        return self.saved_state is not None or self.saved_file is not None
+    
+    def load_saved_state(self):
+        """Read the snapshot from the save game if it hasn't been yet"""
+        if self.saved_file is None:
+            return
+        snapshot = AreaSnapshot()
+        snapshot.read(self.saved_file)
+        self.saved_state = snapshot
+        self.saved_file = None
+    
+    def get_spawn_data(self):
+        """Get object data to rebuild the saved area: (asteroids, stations)"""
+        self.load_saved_state()
+        return self.saved_state.get_spawn_data()
+    
+    def read_spawn_data(self):
+        """Get object data to rebuild the saved area without changing this state
         
-        # Save station data
-        for station in self.spawn_manager.stations:
-            self.saved_state["stations"].append({
-                "position": (station.position.x, station.position.y),
-                "name": station.name,
-                "dialog": station.dialog
-            })
-    
-    def restore(self):
-        """Restore the area to its saved state"""
-        if not self.saved_state:
+        Safe to call off the main thread: the snapshot is read into a new
+        AreaSnapshot rather than kept, and snapshots are never changed.
+        """
+        saved_file = self.saved_file
+        snapshot = self.saved_state
+        if snapshot is None:
+            snapshot = AreaSnapshot()
+            snapshot.read(saved_file)
+        return snapshot.get_spawn_data()
+    
+    def restore(self, tick=0):
+        """Restore the area to its saved state and catch it up to tick"""
+        if self.hibernated:
+            # Reattach the live objects as they were left
+            self.spawn_manager.attach(self.hibernated)
+            self.hibernated = None
+        elif self.has_saved_state():
+            try:
+                asteroids, stations = self.get_spawn_data()
+            except (OSError, ValueError) as e:
+                print(f"Error loading area '{self.area_id}' from save: {e}")
+                return False
+            
+            # Clear existing objects
+            self.spawn_manager.clear_objects()
+            
+            # Restore asteroids (as they looked, with their health) and stations
+            self.spawn_manager.spawn_objects(asteroids)
+            self.spawn_manager.spawn_objects(stations)
+        else:
             return False
         
-        # Clear existing objects
-        self.spawn_manager.clear_objects()
+        self.catch_up(tick)
+        return True
+    
+    def catch_up(self, tick):
+        """Advance the loaded area from when it was left to tick in one step"""
+        asteroid_field = self.spawn_manager.asteroid_field
+        if self.field_ticks is not None:
+            # Regenerated as first placed, so replay the ticks run before it was discarded
+            self.seed_tick = asteroid_field.tick
+            asteroid_field.advance(self.field_ticks)
+            self.field_ticks = None
         
-        # Restore asteroids
-        if "asteroids" in self.saved_state:
-            for asteroid_data in self.saved_state["asteroids"]:
-                # Create asteroid with saved data
-                asteroid = self.spawn_manager.spawn_asteroid({
-                    "type": "asteroid",
-                    "x": asteroid_data["position"][0],
-                    "y": asteroid_data["position"][1],
-                    "asteroid_type": asteroid_data["type"]
-                })
-                
-                # Set health
-                if asteroid:
-                    asteroid.health = asteroid_data["health"]
+        if self.left_tick is not None:
+            asteroid_field.advance(tick - self.left_tick)
+            self.left_tick = None
         
-        # Restore stations
-        if "stations" in self.saved_state:
-            for station_data in self.saved_state["stations"]:
-                self.spawn_manager.spawn_station({
-                    "type": "station",
-                    "x": station_data["position"][0],
-                    "y": station_data["position"][1],
-                    "name": station_data["name"],
-                    "dialog": station_data["dialog"]
-                })
-                
-        return True
\ No newline at end of file
+        # Respawns that came due while the area was unloaded, already drifting
+        if self.respawn_scheduler:
+            for due_tick, asteroid_type in self.respawn_scheduler.pop_due(self.area_id, tick):
+                self.spawn_manager.respawn_asteroid(asteroid_type, tick - due_tick)
\ No newline at end of file
@@ -1,15 +1,41 @@
 import os
 import json
+from collections import OrderedDict
+
+# Bump when the manifest format changes so stale indexes are rebuilt
+MANIFEST_VERSION = 1
+
+# Area fields kept in the manifest; everything else loads on demand
+MANIFEST_FIELDS = ("id", "name", "type", "connections")
 
 class MapLoader:
-    """Component for loading and providing map data"""
-    def __init__(self, maps_dir="maps"):
+    """Component for loading and providing map data
+    
+    Startup only reads a manifest of each area's id, name, type and
+    connections, cached in maps/.index.json and refreshed for files whose
+    size or modification time changed. Full area data (object lists) is
+    parsed when an area is loaded and kept in a small LRU.
+    """
+    def __init__(self, maps_dir="maps", cache_size=8, index_file=None):
         self.maps_dir = maps_dir
-        self.areas = {}
+        self.index_file = index_file if index_file is not None else os.path.join(maps_dir, ".index.json")
+        self.cache_size = cache_size
+        
+        # Area id -> manifest entry (MANIFEST_FIELDS plus its file)
+        self.manifest = {}
+        
+        # Area id -> full area data, least recently used first
+        self.cache = OrderedDict()
+        
+        # Stats
+        self.hits = 0
+        self.disk_loads = 0
+        self.indexed = 0  # Files parsed to refresh the manifest
+        
         self.load_all_maps()
     
     def load_all_maps(self):
-        """Load all map data from the maps directory"""
+        """Build the area manifest from the maps directory"""
         # Create maps directory if it doesn't exist
         if not os.path.exists(self.maps_dir):
             print("Maps directory not found. Creating directory...")
@@ -19,54 +45,148 @@ class MapLoader:
                 print("Failed to create maps directory")
             return False
         
-        # Get all JSON files in the maps directory
-        map_files = [f for f in os.listdir(self.maps_dir) if f.endswith(".json")]
+        # Get all JSON files in the maps directory (skipping the hidden index)
+        map_files = sorted(f for f in os.listdir(self.maps_dir)
+                           if f.endswith(".json") and not f.startswith("."))
         if not map_files:
             print("No map files found")
             return False
         
-        # Load each map file
-        success = False
+        # filename -> manifest entry from the last run
+        cached = self._load_index()
+        
+        # Index each map file, reusing entries for unchanged files
+        self.manifest.clear()
+        self.cache.clear()
+        changed = False
         for filename in map_files:
             try:
-                with open(os.path.join(self.maps_dir, filename), "r") as f:
-                    area_data = json.load(f)
-                    self.areas[area_data["id"]] = area_data
-                    success = True
-            except Exception as e:
+                stat = os.stat(os.path.join(self.maps_dir, filename))
+            except OSError as e:
                 print(f"Error loading {filename}: {str(e)}")
+                continue
+            
+            entry = cached.pop(filename, None)
+            if not entry or entry["mtime"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                entry = self._index_file(filename, stat)
+                changed = True
+                if not entry:
+                    continue
+            
+            self.manifest[entry["id"]] = entry
+        
+        # Rewrite the index if files were added, changed or removed
+        if changed or cached:
+            self._store_index()
         
-        print(f"Loaded {len(self.areas)} map areas")
-        return success
+        print(f"Loaded {len(self.manifest)} map areas")
+        return bool(self.manifest)
+    
+    def _index_file(self, filename, stat):
+        """Parse a map file into a manifest entry, caching its full data"""
+        try:
+            with open(os.path.join(self.maps_dir, filename), "r") as f:
+                area_data = json.load(f)
+            entry = {field: area_data.get(field) for field in MANIFEST_FIELDS}
+        except Exception as e:
+            print(f"Error loading {filename}: {str(e)}")
+            return None
+        
+        entry["name"] = entry["name"] or entry["id"]
+        entry["type"] = entry["type"] or "empty"
+        entry["connections"] = entry["connections"] or {}
+        entry["file"] = filename
+        entry["mtime"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        self.indexed += 1
+        
+        # It's parsed already, so keep it while there's room
+        if len(self.cache) < self.cache_size:
+            self.cache[entry["id"]] = area_data
+        return entry
+    
+    def _load_index(self):
+        """Load the cached manifest as filename -> entry, or {} if it's unusable"""
+        try:
+            with open(self.index_file, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if not isinstance(index, dict) or index.get("version") != MANIFEST_VERSION:
+            return {}
+        return {entry["file"]: entry for entry in index.get("areas", [])}
+    
+    def _store_index(self):
+        """Write the manifest to disk (failures only cost startup time)"""
+        try:
+            temp_path = self.index_file + ".tmp"
+            with open(temp_path, "w") as f:
+                json.dump({"version": MANIFEST_VERSION, "areas": list(self.manifest.values())}, f)
+            os.replace(temp_path, self.index_file)
+        except OSError as e:
+            print(f"Error caching map index: {e}")
+    
+    def has_area(self, area_id):
+        """Check if an area exists"""
+        return area_id in self.manifest
     
     def get_area(self, area_id):
-        """Get area data by ID"""
-        if area_id in self.areas:
-            return self.areas[area_id]
-        return None
+        """Get full area data by ID, loading it from disk if it isn't cached"""
+        area_data = self.cache.get(area_id)
+        if area_data is not None:
+            self.cache.move_to_end(area_id)
+            self.hits += 1
+            return area_data
+        
+        area_data = self.read_area(area_id)
+        if area_data is not None:
+            self.disk_loads += 1
+            self.cache_area(area_id, area_data)
+        return area_data
+    
+    def read_area(self, area_id):
+        """Parse an area's file without touching the cache (safe off the main thread)"""
+        entry = self.manifest.get(area_id)
+        if not entry:
+            return None
+        
+        try:
+            with open(os.path.join(self.maps_dir, entry["file"]), "r") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error loading {entry['file']}: {str(e)}")
+            return None
+    
+    def cache_area(self, area_id, area_data):
+        """Add parsed area data to the LRU, evicting the least recently used"""
+        self.cache[area_id] = area_data
+        self.cache.move_to_end(area_id)
+        while len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
     
     def get_connection(self, area_id, direction):
         """Get the ID of the connected area in the specified direction"""
-        if area_id not in self.areas:
+        if area_id not in self.manifest:
             return None
         
-        area = self.areas[area_id]
-        return area["connections"].get(direction)
+        return self.manifest[area_id]["connections"].get(direction)
     
     def get_area_name(self, area_id):
         """Get the name of an area by ID"""
-        if area_id in self.areas:
-            return self.areas[area_id].get("name", area_id)
+        if area_id in self.manifest:
+            return self.manifest[area_id]["name"]
         return "Unknown Area"
     
     def get_area_type(self, area_id):
         """Get the type of an area by ID"""
-        if area_id in self.areas:
-            return self.areas[area_id].get("type", "empty")
+        if area_id in self.manifest:
+            return self.manifest[area_id]["type"]
         return "empty"
     
     def get_area_objects(self, area_id):
         """Get the objects in an area by ID"""
-        if area_id in self.areas:
-            return self.areas[area_id].get("objects", [])
+        area_data = self.get_area(area_id)
+        if area_data:
+            return area_data.get("objects", [])
         return []
\ No newline at end of file
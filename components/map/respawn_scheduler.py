@@ -0,0 +1,52 @@
+import heapq
+import itertools
+
+class RespawnScheduler:
+    """Component for scheduling asteroid respawns per area
+
+    Each area has a heap of respawn events ordered by the absolute
+    simulation tick they are due, so checking for due respawns only
+    touches the events that are actually due.
+    """
+    def __init__(self):
+        # area_id -> heap of (due_tick, sequence, asteroid_type)
+        self.queues = {}
+
+        # Tie-breaker so events due on the same tick keep their order
+        self.sequence = itertools.count()
+
+    def schedule(self, area_id, due_tick, asteroid_type):
+        """Schedule an asteroid to respawn in an area at a given tick"""
+        queue = self.queues.setdefault(area_id, [])
+        heapq.heappush(queue, (due_tick, next(self.sequence), asteroid_type))
+
+    def pop_due(self, area_id, tick):
+        """Remove and return (due_tick, asteroid_type) for respawns due by tick"""
+        queue = self.queues.get(area_id)
+        if not queue or queue[0][0] > tick:
+            return []
+
+        due = []
+        while queue and queue[0][0] <= tick:
+            due_tick, _, asteroid_type = heapq.heappop(queue)
+            due.append((due_tick, asteroid_type))
+
+        if not queue:
+            del self.queues[area_id]
+        return due
+
+    def get_pending_count(self, area_id=None):
+        """Count scheduled respawns for one area, or all areas"""
+        if area_id is not None:
+            return len(self.queues.get(area_id, []))
+        return sum(len(queue) for queue in self.queues.values())
+
+    def get_events(self):
+        """Get every scheduled respawn as (area_id, due_tick, asteroid_type)"""
+        return [(area_id, due_tick, asteroid_type)
+                for area_id, queue in self.queues.items()
+                for due_tick, _, asteroid_type in queue]
+
+    def clear(self):
+        """Drop all scheduled respawns"""
+        self.queues.clear()
@@ -0,0 +1,114 @@
+import math
+import random
+import zlib
+from game_config import *
+from components.asteroid import ASTEROID_SIZES, ASTEROID_VARIANTS
+
+# Richness below DRY_RICHNESS gives dry asteroids and above RICH_RICHNESS rich
+# ones, keeping roughly the old 50% regular, 30% dry and 20% rich mix
+DRY_RICHNESS = 0.4
+RICH_RICHNESS = 0.65
+
+def roll_asteroid(rng, x, y, richness=None):
+    """Roll an asteroid's type, look and drift at a position, every roll drawn from rng"""
+    if richness:
+        # Mostly the local richness, with some spread
+        roll = richness.sample(x, y) * 0.6 + rng.random() * 0.4
+        if roll < DRY_RICHNESS:
+            asteroid_type = "dry"
+        elif roll < RICH_RICHNESS:
+            asteroid_type = "regular"
+        else:
+            asteroid_type = "rich"
+    else:
+        roll = rng.random()
+        if roll < 0.5:
+            asteroid_type = "regular"
+        elif roll < 0.8:
+            asteroid_type = "dry"
+        else:
+            asteroid_type = "rich"
+
+    heading = rng.uniform(0, math.pi * 2)
+    return {
+        "type": "asteroid",
+        "x": x,
+        "y": y,
+        "asteroid_type": asteroid_type,
+        "size": rng.choice(ASTEROID_SIZES),
+        "variant": rng.randint(1, ASTEROID_VARIANTS),
+        "angle": rng.randint(0, 359),
+        "velocity": (math.cos(heading), math.sin(heading)),
+        "speed": rng.uniform(0.1, 0.3)
+    }
+
+class ValueNoise:
+    """Smooth 2D noise in 0-1 from random values on a coarse lattice"""
+    def __init__(self, rng, cell_size, width=WORLD_WIDTH, height=WORLD_HEIGHT):
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 2
+        rows = height // cell_size + 2
+        self.values = [rng.random() for _ in range(self.cols * rows)]
+
+    def sample(self, x, y):
+        """Get the noise value at a world position"""
+        gx = x / self.cell_size
+        gy = y / self.cell_size
+        col = int(gx)
+        row = int(gy)
+
+        # Smoothstep between the four surrounding lattice values
+        tx = gx - col
+        ty = gy - row
+        tx = tx * tx * (3 - 2 * tx)
+        ty = ty * ty * (3 - 2 * ty)
+
+        values = self.values
+        index = row * self.cols + col
+        top = values[index] + (values[index + 1] - values[index]) * tx
+        index += self.cols
+        bottom = values[index] + (values[index + 1] - values[index]) * tx
+        return top + (bottom - top) * ty
+
+class SectorGenerator:
+    """Generates an area's asteroids from the universe seed and area id
+
+    Every roll comes from a random.Random seeded with a CRC-32 of the two,
+    so an area comes out identical each time it's generated, in any order
+    and in any run. Untouched generated areas therefore needn't be stored:
+    AreaState drops them and MapSystem regenerates them on return.
+
+    With clustering on, two value-noise fields drawn from the same rolls
+    shape the area: density thins asteroids out between clusters, and
+    richness groups rich asteroids together with dry ones on the fringes.
+    """
+    def __init__(self, universe_seed=UNIVERSE_SEED, clustered=SECTOR_CLUSTERED):
+        self.universe_seed = universe_seed
+        self.clustered = clustered
+
+    def get_rng(self, area_id):
+        """Get the random generator for an area, the same for every call"""
+        key = f"{self.universe_seed}:{area_id}".encode("utf-8")
+        return random.Random(zlib.crc32(key))
+
+    def generate(self, area_id, count=SECTOR_ASTEROIDS):
+        """Generate object data for an area's asteroids"""
+        rng = self.get_rng(area_id)
+        density = richness = None
+        if self.clustered:
+            density = ValueNoise(rng, SECTOR_NOISE_CELL)
+            richness = ValueNoise(rng, SECTOR_NOISE_CELL)
+
+        objects = []
+        attempts = count * 20
+        while len(objects) < count and attempts:
+            attempts -= 1
+            x = rng.uniform(50, WORLD_WIDTH - 50)
+            y = rng.uniform(50, WORLD_HEIGHT - 50)
+
+            # Keep fewer asteroids where the density is low
+            if density and rng.random() > density.sample(x, y) ** 2:
+                continue
+
+            objects.append(roll_asteroid(rng, x, y, richness))
+        return objects
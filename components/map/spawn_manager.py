@@ -3,14 +3,33 @@ import random
 from game_config import *
 from components.asteroid import Asteroid
 from components.space_station import SpaceStation
+from components.spatial_hash import SpatialHash
+from components.asteroid_field import AsteroidField
+from components.map.sector_generator import roll_asteroid
+
+class AreaObjects:
+    """An area's live sprite groups and spatial indexes, set aside while it's unloaded"""
+    def __init__(self, asteroids, asteroid_grid, asteroid_field, stations, station_grid):
+        self.asteroids = asteroids
+        self.asteroid_grid = asteroid_grid
+        self.asteroid_field = asteroid_field
+        self.stations = stations
+        self.station_grid = station_grid
 
 class SpawnManager:
     """Component for spawning game objects in areas"""
-    def __init__(self, all_sprites, asteroids, game=None):
+    def __init__(self, all_sprites, game=None):
         self.all_sprites = all_sprites
-        self.asteroids = asteroids
+        self.asteroids = pygame.sprite.Group()
         self.stations = pygame.sprite.Group()
         self.game = game  # Store reference to the main game
+        
+        # Broadphase grids for proximity queries
+        self.asteroid_grid = SpatialHash(cell_size=128)
+        self.station_grid = SpatialHash(cell_size=256)
+        
+        # Moves asteroids and keeps asteroid_grid in sync
+        self.asteroid_field = AsteroidField(self.asteroid_grid)
     
     def clear_objects(self):
         """Clear all objects from the area"""
@@ -19,6 +38,54 @@ class SpawnManager:
         
         for sprite in list(self.stations):
             sprite.kill()
+        
+        self.asteroid_field.clear()
+        self.station_grid.clear()
+    
+    def detach(self):
+        """Set the area's objects aside intact and start an empty area
+        
+        Returns:
+            AreaObjects: The detached groups, grids and field, for attach()
+        """
+        objects = AreaObjects(self.asteroids, self.asteroid_grid, self.asteroid_field,
+                              self.stations, self.station_grid)
+        self.all_sprites.remove(*self.stations)
+        
+        self.asteroids = pygame.sprite.Group()
+        self.asteroid_grid = SpatialHash(cell_size=objects.asteroid_grid.cell_size)
+        self.asteroid_field = AsteroidField(self.asteroid_grid)
+        self.stations = pygame.sprite.Group()
+        self.station_grid = SpatialHash(cell_size=objects.station_grid.cell_size)
+        return objects
+    
+    def attach(self, objects):
+        """Replace the area's objects with ones set aside by detach()"""
+        self.clear_objects()
+        
+        self.asteroids = objects.asteroids
+        self.asteroid_grid = objects.asteroid_grid
+        self.asteroid_field = objects.asteroid_field
+        self.stations = objects.stations
+        self.station_grid = objects.station_grid
+        self.all_sprites.add(*self.stations)
+    
+    def install(self, prepared):
+        """Replace the area's objects with a prepared area's in one step
+        
+        The prepared asteroid group, grid and field are swapped in whole,
+        so the old asteroids are dropped without killing them one by one.
+        """
+        for sprite in list(self.stations):
+            sprite.kill()
+        self.station_grid.clear()
+        
+        self.asteroids = prepared.asteroids
+        self.asteroid_grid = prepared.asteroid_grid
+        self.asteroid_field = prepared.asteroid_field
+        
+        for station_data in prepared.stations:
+            self.spawn_station(station_data)
     
     def spawn_objects(self, objects):
         """Spawn objects from area data"""
@@ -33,26 +100,88 @@ class SpawnManager:
     
     def spawn_asteroid(self, data):
         """Spawn an asteroid from data"""
+        asteroid = self.create_asteroid(data)
+        
+        # Add to sprite groups
+        self.add_asteroid(asteroid)
+        
+        return asteroid
+    
+    def create_asteroid(self, data):
+        """Create an asteroid from data without adding it to the area"""
         asteroid_type = data.get("asteroid_type", "regular")
-        asteroid = Asteroid(asteroid_type=asteroid_type)
+        if "variant" in data:
+            # Restored asteroids keep their exact look
+            asteroid = Asteroid(asteroid_type, data["size"], data["variant"], data["angle"])
+        else:
+            asteroid = Asteroid(asteroid_type=asteroid_type)
         
-        # Set position
+        # Set position (kept exact, as restored asteroids carry on drifting from it)
         if "x" in data and "y" in data:
             asteroid.rect.center = (data["x"], data["y"])
-            asteroid.position = pygame.math.Vector2(asteroid.rect.center)
+            asteroid.position = pygame.math.Vector2(data["x"], data["y"])
         
         # Set size
-        if "size" in data:
+        if "size" in data and "variant" not in data:
             asteroid.size = data["size"]
             asteroid.image = pygame.transform.scale(asteroid.image, (asteroid.size, asteroid.size))
             asteroid.rect = asteroid.image.get_rect(center=asteroid.position)
         
-        # Add to sprite groups
-        self.all_sprites.add(asteroid)
-        self.asteroids.add(asteroid)
+        # Restored asteroids keep their damage and drift
+        if "health" in data:
+            asteroid.health = data["health"]
+        if "velocity" in data:
+            asteroid.velocity = pygame.math.Vector2(data["velocity"])
+            asteroid.speed = data["speed"]
         
         return asteroid
     
+    def respawn_asteroid(self, asteroid_type, age=0):
+        """Respawn an asteroid at a random world edge
+        
+        age is how many ticks ago the respawn was due, so one that came due
+        while the area was unloaded has already drifted in from the edge.
+        """
+        asteroid = Asteroid(asteroid_type=asteroid_type)
+        
+        # Choose edge (0=top, 1=right, 2=bottom, 3=left)
+        edge = random.randint(0, 3)
+        if edge == 0:  # Top
+            x = random.randint(0, WORLD_WIDTH)
+            y = 0
+        elif edge == 1:  # Right
+            x = WORLD_WIDTH
+            y = random.randint(0, WORLD_HEIGHT)
+        elif edge == 2:  # Bottom
+            x = random.randint(0, WORLD_WIDTH)
+            y = WORLD_HEIGHT
+        else:  # Left
+            x = 0
+            y = random.randint(0, WORLD_HEIGHT)
+        
+        # Drift for the ticks it's been due, wrapping like the field does
+        if age:
+            x = (x + asteroid.velocity.x * asteroid.speed * age) % WORLD_WIDTH
+            y = (y + asteroid.velocity.y * asteroid.speed * age) % WORLD_HEIGHT
+        
+        # Set position
+        asteroid.rect.center = (x, y)
+        asteroid.position = pygame.math.Vector2(asteroid.rect.center)
+        
+        # Add to sprite groups and spatial hash
+        self.add_asteroid(asteroid)
+        
+        return asteroid
+    
+    def add_asteroid(self, asteroid):
+        """Add an asteroid to the asteroid group and field
+        
+        Asteroids are moved by the field, so they are not added to
+        all_sprites and don't get a per-sprite update.
+        """
+        self.asteroids.add(asteroid)
+        self.asteroid_field.add(asteroid)
+    
     def spawn_station(self, data):
         """Spawn a space station from data"""
         station = SpaceStation(data)
@@ -60,6 +189,7 @@ class SpawnManager:
         # Add to sprite groups
         self.all_sprites.add(station)
         self.stations.add(station)
+        self.station_grid.insert(station)
         
         # Add dialogue if quest manager exists
         if hasattr(self.game, 'quest_manager'):
@@ -67,46 +197,29 @@ class SpawnManager:
         
         return station
     
-    def generate_random_asteroids(self, count=30):
-        """Generate random asteroids"""
+    def generate_random_asteroids(self, count=30, rng=random):
+        """Generate random asteroids, drawing every roll from rng"""
+        for asteroid_data in self.get_random_asteroid_data(count, rng):
+            self.spawn_asteroid(asteroid_data)
+    
+    def get_random_asteroid_data(self, count=30, rng=random):
+        """Roll object data for random asteroids
+        
+        Every attribute is rolled from rng (the global random module unless
+        a seeded random.Random is passed), so Asteroid rolls nothing itself.
+        """
+        objects = []
         for _ in range(count):
-            # Random asteroid type distribution
-            roll = random.random()
-            if roll < 0.5:
-                asteroid_type = "regular"
-            elif roll < 0.8:
-                asteroid_type = "dry"
-            else:
-                asteroid_type = "rich"
-                
             # Random position
-            x = random.randint(50, WORLD_WIDTH - 50)
-            y = random.randint(50, WORLD_HEIGHT - 50)
-            
-            # Random size
-            size = random.choice([32, 48, 64, 80, 96])
-            
-            # Create asteroid data
-            asteroid_data = {
-                "type": "asteroid",
-                "x": x,
-                "y": y,
-                "size": size,
-                "asteroid_type": asteroid_type
-            }
-            
-            # Spawn asteroid
-            self.spawn_asteroid(asteroid_data)
+            x = rng.randint(50, WORLD_WIDTH - 50)
+            y = rng.randint(50, WORLD_HEIGHT - 50)
+            objects.append(roll_asteroid(rng, x, y))
+        return objects
     
     def get_nearest_station(self, position):
         """Find the nearest space station to the given position"""
-        nearest_station = None
-        min_distance = float('inf')
-        
-        for station in self.stations:
-            dist = pygame.math.Vector2(station.rect.center).distance_to(position)
-            if dist < min_distance:
-                min_distance = dist
-                nearest_station = station
-        
-        return nearest_station
\ No newline at end of file
+        return self.station_grid.nearest(position)
+    
+    def get_asteroids_in_range(self, position, radius):
+        """Find asteroids within scanner range of the given position"""
+        return self.asteroid_field.query_radius(position, radius)
\ No newline at end of file
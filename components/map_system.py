@@ -1,13 +1,20 @@
+from collections import OrderedDict
 from game_config import *
 from components.map.map_loader import MapLoader
 from components.map.spawn_manager import SpawnManager
 from components.map.area_state import AreaState
+from components.map.respawn_scheduler import RespawnScheduler
+from components.map.area_prefetcher import AreaPrefetcher
+from components.map.sector_generator import SectorGenerator
+from components.asset_registry import asset_registry
+from components.events import AreaChanged, AsteroidDestroyed
 
 class MapSystem:
     """Main map system that coordinates map loading, spawning, and state tracking"""
-    def __init__(self, all_sprites, asteroids, game=None):
+    def __init__(self, all_sprites, game=None):
         self.map_loader = MapLoader()
-        self.spawn_manager = SpawnManager(all_sprites, asteroids, game)
+        self.spawn_manager = SpawnManager(all_sprites, game)
+        self.game = game
         
         self.current_area_id = None
         self.previous_area_id = None
@@ -16,26 +23,59 @@ class MapSystem:
         # Store area states
         self.area_states = {}
         
-        # Import areas from loader for backward compatibility
-        self.areas = self.map_loader.areas
+        # Ids of areas whose live objects are set aside, least recently left first
+        self.hibernated_areas = OrderedDict()
+        self.max_hibernated_areas = MAX_HIBERNATED_AREAS
+        self.max_hibernated_asteroids = MAX_HIBERNATED_ASTEROIDS
+        
+        # Pending asteroid respawns for every area
+        self.respawn_scheduler = RespawnScheduler()
+        
+        # Builds the area the jump prompt points at ahead of the jump
+        self.prefetcher = AreaPrefetcher(self)
+        
+        # Generates asteroid fields that have no objects in their map file
+        self.generator = SectorGenerator()
+        
+        # Areas with destroyed asteroids can't be regenerated from the seed
+        if game:
+            game.events.subscribe(AsteroidDestroyed, self.on_asteroid_destroyed)
     
-    def change_area(self, area_id, direction=None):
-        """Change to a different area"""
-        if area_id not in self.map_loader.areas:
+    def change_area(self, area_id, direction=None, publish=True):
+        """Change to a different area
+        
+        publish is False when the area is swapped in without the player
+        arriving there, e.g. when a save game is loaded.
+        """
+        if not self.map_loader.has_area(area_id):
             print(f"Area '{area_id}' not found!")
             return False, None
         
-        # Save current area state if we have one
+        # Set the current area aside if we have one
         if self.current_area_id:
-            self.save_area_state(self.current_area_id)
+            self.hibernate_area(self.current_area_id)
         
         # Store previous area for back-jumps
         self.previous_area_id = self.current_area_id
         self.current_area_id = area_id
         self.jump_direction = direction
         
-        # Load the new area
-        self.load_area(area_id)
+        # Swap in the area if it was prepared while the jump prompt showed
+        # (hibernated areas are reattached as they are)
+        prepared = None
+        if area_id not in self.hibernated_areas:
+            prepared = self.prefetcher.take(area_id)
+        if prepared:
+            self.install_area(prepared)
+        else:
+            # Warm the image cache before spawning the area's objects
+            asset_registry.preload(self.map_loader.get_area(area_id))
+            
+            # Load the new area
+            self.load_area(area_id)
+        
+        if self.game and publish:
+            self.game.events.publish(AreaChanged(area_id, self.previous_area_id, direction))
         
         # Return success and jump direction
         return True, direction
@@ -43,10 +83,18 @@ class MapSystem:
     def load_area(self, area_id):
         """Load an area by ID"""
         # Check if we've already visited this area
-        if area_id in self.area_states:
-            # Restore the area's saved state
-            self.area_states[area_id].restore()
-            return True
+        area_state = self.area_states.get(area_id)
+        if area_state:
+            # Restore the area's hibernated objects or saved state
+            self.hibernated_areas.pop(area_id, None)
+            if area_state.restore(self.get_tick()):
+                return True
+            
+            # Nothing to restore from; regenerate a discarded seeded area
+            # below, or start the area over
+            if not area_state.is_discarded():
+                del self.area_states[area_id]
+                area_state = None
             
         # Get area data
         area_data = self.map_loader.get_area(area_id)
@@ -57,23 +105,72 @@ class MapSystem:
         self.spawn_manager.clear_objects()
         
         # Spawn objects defined in area data
+        seed_count = None
         if "objects" in area_data and area_data["objects"]:
             self.spawn_manager.spawn_objects(area_data["objects"])
-        # Generate random objects if needed
+        # Generate the area from the seed if needed
         elif area_data["type"] == "asteroid_field":
-            self.spawn_manager.generate_random_asteroids(30)
+            asteroids = self.generator.generate(area_id)
+            self.spawn_manager.spawn_objects(asteroids)
+            seed_count = len(asteroids)
         
-        # Create a new area state
-        self.area_states[area_id] = AreaState(area_id, self.spawn_manager)
+        if area_state:
+            # Move the regenerated area on to where it was
+            area_state.catch_up(self.get_tick())
+        else:
+            # Create a new area state
+            area_state = AreaState(area_id, self.spawn_manager, self.respawn_scheduler)
+            area_state.seed_count = seed_count
+            area_state.seed_tick = self.spawn_manager.asteroid_field.tick
+            self.area_states[area_id] = area_state
         
         return True
     
+    def install_area(self, prepared):
+        """Swap in an area built by the prefetcher"""
+        area_id = prepared.area_id
+        self.spawn_manager.install(prepared)
+        
+        area_state = self.area_states.get(area_id)
+        if area_state:
+            area_state.catch_up(self.get_tick())
+        else:
+            area_state = AreaState(area_id, self.spawn_manager, self.respawn_scheduler)
+            area_state.seed_count = prepared.seed_count
+            area_state.seed_tick = self.spawn_manager.asteroid_field.tick
+            self.area_states[area_id] = area_state
+    
+    def prefetch(self, area_id):
+        """Prepare an area the player may jump to, a batch per call"""
+        # Hibernated areas are ready as they are
+        if area_id not in self.hibernated_areas:
+            self.prefetcher.prefetch(area_id)
+    
+    def hibernate_area(self, area_id):
+        """Set an area's live objects aside, snapshotting the oldest past the caps"""
+        if area_id not in self.area_states:
+            self.area_states[area_id] = AreaState(area_id, self.spawn_manager, self.respawn_scheduler)
+        
+        area_state = self.area_states[area_id]
+        area_state.hibernate(self.get_tick())
+        self.hibernated_areas[area_id] = area_state.get_object_count()
+        self.hibernated_areas.move_to_end(area_id)
+        
+        # Keep the most recently left areas live while they fit
+        total = sum(self.hibernated_areas.values())
+        while self.hibernated_areas and (len(self.hibernated_areas) > self.max_hibernated_areas
+                                         or total > self.max_hibernated_asteroids):
+            oldest_id, count = self.hibernated_areas.popitem(last=False)
+            self.area_states[oldest_id].freeze()
+            total -= count
+    
     def save_area_state(self, area_id):
         """Save the state of a specific area"""
         if area_id not in self.area_states:
-            self.area_states[area_id] = AreaState(area_id, self.spawn_manager)
+            self.area_states[area_id] = AreaState(area_id, self.spawn_manager, self.respawn_scheduler)
             
-        self.area_states[area_id].save()
+        self.hibernated_areas.pop(area_id, None)
+        self.area_states[area_id].save(self.get_tick())
         return True
     
     def restore_area_state(self, area_id):
@@ -81,7 +178,50 @@ class MapSystem:
         if area_id not in self.area_states:
             return False
             
-        return self.area_states[area_id].restore()
+        self.hibernated_areas.pop(area_id, None)
+        return self.area_states[area_id].restore(self.get_tick())
+    
+    def reset(self):
+        """Unload the current area and forget every visited area"""
+        self.prefetcher.cancel()
+        self.spawn_manager.clear_objects()
+        self.area_states.clear()
+        self.hibernated_areas.clear()
+        self.respawn_scheduler.clear()
+        self.current_area_id = None
+        self.previous_area_id = None
+        self.jump_direction = None
+    
+    def on_asteroid_destroyed(self, event):
+        """Stop treating the area as its generated self once it's been mined"""
+        area_state = self.area_states.get(event.area_id)
+        if area_state:
+            area_state.seed_count = None
+    
+    def get_tick(self):
+        """Get the current simulation tick"""
+        return getattr(self.game, "tick", 0)
+    
+    def schedule_respawn(self, asteroid_type, delay_ticks):
+        """Schedule an asteroid to respawn in the current area"""
+        if self.current_area_id:
+            self.respawn_scheduler.schedule(self.current_area_id, self.get_tick() + delay_ticks, asteroid_type)
+    
+    def update_respawns(self):
+        """Respawn asteroids that are due in the current area"""
+        if not self.current_area_id:
+            return
+        
+        for _, asteroid_type in self.respawn_scheduler.pop_due(self.current_area_id, self.get_tick()):
+            self.spawn_manager.respawn_asteroid(asteroid_type)
+    
+    def get_area_name(self, area_id):
+        """Get the name of an area by ID"""
+        return self.map_loader.get_area_name(area_id)
+    
+    def get_area_type(self, area_id):
+        """Get the type of an area by ID"""
+        return self.map_loader.get_area_type(area_id)
     
     def get_connection(self, direction):
         """Get the ID of the connected area in the specified direction"""
@@ -123,4 +263,8 @@ class MapSystem:
     
     def get_nearest_station(self, player_position):
         """Find the nearest space station to the player"""
-        return self.spawn_manager.get_nearest_station(player_position)
\ No newline at end of file
+        return self.spawn_manager.get_nearest_station(player_position)
+    
+    def scan_asteroids(self, position, scan_range):
+        """Find asteroids within scanner range of a position"""
+        return self.spawn_manager.get_asteroids_in_range(position, scan_range)
\ No newline at end of file
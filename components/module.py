@@ -214,4 +214,10 @@ SCANNER_MODULES = [SCANNER_BASIC, SCANNER_LONG_RANGE, SCANNER_PRECISION]
 FACILITY_MODULES = [FACILITY_BASIC, FACILITY_EXPANDED, FACILITY_EFFICIENT]
 JUMP_ENGINE_MODULES = [JUMP_ENGINE_BASIC, JUMP_ENGINE_EXTENDED, JUMP_ENGINE_EFFICIENT]
 HANGAR_MODULES = [HANGAR_BASIC, HANGAR_EXPANDED, HANGAR_EFFICIENT]
-AUX_MODULES = [AUX_ENERGY_CELL, AUX_CARGO_BAY, AUX_REPAIR_UNIT, AUX_SHIELD_BOOSTER, AUX_MINING_BEAM]
\ No newline at end of file
+AUX_MODULES = [AUX_ENERGY_CELL, AUX_CARGO_BAY, AUX_REPAIR_UNIT, AUX_SHIELD_BOOSTER, AUX_MINING_BEAM]
+
+# Every module by name, for loading saved ships
+MODULES = {module.name: module for modules in (
+    ENGINE_MODULES, SHIELD_MODULES, WEAPON_MODULES, SCANNER_MODULES,
+    FACILITY_MODULES, JUMP_ENGINE_MODULES, HANGAR_MODULES, AUX_MODULES
+) for module in modules}
\ No newline at end of file
@@ -4,36 +4,61 @@ class ObjectPool:
         self.active_objects = []
         self.inactive_objects = []
         
+        # Objects built by the factory (initial and on demand)
+        self.created = 0
+        
         # Create initial objects
         for _ in range(initial_size):
-            obj = factory_func()
-            obj.active = False
+            obj = self._create()
             self.inactive_objects.append(obj)
     
+    def _create(self):
+        """Build a new inactive object"""
+        obj = self.factory_func()
+        obj.active = False
+        obj.pool_index = None
+        self.created += 1
+        return obj
+    
     def get_object(self, *args, **kwargs):
         """Get an object from the pool or create new one"""
         if self.inactive_objects:
             obj = self.inactive_objects.pop()
         else:
-            obj = self.factory_func()
-            
+            obj = self._create()
+        
         # Initialize with args
         obj.initialize(*args, **kwargs)
         obj.active = True
+        obj.pool_index = len(self.active_objects)
         self.active_objects.append(obj)
         return obj
     
     def release_object(self, obj):
-        """Return object to pool"""
-        if obj in self.active_objects:
-            self.active_objects.remove(obj)
-            obj.active = False
-            self.inactive_objects.append(obj)
+        """Return object to pool
+        
+        The last active object is moved into the released slot, so this is
+        O(1) but does not keep active_objects in order.
+        """
+        index = obj.pool_index
+        if index is None:
+            return
+        
+        last = self.active_objects.pop()
+        if last is not obj:
+            self.active_objects[index] = last
+            last.pool_index = index
+        
+        obj.active = False
+        obj.pool_index = None
+        self.inactive_objects.append(obj)
     
     def update(self, *args, **kwargs):
         """Update all active objects"""
-        for obj in list(self.active_objects):
+        # Walk backwards so releasing the current object is safe
+        for index in range(len(self.active_objects) - 1, -1, -1):
+            obj = self.active_objects[index]
             if not obj.active:
                 self.release_object(obj)
             else:
-                obj.update(*args, **kwargs)
+                obj.update(*args, **kwargs)
\ No newline at end of file
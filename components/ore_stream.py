@@ -0,0 +1,132 @@
+import math
+import random
+from array import array
+from components.object_pool import ObjectPool
+from components.flying_ore import FlyingOre
+
+class OreStream:
+    """Flies ore from destroyed asteroids to the player along quadratic Bezier curves
+
+    Each fragment's start point, control point, curve progress, per-tick
+    progress step and remaining life are kept in arrays parallel to the
+    pool's active list of FlyingOre sprites. All curves are advanced in one
+    pass per tick, and every fragment that reached the player that tick
+    goes into the inventory in one add_ores call.
+    """
+    def __init__(self, target, initial_size=32):
+        self.target = target
+        self.pool = ObjectPool(FlyingOre, initial_size)
+
+        # Indexed like pool.active_objects
+        self.start_x = array('d')
+        self.start_y = array('d')
+        self.control_x = array('d')
+        self.control_y = array('d')
+        self.t = array('d')
+        self.step = array('d')
+        self.life = array('i')
+
+        # Stats
+        self.delivered = 0
+
+    def __len__(self):
+        return len(self.pool.active_objects)
+
+    def __iter__(self):
+        return iter(self.pool.active_objects)
+
+    def spawn(self, position, item):
+        """Launch an ore fragment from a position towards the target"""
+        ore = self.pool.get_object(position, item)
+        start_x, start_y = position
+
+        # Perpendicular to the straight line, for the curve's control point
+        target_x, target_y = self.target.rect.center
+        dx = target_x - start_x
+        dy = target_y - start_y
+        distance = math.hypot(dx, dy)
+        if distance:
+            perp_x, perp_y = -dy / distance, dx / distance
+        else:
+            perp_x = perp_y = 0.0
+
+        # Random curve direction and magnitude, capped for distant targets
+        curve_strength = min(distance * 0.5, 200)
+        curve_magnitude = random.uniform(0.1, 1.0) * curve_strength
+        if random.random() < 0.5:
+            curve_magnitude *= -1
+
+        self.start_x.append(start_x)
+        self.start_y.append(start_y)
+        self.control_x.append(start_x + perp_x * curve_magnitude)
+        self.control_y.append(start_y + perp_y * curve_magnitude)
+        self.t.append(0.0)
+
+        # Curve progress per tick, from a random speed
+        self.step.append(random.uniform(0.015, 0.018) * random.uniform(2.5, 6.0))
+        self.life.append(180)  # 3 seconds at 60 FPS, so ore can't get orphaned
+        return ore
+
+    def release(self, ore):
+        """Return an ore fragment to the pool"""
+        index = ore.pool_index
+        if index is None:
+            return
+
+        # Mirror the pool's swap-remove
+        for values in (self.start_x, self.start_y, self.control_x, self.control_y,
+                       self.t, self.step, self.life):
+            values[index] = values[-1]
+            values.pop()
+
+        self.pool.release_object(ore)
+
+    def update(self):
+        """Advance every fragment and deliver those that reached the target"""
+        active = self.pool.active_objects
+        if not active:
+            return
+
+        target_rect = self.target.rect
+        target_x, target_y = target_rect.center
+        start_x, start_y = self.start_x, self.start_y
+        control_x, control_y = self.control_x, self.control_y
+        curve_t, step, life = self.t, self.step, self.life
+        arrived = []
+
+        for index in range(len(active) - 1, -1, -1):
+            ore = active[index]
+
+            life[index] -= 1
+            if life[index] <= 0:
+                self.release(ore)
+                continue
+
+            t = min(curve_t[index] + step[index], 1.0)
+            curve_t[index] = t
+
+            # Quadratic bezier curve: B(t) = (1-t)²P₀ + 2(1-t)tP₁ + t²P₂
+            one_minus_t = 1 - t
+            a = one_minus_t * one_minus_t
+            b = 2 * one_minus_t * t
+            c = t * t
+            x = a * start_x[index] + b * control_x[index] + c * target_x
+            y = a * start_y[index] + b * control_y[index] + c * target_y
+
+            # Remember last tick's position for render interpolation
+            rect = ore.rect
+            ore.previous_center = rect.center
+            rect.center = (x, y)
+
+            if rect.colliderect(target_rect):
+                arrived.append(ore.item)
+                self.release(ore)
+
+        if arrived:
+            self.target.add_ores(arrived)
+            self.delivered += len(arrived)
+
+    def clear(self):
+        """Drop every fragment in flight"""
+        for ore in list(self.pool.active_objects):
+            self.release(ore)
@@ -2,9 +2,13 @@ import pygame
 import math
 from game_config import *
 from components.engine import Engine
-from components.weapon import create_weapon
+from components.events import OreCollected
 from components.hangar import Hangar
+from components.inventory import Inventory
+from components.items import ITEMS
 from components.module import *
+from components.rotation_cache import rotation_cache
+from components.asset_registry import asset_registry
 
 # In components/player.py
 
@@ -13,6 +17,16 @@ from components.module import *
 # Modify add_ore method to update quest progress:
 
 
+def draw_ship_fallback(width, height):
+    """Draw a triangle for the player ship without an image"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, WHITE, [(width // 2, 0), (0, height), (width, height)])
+    return surface
+
+# PlayerStats attributes kept in save games
+SAVED_STATS = ("hull_strength", "max_hull", "shield_strength", "max_shield", "energy",
+               "max_energy", "energy_regen", "max_slots", "silver")
+
 class PlayerStats:
     """Player stats that can be upgraded"""
     def __init__(self):
@@ -42,6 +56,8 @@ class Player(pygame.sprite.Sprite):
         # Stats
         self.stats = PlayerStats()
         
+        self.game = None  # Reference to the game, set by Game
+        
         # Ship modules - use module system exclusively
         self.modules = {
             "engine": ENGINE_BASIC,
@@ -62,33 +78,20 @@ class Player(pygame.sprite.Sprite):
         # Update stats based on modules
         self.update_stats_from_modules()
         
-        # Create player image
-        try:
-            self.original_image = pygame.image.load("assets/ship.png").convert_alpha()
-            scale_factor = 30 / 620
-            new_size = int(620 * scale_factor)
-            self.original_image = pygame.transform.scale(self.original_image, (new_size, new_size))
-        except:
-            # Create triangle if image not found
-            self.original_image = pygame.Surface((30, 30), pygame.SRCALPHA)
-            pygame.draw.polygon(self.original_image, WHITE, [(15, 0), (0, 30), (30, 30)])
+        # Create player image, or a triangle if the image is missing
+        self.original_image = asset_registry.get_image("ship.png", 30, draw_ship_fallback)
         
         self.image = self.original_image
         self.rect = self.image.get_rect(center=(WORLD_WIDTH // 2, WORLD_HEIGHT // 2))
         self.position = pygame.math.Vector2(self.rect.center)
         
         # Inventory
-        self.inventory = []
-        for _ in range(INVENTORY_ROWS):
-            row = []
-            for _ in range(INVENTORY_COLS):
-                row.append({"item": None, "count": 0})
-            self.inventory.append(row)
+        self.inventory = Inventory()
         
         self.total_ore = 0
         
         # Energy regen tracking
-        self.last_energy_regen = pygame.time.get_ticks()
+        self.last_energy_regen = 0
         
         # Active drones
         self.drones = []
@@ -129,8 +132,11 @@ class Player(pygame.sprite.Sprite):
         if game_state != 0:  # GAME_RUNNING = 0
             return
             
-        # Get key states
-        keys = pygame.key.get_pressed()
+        # Remember last tick's position for render interpolation
+        self.previous_center = self.rect.center
+        
+        # Get key states (the game may replay scripted input)
+        keys = self.game.get_keys() if self.game else pygame.key.get_pressed()
         
         # Update engine and position
         self.position = self.engine.update(keys, self.position)
@@ -139,8 +145,8 @@ class Player(pygame.sprite.Sprite):
         energy_usage = self.engine.get_energy_usage() / FPS
         self.stats.energy = max(0, self.stats.energy - energy_usage)
         
-        # Regenerate energy over time
-        current_time = pygame.time.get_ticks()
+        # Regenerate energy over simulated time
+        current_time = self.game.get_time() if self.game else pygame.time.get_ticks()
         if current_time - self.last_energy_regen > 1000:  # Every second
             # Energy regen
             self.stats.energy = min(self.stats.max_energy, 
@@ -165,7 +171,7 @@ class Player(pygame.sprite.Sprite):
             self.last_energy_regen = current_time
         
         # Update image and rectangle
-        self.image = pygame.transform.rotate(self.original_image, self.engine.get_angle())
+        self.image = rotation_cache.get(self.original_image, self.engine.get_angle())
         self.rect = self.image.get_rect(center=self.position)
     
     def shoot(self):
@@ -179,7 +185,7 @@ class Player(pygame.sprite.Sprite):
         
         if self.stats.energy >= energy_cost:
             self.stats.energy -= energy_cost
-            return create_weapon(weapon_module, self.position, self.engine.direction)
+            return self.game.lasers.fire(weapon_module, self.position, self.engine.direction)
         return None
     
     def get_weapon_cooldown(self):
@@ -204,45 +210,74 @@ class Player(pygame.sprite.Sprite):
             return True
         return False
         
-    def add_ore(self, item):
-        # Find slot with same item that isn't full
-        for row in range(INVENTORY_ROWS):
-            for col in range(INVENTORY_COLS):
-                slot = self.inventory[row][col]
-                # Add to existing stack if not full
-                if slot["item"] and slot["item"].name == item.name and slot["count"] < item.max_stack:
-                    slot["count"] += 1
-                    self.total_ore += 1
-                    
-                    # Update quest progress
-                    if self.game and hasattr(self.game, 'quest_manager'):
-                        self.game.quest_manager.update_quest_progress(item)
-                        
-                    return True
-        
-        # Find empty slot if no existing stack has room
-        for row in range(INVENTORY_ROWS):
-            for col in range(INVENTORY_COLS):
-                slot = self.inventory[row][col]
-                if slot["item"] is None:  # Empty slot
-                    slot["item"] = item
-                    slot["count"] = 1
-                    self.total_ore += 1
-                    
-                    # Update quest progress
-                    if self.game and hasattr(self.game, 'quest_manager'):
-                        self.game.quest_manager.update_quest_progress(item)
-                        
-                    return True
-        
-        # Inventory full
-        return False
+    def add_ore(self, item, collected=True):
+        """Add a single ore to the inventory"""
+        return self.add_ores([item], collected) == 1
+    
+    def add_ores(self, items, collected=True):
+        """Add several ores to the inventory, returning how many fit
+        
+        collected is False for ore that wasn't picked up, e.g. bought from
+        a merchant, so it doesn't count toward collection objectives.
+        """
+        # Group by item name, keeping arrival order: name -> [item, count]
+        pending = {}
+        for item in items:
+            if item.name in pending:
+                pending[item.name][1] += 1
+            else:
+                pending[item.name] = [item, 1]
+        
+        total_added = 0
+        for item, count in pending.values():
+            added = self.inventory.add(item, count)
+            total_added += added
+            
+            # Let quests and telemetry know
+            if added and collected and self.game:
+                self.game.events.publish(OreCollected(item, added))
+        
+        self.total_ore += total_added
+        return total_added
+    
+    def get_save_data(self):
+        """Get the ship, stats and cargo as JSON-ready data"""
+        return {
+            "position": [self.position.x, self.position.y],
+            "angle": self.engine.angle,
+            "velocity": [self.engine.velocity.x, self.engine.velocity.y],
+            "modules": {slot: module.name if module else None for slot, module in self.modules.items()},
+            "stats": {name: getattr(self.stats, name) for name in SAVED_STATS},
+            "total_ore": self.total_ore,
+            "inventory": self.inventory.get_slot_data()
+        }
+    
+    def load_save_data(self, data):
+        """Restore the ship, stats and cargo from get_save_data() output"""
+        # Refit modules first, as that resets some stats
+        for slot, module_name in data["modules"].items():
+            if slot in self.modules:
+                module = MODULES.get(module_name) if module_name else None
+                if module_name and not module:
+                    print(f"Unknown module '{module_name}' in save")
+                self.install_module(slot, module)
+        
+        for name, value in data["stats"].items():
+            if name in SAVED_STATS:
+                setattr(self.stats, name, value)
+        
+        self.position = pygame.math.Vector2(data["position"])
+        self.rect.center = self.position
+        self.engine.angle = data["angle"]
+        self.engine.direction = pygame.math.Vector2(0, -1).rotate(-data["angle"])
+        self.engine.velocity = pygame.math.Vector2(data["velocity"])
+        
+        self.total_ore = data["total_ore"]
+        self.inventory.load_slot_data(data["inventory"], ITEMS)
     
     def get_inventory_capacity(self):
         """Return max and current inventory capacity"""
-        total_slots = INVENTORY_COLS * INVENTORY_ROWS
-        used_slots = sum(1 for row in self.inventory for slot in row if slot["item"] is not None)
-        return used_slots, total_slots
+        return self.inventory.used_slots(), self.inventory.capacity
     
     def take_damage(self, amount):
         """Handle damage to shields and hull"""
@@ -0,0 +1,96 @@
+from array import array
+from game_config import *
+from components.object_pool import ObjectPool
+from components.weapon import Weapon
+
+class ProjectileSystem:
+    """Pooled projectiles moved from packed arrays
+
+    Projectiles come from an ObjectPool and go back to it when they leave
+    the world or hit something, so firing doesn't build new sprites or
+    surfaces. Positions and per-tick velocities are kept in arrays parallel
+    to the pool's active list; both are swap-removed together on release.
+    Iterating yields active projectiles from last to first, so the current
+    projectile can be released inside the loop.
+    """
+    def __init__(self, initial_size=64):
+        self.pool = ObjectPool(Weapon, initial_size)
+
+        # Indexed like pool.active_objects
+        self.x = array('d')
+        self.y = array('d')
+        self.velocity_x = array('d')
+        self.velocity_y = array('d')
+
+        # Stats
+        self.fired = 0
+
+    def __len__(self):
+        return len(self.pool.active_objects)
+
+    def __iter__(self):
+        active = self.pool.active_objects
+        for index in range(len(active) - 1, -1, -1):
+            if index < len(active):
+                yield active[index]
+
+    def fire(self, module, position, direction):
+        """Launch a projectile for a weapon module"""
+        projectile = self.pool.get_object(position, direction, module)
+        projectile.previous_center = projectile.rect.center
+
+        speed = projectile.get_module_stat('speed', 10)
+        self.x.append(projectile.position.x)
+        self.y.append(projectile.position.y)
+        self.velocity_x.append(projectile.direction.x * speed)
+        self.velocity_y.append(projectile.direction.y * speed)
+
+        self.fired += 1
+        return projectile
+
+    def release(self, projectile):
+        """Return a projectile to the pool"""
+        index = projectile.pool_index
+        if index is None:
+            return
+
+        # Mirror the pool's swap-remove
+        self.x[index] = self.x[-1]
+        self.y[index] = self.y[-1]
+        self.velocity_x[index] = self.velocity_x[-1]
+        self.velocity_y[index] = self.velocity_y[-1]
+        self.x.pop()
+        self.y.pop()
+        self.velocity_x.pop()
+        self.velocity_y.pop()
+
+        self.pool.release_object(projectile)
+
+    def update(self):
+        """Move every projectile one tick, releasing those that left the world"""
+        active = self.pool.active_objects
+        x, y = self.x, self.y
+        velocity_x, velocity_y = self.velocity_x, self.velocity_y
+
+        for index in range(len(active) - 1, -1, -1):
+            projectile = active[index]
+            new_x = x[index] + velocity_x[index]
+            new_y = y[index] + velocity_y[index]
+
+            # Remove if off world
+            if new_x < 0 or new_x > WORLD_WIDTH or new_y < 0 or new_y > WORLD_HEIGHT:
+                self.release(projectile)
+                continue
+
+            x[index] = new_x
+            y[index] = new_y
+
+            # Remember last tick's position for render interpolation
+            rect = projectile.rect
+            projectile.previous_center = rect.center
+            rect.center = (new_x, new_y)
+
+    def clear(self):
+        """Release every projectile"""
+        for projectile in list(self.pool.active_objects):
+            self.release(projectile)
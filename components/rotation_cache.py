@@ -0,0 +1,69 @@
+import pygame
+from collections import OrderedDict
+
+class RotationCache:
+    """Process-wide cache of rotated surfaces
+
+    Rotations are keyed by (source image, angle bucket). Buckets are filled
+    lazily on first use, and the least recently used rotations are evicted
+    once the cached surfaces exceed the memory cap.
+    """
+    def __init__(self, angle_step=2, max_bytes=16 * 1024 * 1024):
+        self.angle_step = angle_step
+        self.bucket_count = 360 // angle_step
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+
+        # (image, bucket) -> (rotated surface, size in bytes), oldest first
+        self.entries = OrderedDict()
+
+        # Stats
+        self.hits = 0
+        self.misses = 0
+
+    def get_bucket(self, angle):
+        """Quantize an angle in degrees to a bucket index"""
+        return int(round(angle / self.angle_step)) % self.bucket_count
+
+    def get(self, image, angle):
+        """Get the image rotated to the nearest angle bucket"""
+        key = (image, self.get_bucket(angle))
+        entry = self.entries.get(key)
+        if entry:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        return self._add(key)
+
+    def precompute(self, image):
+        """Fill every angle bucket for an image up front"""
+        for bucket in range(self.bucket_count):
+            key = (image, bucket)
+            if key not in self.entries:
+                self._add(key)
+
+    def clear(self):
+        """Drop all cached rotations"""
+        self.entries.clear()
+        self.used_bytes = 0
+
+    def _add(self, key):
+        """Rotate an image into a bucket and store it"""
+        image, bucket = key
+        rotated = pygame.transform.rotate(image, bucket * self.angle_step)
+        size = rotated.get_width() * rotated.get_height() * rotated.get_bytesize()
+
+        self.entries[key] = (rotated, size)
+        self.used_bytes += size
+
+        # Evict least recently used rotations, always keeping the newest
+        while self.used_bytes > self.max_bytes and len(self.entries) > 1:
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.used_bytes -= evicted_size
+
+        return rotated
+
+# Shared cache used by all rotating sprites
+rotation_cache = RotationCache()
@@ -0,0 +1,227 @@
+import json
+import os
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from game_config import *
+from components.map.area_state import AreaState
+
+# Bump when the save layout changes; older saves are refused
+SAVE_VERSION = 2
+
+class SaveSystem:
+    """Saves and loads the player, flags, respawns and every visited area
+
+    A save is a directory holding game.json (player, cargo, flags,
+    respawns and an index of areas) and one AreaSnapshot file per visited
+    area. Saves are incremental: an area's file is only rewritten if the
+    area has been entered since the last save, and the index keeps
+    pointing at the files of areas that haven't changed. Untouched
+    generated areas get no file at all; the index holds the universe seed
+    and the ticks to replay after regenerating them.
+
+    The main thread only gathers state, packing changed areas into
+    snapshots. Encoding and writing happen on a background thread, and
+    game.json is swapped in after the new area files are written, so a
+    crash mid-save leaves the previous save usable. Loading reads
+    game.json only; each area's snapshot is memory-mapped when the area is
+    first entered or prefetched.
+    """
+    def __init__(self, game, save_dir=SAVE_DIR, autosave_interval=AUTOSAVE_INTERVAL):
+        self.game = game
+        self.save_dir = save_dir
+        self.areas_dir = os.path.join(save_dir, "areas")
+        self.save_file = os.path.join(save_dir, "game.json")
+
+        # Autosave and write-behind state
+        self.autosave_interval = autosave_interval
+        self.last_save_time = time.monotonic()
+        self.writer = None
+
+        # Area id -> index entry in the last save written: left tick, and a snapshot
+        # file name or the field ticks and asteroid count of a seeded area
+        self.saved_areas = {}
+
+        # Saves made into this directory, used to give area files new names
+        self.generation = 0
+
+        # Stats
+        self.saves = 0
+        self.areas_written = 0
+        self.areas_reused = 0
+        self.gather_time = 0.0  # Main thread seconds spent by the last save
+        self.write_time = 0.0  # Writer seconds spent by the last finished save
+
+    def has_save(self):
+        """Check if there's a save to load"""
+        return os.path.exists(self.save_file)
+
+    def update(self):
+        """Autosave if the autosave interval has passed"""
+        if time.monotonic() - self.last_save_time >= self.autosave_interval:
+            self.save()
+
+    def save(self):
+        """Gather the game's state and hand it to the background writer"""
+        start = time.perf_counter()
+        game = self.game
+        map_system = game.map_system
+        tick = map_system.get_tick()
+        self.generation += 1
+
+        # Snapshot areas entered since the last save; reuse the rest
+        saved_areas = {}
+        snapshots = []
+        for area_id, area_state in map_system.area_states.items():
+            live = area_id == map_system.current_area_id
+            left_tick = tick if live else area_state.left_tick
+            saved = self.saved_areas.get(area_id)
+            if saved and not live and saved["left_tick"] == left_tick:
+                saved_areas[area_id] = saved
+                self.areas_reused += 1
+                continue
+
+            # Untouched seeded areas are regenerated on load
+            field_ticks = area_state.get_seed_ticks(live)
+            if field_ticks is not None:
+                saved_areas[area_id] = {"left_tick": left_tick, "field_ticks": field_ticks,
+                                        "seed_count": area_state.seed_count}
+                continue
+
+            try:
+                snapshot = area_state.get_save_snapshot(live)
+            except (OSError, ValueError) as e:
+                print(f"Error saving area '{area_id}': {e}")
+                # Keep pointing at its last saved file so it isn't deleted
+                if saved:
+                    saved_areas[area_id] = saved
+                continue
+            if snapshot is None:
+                continue
+
+            file_name = f"{area_id}.{self.generation}.snap"
+            saved_areas[area_id] = {"left_tick": left_tick, "file": file_name}
+            snapshots.append((file_name, snapshot))
+        self.areas_written += len(snapshots)
+
+        data = {
+            "version": SAVE_VERSION,
+            "generation": self.generation,
+            "tick": tick,
+            "player": game.player.get_save_data(),
+            "flags": dict(game.quest_manager.flags.flags),
+            "map": {
+                "universe_seed": map_system.generator.universe_seed,
+                "current_area": map_system.current_area_id,
+                "previous_area": map_system.previous_area_id,
+                "areas": saved_areas
+            },
+            "respawns": map_system.respawn_scheduler.get_events()
+        }
+
+        if not self.writer:
+            self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save-writer")
+        self.writer.submit(self._write, data, snapshots)
+
+        self.saves += 1
+        self.last_save_time = time.monotonic()
+        self.gather_time = time.perf_counter() - start
+
+    def _write(self, data, snapshots):
+        """Write new area files, swap in game.json, then drop unused files (runs on the writer thread)"""
+        start = time.perf_counter()
+        try:
+            os.makedirs(self.areas_dir, exist_ok=True)
+            for file_name, snapshot in snapshots:
+                snapshot.write(os.path.join(self.areas_dir, file_name))
+
+            # Write a temporary file next to the real one, then swap it in
+            fd, temp_path = tempfile.mkstemp(dir=self.save_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.replace(temp_path, self.save_file)
+            except OSError:
+                os.remove(temp_path)
+                raise
+
+            # Only now can later saves reuse this save's area files
+            self.saved_areas = data["map"]["areas"]
+
+            # Area files the new save doesn't use are from older saves
+            used = {entry["file"] for entry in data["map"]["areas"].values() if "file" in entry}
+            for file_name in os.listdir(self.areas_dir):
+                if file_name not in used:
+                    os.remove(os.path.join(self.areas_dir, file_name))
+        except OSError as e:
+            print(f"Error saving game: {e}")
+        self.write_time = time.perf_counter() - start
+
+    def wait(self):
+        """Wait for saves in progress to finish writing"""
+        if self.writer:
+            self.writer.shutdown(wait=True)
+            self.writer = None
+
+    def close(self):
+        """Finish writing before exit"""
+        self.wait()
+
+    def load(self):
+        """Replace the running game with the saved one
+
+        Returns:
+            bool: Whether a save was loaded
+        """
+        self.wait()
+        try:
+            with open(self.save_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error loading save: {e}")
+            return False
+
+        if data.get("version") != SAVE_VERSION:
+            print(f"Unsupported save version {data.get('version')}")
+            return False
+
+        game = self.game
+        map_system = game.map_system
+        game.tick = data["tick"]
+        game.player.load_save_data(data["player"])
+
+        # Quests are tracked again from the loaded flags
+        quest_manager = game.quest_manager
+        quest_manager.quests.reset()
+        quest_manager.flags.flags = data["flags"]
+        quest_manager.flags.save_flags()
+
+        # Visited areas are read from their snapshot files, or regenerated
+        # from the seed, when first needed
+        map_system.reset()
+        map_system.generator.universe_seed = data["map"]["universe_seed"]
+        self.saved_areas = {}
+        for area_id, entry in data["map"]["areas"].items():
+            area_state = AreaState(area_id, map_system.spawn_manager, map_system.respawn_scheduler)
+            if "file" in entry:
+                area_state.saved_file = os.path.join(self.areas_dir, entry["file"])
+            else:
+                area_state.field_ticks = entry["field_ticks"]
+                area_state.seed_count = entry["seed_count"]
+            area_state.left_tick = entry["left_tick"]
+            map_system.area_states[area_id] = area_state
+            self.saved_areas[area_id] = entry
+
+        for area_id, due_tick, asteroid_type in data["respawns"]:
+            map_system.respawn_scheduler.schedule(area_id, due_tick, asteroid_type)
+
+        # Not an arrival, so visit objectives don't advance; the HUD is
+        # refreshed here instead of by AreaChanged
+        map_system.change_area(data["map"]["current_area"], publish=False)
+        game.hud_area_name = map_system.get_area_name(map_system.current_area_id)
+        map_system.previous_area_id = data["map"]["previous_area"]
+
+        self.generation = data["generation"]
+        self.last_save_time = time.monotonic()
+        print(f"Loaded save from {self.save_file}")
+        return True
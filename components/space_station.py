@@ -1,5 +1,35 @@
 import pygame
 from game_config import *
+from components.asset_registry import asset_registry
+
+def draw_station_fallback(width, height):
+    """Draw a diamond for stations without an image"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, SILVER, [
+        (width // 2, 0),  # Top
+        (width, height // 2),  # Right
+        (width // 2, height),  # Bottom
+        (0, height // 2)  # Left
+    ])
+    # Add some details
+    pygame.draw.polygon(surface, DARK_GREY, [
+        (width // 2, height // 4),  # Top inner
+        (width * 3 // 4, height // 2),  # Right inner
+        (width // 2, height * 3 // 4),  # Bottom inner
+        (width // 4, height // 2)  # Left inner
+    ])
+    return surface
+
+def get_station_image(size):
+    """Get the shared station image at the given size"""
+    return asset_registry.get_image("station.png", size, draw_station_fallback)
+
+def preload_station_images(objects):
+    """Warm the asset cache with the station sizes used by an area"""
+    for station_data in objects:
+        get_station_image(station_data.get("size", 120))
+
+asset_registry.register_preloader("station", preload_station_images)
 
 class SpaceStation(pygame.sprite.Sprite):
     def __init__(self, station_data=None):
@@ -22,26 +52,8 @@ class SpaceStation(pygame.sprite.Sprite):
             if "size" in station_data:
                 self.station_size = station_data["size"]
         
-        # Create station image
-        try:
-            self.image = pygame.image.load("assets/station.png").convert_alpha()
-            self.image = pygame.transform.scale(self.image, (self.station_size, self.station_size))
-        except:
-            # Create diamond if image not found
-            self.image = pygame.Surface((self.station_size, self.station_size), pygame.SRCALPHA)
-            pygame.draw.polygon(self.image, SILVER, [
-                (self.station_size // 2, 0),  # Top
-                (self.station_size, self.station_size // 2),  # Right
-                (self.station_size // 2, self.station_size),  # Bottom
-                (0, self.station_size // 2)  # Left
-            ])
-            # Add some details
-            pygame.draw.polygon(self.image, DARK_GREY, [
-                (self.station_size // 2, self.station_size // 4),  # Top inner
-                (self.station_size * 3 // 4, self.station_size // 2),  # Right inner
-                (self.station_size // 2, self.station_size * 3 // 4),  # Bottom inner
-                (self.station_size // 4, self.station_size // 2)  # Left inner
-            ])
+        # Shared station image, or a diamond if the image is missing
+        self.image = get_station_image(self.station_size)
         
         self.rect = self.image.get_rect(center=self.position)
         self.interaction_radius = self.station_size * 1.5  # Area where player can interact
@@ -0,0 +1,133 @@
+import pygame
+from game_config import *
+
+class SpatialHash:
+    """Uniform grid over the world used as a broadphase for proximity queries.
+
+    Sprites are bucketed by the cell that contains their rect centre. Queries
+    widen the search area by the largest half-extent seen so far, so sprites
+    whose rect spills over into neighbouring cells are still found.
+    """
+    def __init__(self, cell_size=128, width=WORLD_WIDTH, height=WORLD_HEIGHT):
+        self.cell_size = cell_size
+        self.cols = width // cell_size + 1
+        self.rows = height // cell_size + 1
+
+        # Largest half-width/height of any inserted sprite
+        self.margin = 0
+
+        # Cell -> ordered bucket of sprites, and sprite -> current cell
+        self.cells = {}
+        self.sprite_cells = {}
+
+    def __len__(self):
+        return len(self.sprite_cells)
+
+    def __contains__(self, sprite):
+        return sprite in self.sprite_cells
+
+    def cell_for(self, x, y):
+        """Get the grid cell containing a world position (clamped to the grid)"""
+        col = min(max(int(x) // self.cell_size, 0), self.cols - 1)
+        row = min(max(int(y) // self.cell_size, 0), self.rows - 1)
+        return col, row
+
+    def insert(self, sprite):
+        """Add a sprite to the grid"""
+        half_extent = max(sprite.rect.width, sprite.rect.height) // 2 + 1
+        if half_extent > self.margin:
+            self.margin = half_extent
+
+        cell = self.cell_for(*sprite.rect.center)
+        self.cells.setdefault(cell, {})[sprite] = None
+        self.sprite_cells[sprite] = cell
+
+    def remove(self, sprite):
+        """Remove a sprite from the grid"""
+        cell = self.sprite_cells.pop(sprite, None)
+        if cell is None:
+            return
+
+        bucket = self.cells[cell]
+        del bucket[sprite]
+        if not bucket:
+            del self.cells[cell]
+
+    def move(self, sprite):
+        """Re-bucket a sprite after its rect has moved"""
+        cell = self.cell_for(*sprite.rect.center)
+        if self.sprite_cells.get(sprite) != cell:
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def clear(self):
+        """Remove every sprite from the grid"""
+        self.cells.clear()
+        self.sprite_cells.clear()
+
+    def candidates(self, rect):
+        """Yield sprites bucketed in cells that could overlap the rect"""
+        min_col, min_row = self.cell_for(rect.left - self.margin, rect.top - self.margin)
+        max_col, max_row = self.cell_for(rect.right + self.margin, rect.bottom + self.margin)
+
+        for col in range(min_col, max_col + 1):
+            for row in range(min_row, max_row + 1):
+                bucket = self.cells.get((col, row))
+                if bucket:
+                    yield from bucket
+
+    def query_rect(self, rect):
+        """Return sprites whose rect overlaps the given world rect"""
+        return [sprite for sprite in self.candidates(rect) if sprite.rect.colliderect(rect)]
+
+    def query_radius(self, position, radius):
+        """Return sprites whose centre lies within radius of position"""
+        area = pygame.Rect(0, 0, radius * 2, radius * 2)
+        area.center = (int(position[0]), int(position[1]))
+
+        radius_sq = radius * radius
+        found = []
+        for sprite in self.candidates(area):
+            dx = sprite.rect.centerx - position[0]
+            dy = sprite.rect.centery - position[1]
+            if dx * dx + dy * dy <= radius_sq:
+                found.append(sprite)
+        return found
+
+    def nearest(self, position):
+        """Find the sprite whose centre is closest to position"""
+        if not self.sprite_cells:
+            return None
+
+        start_col, start_row = self.cell_for(position[0], position[1])
+        max_ring = max(self.cols, self.rows)
+
+        nearest_sprite = None
+        min_distance_sq = float('inf')
+
+        # Search outward in square rings of cells
+        for ring in range(max_ring + 1):
+            for col in range(start_col - ring, start_col + ring + 1):
+                for row in range(start_row - ring, start_row + ring + 1):
+                    # Only visit the outer edge of the ring
+                    if max(abs(col - start_col), abs(row - start_row)) != ring:
+                        continue
+
+                    bucket = self.cells.get((col, row))
+                    if not bucket:
+                        continue
+
+                    for sprite in bucket:
+                        dx = sprite.rect.centerx - position[0]
+                        dy = sprite.rect.centery - position[1]
+                        distance_sq = dx * dx + dy * dy
+                        if distance_sq < min_distance_sq:
+                            min_distance_sq = distance_sq
+                            nearest_sprite = sprite
+
+            # Anything in further rings is at least this far away
+            reach = ring * self.cell_size
+            if nearest_sprite is not None and min_distance_sq <= reach * reach:
+                break
+
+        return nearest_sprite
@@ -1,6 +1,20 @@
 import pygame
 import math
 from game_config import *
+from components.rotation_cache import rotation_cache
+
+# Unrotated laser images shared by all projectiles, keyed by (size, color)
+_laser_images = {}
+
+def get_laser_image(size, color):
+    """Get the shared unrotated image for a laser of the given size and color"""
+    key = (tuple(size), tuple(color))
+    image = _laser_images.get(key)
+    if image is None:
+        image = pygame.Surface(size)
+        image.fill(color)
+        _laser_images[key] = image
+    return image
 
 class Weapon(pygame.sprite.Sprite):
     """Base class for all weapon projectiles"""
@@ -9,6 +23,11 @@ class Weapon(pygame.sprite.Sprite):
         self.active = False
         self.module = module
         
+        # Reused by every initialize() so pooled projectiles don't allocate
+        self.position = pygame.math.Vector2()
+        self.direction = pygame.math.Vector2()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        
         if position and direction and module:
             self.initialize(position, direction, module)
     
@@ -20,45 +39,23 @@ class Weapon(pygame.sprite.Sprite):
     
     def initialize(self, position, direction, module):
         """Initialize for use from pool"""
-        self.position = pygame.math.Vector2(position)
-        self.direction = pygame.math.Vector2(direction)
+        self.position.update(position)
+        self.direction.update(direction)
         self.module = module
         
         # Get weapon properties from module
         size = self.get_module_stat('size', (5, 5))
         color = self.get_module_stat('color', RED)
         
-        # Create base sprite
-        self.original_image = pygame.Surface(size)
-        self.original_image.fill(color)
+        # Get shared base sprite
+        self.original_image = get_laser_image(size, color)
         
         # Calculate angle from direction vector (degrees)
         # Convert from direction vector to angle (0° is up, 90° is right)
         angle = math.degrees(math.atan2(-self.direction.x, -self.direction.y))
         
-        # Rotate the image
-        self.image = pygame.transform.rotate(self.original_image, angle)
-        self.rect = self.image.get_rect(center=position)
-        self.active = True
-    
-    def update(self, game_state):
-        """Update position and check bounds"""
-        # Skip updates if inventory is open
-        if game_state != 0:  # GAME_RUNNING = 0
-            return
-        
-        speed = self.get_module_stat('speed', 10)
-        self.position += self.direction * speed
+        # Shared rotation, kept within the rotation cache's memory cap
+        self.image = rotation_cache.get(self.original_image, angle)
+        self.rect.size = self.image.get_size()
         self.rect.center = self.position
-        
-        # Remove if off world
-        if (self.position.x < 0 or self.position.x > WORLD_WIDTH or 
-            self.position.y < 0 or self.position.y > WORLD_HEIGHT):
-            self.active = False
-            self.kill()
-
-# Factory function to create weapons
-def create_weapon(module, position, direction):
-    """Create a weapon of the specified type"""
-    weapon = Weapon(position, direction, module)
-    return weapon
\ No newline at end of file
+        self.active = True
\ No newline at end of file
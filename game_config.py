@@ -21,7 +21,27 @@ DARK_GREY = (50, 50, 50)
 
 # Clock for FPS
 clock = pygame.time.Clock()
-FPS = 60
+FPS = 60  # Fixed simulation ticks per second (frame-based timers count these)
+DISPLAY_FPS = 60  # Render frame cap, e.g. 30, 60 or 144 (0 = uncapped)
+MAX_TICKS_PER_FRAME = 5  # Drop simulation backlog beyond this many ticks per frame
+MAX_INTERPOLATION_STEP = 100  # Larger moves between ticks (wraps, jumps) aren't smoothed
+PREFETCH_BATCH = 50  # Asteroids built per tick while preparing the area a jump leads to
+MAX_HIBERNATED_AREAS = 4  # Left areas kept live for an instant return; older ones are snapshotted
+MAX_HIBERNATED_ASTEROIDS = 20000  # Snapshot the oldest hibernated areas beyond this many asteroids
+
+# Procedural sectors (asteroid fields without objects in their map file)
+UNIVERSE_SEED = 1  # With the area id, decides every generated sector
+SECTOR_ASTEROIDS = 30  # Asteroids generated per sector
+SECTOR_CLUSTERED = True  # Shape density and asteroid types with noise
+SECTOR_NOISE_CELL = 400  # Pixels between noise lattice points; larger makes bigger clusters
+
+# Save games
+SAVE_DIR = "saves/autosave"
+AUTOSAVE_INTERVAL = 60.0  # Seconds between autosaves
+
+# Profiler overlay (F3 toggles, F4 dumps a CSV trace)
+PROFILER_HISTORY = FPS * 4  # Frames kept for rolling stats and the graph
+PROFILER_TRACE_DIR = "profiles"  # F4 writes a new timestamped CSV trace here
 
 # Inventory grid config
 INVENTORY_COLS = 5
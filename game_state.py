@@ -1,6 +1,5 @@
 import pygame
 from game_config import *
-from components.asteroid import Asteroid
 
 class GameState:
     """Base game state class"""
@@ -26,6 +25,13 @@ class GameState:
     def exit(self):
         """Called when exiting this state"""
         pass
+    
+    def draw_world(self, screen, include_player=True):
+        """Draw the on-screen part of the game world with camera offset"""
+        screen.fill(BLACK)
+        for sprite in self.game.get_visible_sprites():
+            if include_player or sprite != self.game.player:
+                screen.blit(sprite.image, self.game.camera.apply(sprite))
 
 class RunningState(GameState):
     """Main gameplay state"""
@@ -33,6 +39,11 @@ class RunningState(GameState):
         # Update all sprites
         self.game.all_sprites.update(0)  # 0 = GAME_RUNNING in old system
         
+        # Move asteroids, lasers and flying ore (they are not in all_sprites)
+        self.game.map_system.spawn_manager.asteroid_field.step()
+        self.game.lasers.update()
+        self.game.flying_ores.update()
+        
         # Update camera
         self.game.camera.update(self.game.player)
         
@@ -44,19 +55,11 @@ class RunningState(GameState):
         can_interact = station and station.can_interact(self.game.player.position)
         self.game.interact_ui.update(can_interact, station.name if can_interact else None)
         
-        # Handle asteroid respawning
-        Asteroid.update_respawns(self.game.all_sprites, self.game.asteroids)
-        
-        # Handle collision detection
-        self.game.handle_collision_detection()
+        # Asteroid respawns and collisions run after this in Game.update_simulation
     
     def draw(self, screen):
-        # Clear screen
-        screen.fill(BLACK)
-        
-        # Draw sprites with camera offset
-        for sprite in self.game.all_sprites:
-            screen.blit(sprite.image, self.game.camera.apply(sprite))
+        # Clear screen and draw visible sprites with camera offset
+        self.draw_world(screen)
         
         # Draw UI elements
         self.game.jump_ui.draw(screen)
@@ -105,9 +108,7 @@ class InventoryState(GameState):
     
     def draw(self, screen):
         # Draw game world in background
-        screen.fill(BLACK)
-        for sprite in self.game.all_sprites:
-            screen.blit(sprite.image, self.game.camera.apply(sprite))
+        self.draw_world(screen)
         
         # Draw inventory UI
         self.game.inventory_ui.draw(screen)
@@ -130,9 +131,7 @@ class HangarState(GameState):
     
     def draw(self, screen):
         # Draw game world in background
-        screen.fill(BLACK)
-        for sprite in self.game.all_sprites:
-            screen.blit(sprite.image, self.game.camera.apply(sprite))
+        self.draw_world(screen)
         
         # Draw hangar UI
         self.game.hangar_ui.draw(screen)
@@ -167,11 +166,8 @@ class ConversationState(GameState):
                 self.game.conversation_ui.set_dialog(station.name, station.dialog)
     
     def draw(self, screen):
-        # Draw game world in background
-        screen.fill(BLACK)
-        for sprite in self.game.all_sprites:
-            if sprite != self.game.player:  # Don't update player during conversation
-                screen.blit(sprite.image, self.game.camera.apply(sprite))
+        # Draw game world in background (without the player during conversation)
+        self.draw_world(screen, include_player=False)
         
         # Draw conversation UI
         self.game.conversation_ui.draw(screen)
@@ -226,9 +222,7 @@ class MerchantState(GameState):
     
     def draw(self, screen):
         # Draw game world in background
-        screen.fill(BLACK)
-        for sprite in self.game.all_sprites:
-            screen.blit(sprite.image, self.game.camera.apply(sprite))
+        self.draw_world(screen)
         
         # Draw merchant UI
         self.game.merchant_ui.draw(screen)
@@ -252,9 +246,7 @@ class JobsBoardState(GameState):
     
     def draw(self, screen):
         # Draw game world in background
-        screen.fill(BLACK)
-        for sprite in self.game.all_sprites:
-            screen.blit(sprite.image, self.game.camera.apply(sprite))
+        self.draw_world(screen)
         
         # Draw jobs board UI
         self.game.jobs_board_ui.draw(screen)
@@ -296,9 +288,7 @@ class TextDialogState(GameState):
     
     def draw(self, screen):
         # Draw game world in background
-        screen.fill(BLACK)
-        for sprite in self.game.all_sprites:
-            screen.blit(sprite.image, self.game.camera.apply(sprite))
+        self.draw_world(screen)
         
         # Draw text dialog UI
         self.game.text_dialog_ui.draw(screen)
@@ -328,9 +318,7 @@ class NPCDialogueState(GameState):
     
     def draw(self, screen):
         # Draw game world in background
-        screen.fill(BLACK)
-        for sprite in self.game.all_sprites:
-            screen.blit(sprite.image, self.game.camera.apply(sprite))
+        self.draw_world(screen)
         
         # Draw NPC dialogue UI
         self.game.npc_dialogue_ui.draw(screen)
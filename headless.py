@@ -0,0 +1,231 @@
+"""Headless benchmark mode: run the game loop without a window and report timings."""
+
+import os
+import sys
+import json
+import random
+import time
+import tempfile
+import contextlib
+import pygame
+from profiler import FrameProfiler
+
+class KeyState:
+    """Pressed-key lookup compatible with pygame.key.get_pressed()"""
+    def __init__(self, keys=()):
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key):
+        return key in self.keys
+
+class ScriptedInput:
+    """Replays key presses from a script instead of the keyboard
+
+    The script is a function taking the simulation tick and returning the
+    keys held down during that tick.
+    """
+    def __init__(self, script):
+        self.script = script
+
+    def get_pressed(self, tick):
+        return KeyState(self.script(tick))
+
+def idle_script(tick):
+    """Touch nothing"""
+    return ()
+
+def mining_script(tick):
+    """Fly in a slow circle while firing constantly"""
+    return (pygame.K_UP, pygame.K_LEFT, pygame.K_SPACE)
+
+def setup_default(game):
+    """Keep the starting area as it is"""
+    pass
+
+def setup_dense_field(game):
+    """Replace the starting area with 5,000 random asteroids"""
+    spawn_manager = game.map_system.spawn_manager
+    spawn_manager.clear_objects()
+    spawn_manager.generate_random_asteroids(5000)
+
+def setup_rapid_fire(game):
+    """Fit the Rapid Laser with enough energy to never run dry"""
+    from components.module import WEAPON_RAPID_LASER
+    game.player.install_module("weapon", WEAPON_RAPID_LASER)
+    game.player.stats.max_energy = game.player.stats.energy = 100000
+
+def spray_script(tick):
+    """Spin in place while firing constantly"""
+    return (pygame.K_LEFT, pygame.K_SPACE)
+
+def setup_laser_storm(game):
+    """Empty the area and fire a slow laser every tick, so ~1,000 are in flight"""
+    from components.module import Module
+    game.map_system.spawn_manager.clear_objects()
+    storm_laser = Module("Storm Laser", "Benchmark weapon.", value=0,
+                         stats={"damage": 1, "speed": 1.5, "cooldown": 0, "energy_cost": 0,
+                                "color": (255, 0, 255), "size": (3, 8)})
+    game.player.install_module("weapon", storm_laser)
+
+# name -> (description, setup function, input script)
+SCENARIOS = {
+    "idle": ("Starting area with no input", setup_default, idle_script),
+    "mining": ("Starting area, circling and firing", setup_default, mining_script),
+    "dense_field": ("5,000 asteroids, circling and firing", setup_dense_field, mining_script),
+    "rapid_fire": ("Rapid Laser with unlimited energy", setup_rapid_fire, mining_script),
+    "laser_storm": ("A laser every tick, ~1,000 in flight", setup_laser_storm, spray_script)
+}
+
+def run_frames(game, frames):
+    """Run frames with exactly one simulation tick each, profiling every phase"""
+    profiler = FrameProfiler()
+    game.profiler = profiler
+
+    for _ in range(frames):
+        profiler.begin_frame()
+
+        game.handle_events()
+        profiler.mark("events")
+
+        game.update_simulation()
+
+        game.current_state.draw(game.screen)
+        profiler.mark("draw")
+
+        pygame.display.flip()
+        profiler.mark("flip")
+        profiler.end_frame()
+
+    game.profiler = None
+    return profiler
+
+def run_headless(game_class, args):
+    """Run a benchmark scenario on SDL's dummy drivers and report JSON timings"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    random.seed(args.seed)
+
+    description, setup, script = SCENARIOS[args.scenario]
+
+    # Keep game logging off stdout so the report can be piped
+    with contextlib.redirect_stdout(sys.stderr):
+        game = game_class()
+        game.input_script = ScriptedInput(script)
+        setup(game)
+        profiler = run_frames(game, args.frames)
+        game.quest_manager.flags.close()
+
+    report = {
+        "scenario": args.scenario,
+        "description": description,
+        "frames": args.frames,
+        "seed": args.seed,
+        "phases": profiler.summary(),
+        "sprites": {
+            "asteroids": len(game.map_system.spawn_manager.asteroids),
+            "lasers": len(game.lasers),
+            "flying_ores": len(game.flying_ores),
+            "all": len(game.all_sprites)
+        },
+        "projectiles": {
+            "fired": game.lasers.fired,
+            "pooled": game.lasers.pool.created
+        },
+        "events": {
+            "published": game.events.published
+        }
+    }
+    pygame.quit()
+
+    if args.trace:
+        profiler.write_csv(args.trace)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+    return report
+
+# Visited areas in each universe timed by the save benchmark, and asteroids per area
+SAVE_BENCHMARK_AREAS = (10, 100, 1000)
+SAVE_BENCHMARK_ASTEROIDS = 200
+
+def run_save_benchmark(game_class, args):
+    """Time full saves, delta saves and loads against the number of visited areas"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    random.seed(args.seed)
+
+    from components.save_system import SaveSystem
+    from components.map.area_state import AreaState
+    from components.map.area_snapshot import AreaSnapshot
+
+    universes = []
+    with contextlib.redirect_stdout(sys.stderr):
+        game = game_class()
+        map_system = game.map_system
+        spawn_manager = map_system.spawn_manager
+
+        # One packed area shared by every synthetic sector
+        spawn_manager.clear_objects()
+        spawn_manager.generate_random_asteroids(SAVE_BENCHMARK_ASTEROIDS)
+        snapshot = AreaSnapshot()
+        snapshot.capture(spawn_manager.asteroid_field, spawn_manager.stations)
+
+        for area_count in SAVE_BENCHMARK_AREAS:
+            for area_id in [area_id for area_id in map_system.area_states if area_id.startswith("sector-")]:
+                del map_system.area_states[area_id]
+            for index in range(area_count):
+                area_state = AreaState(f"sector-{index}", spawn_manager, map_system.respawn_scheduler)
+                area_state.saved_state = snapshot
+                area_state.left_tick = game.tick
+                map_system.area_states[area_state.area_id] = area_state
+
+            with tempfile.TemporaryDirectory() as save_dir:
+                save_system = SaveSystem(game, save_dir)
+
+                # First save writes every area
+                save_system.save()
+                save_system.wait()
+                full = (save_system.gather_time, save_system.write_time, save_system.areas_written)
+
+                # After a tick only the current area has changed
+                game.update_simulation()
+                save_system.save()
+                save_system.wait()
+                delta = (save_system.gather_time, save_system.write_time, save_system.areas_written - full[2])
+
+                size = sum(os.path.getsize(os.path.join(root, name))
+                           for root, _, names in os.walk(save_dir) for name in names)
+
+                start = time.perf_counter()
+                save_system.load()
+                load_time = time.perf_counter() - start
+
+            universes.append({
+                "areas": area_count,
+                "save_kb": round(size / 1024, 1),
+                "full_save": {"main_thread_ms": round(full[0] * 1000, 3),
+                              "writer_ms": round(full[1] * 1000, 3), "areas_written": full[2]},
+                "delta_save": {"main_thread_ms": round(delta[0] * 1000, 3),
+                               "writer_ms": round(delta[1] * 1000, 3), "areas_written": delta[2]},
+                "load_ms": round(load_time * 1000, 3)
+            })
+        game.quest_manager.flags.close()
+    pygame.quit()
+
+    report = {
+        "benchmark": "save",
+        "asteroids_per_area": SAVE_BENCHMARK_ASTEROIDS,
+        "seed": args.seed,
+        "universes": universes
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+    return report
@@ -1,15 +1,19 @@
+import os
+# Keep pygame's import banner off stdout, where --headless writes its JSON report
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
 import pygame
 import sys
+import time
 import random
+import argparse
 from game_config import *
 from components.player import Player
-from components.asteroid import Asteroid
-from components.weapon import Weapon
+from components.projectile_system import ProjectileSystem
 from components.camera import Camera
-from components.engine import Engine
+from components.events import EventBus, AsteroidDestroyed, AreaChanged
 from components.map_system import MapSystem
-from components.flying_ore import FlyingOre
-from components.space_station import SpaceStation
+from components.ore_stream import OreStream
+from components.save_system import SaveSystem
 from ui.inventory_ui import InventoryUI
 from ui.hangar_ui import HangarUI
 from ui.jump_ui import JumpUI
@@ -19,8 +23,11 @@ from ui.merchant_ui import MerchantUI
 from ui.jobs_board_ui import JobsBoardUI
 from ui.text_dialog_ui import TextDialogUI
 from ui.npc_dialogue_ui import NPCDialogueUI
+from ui.profiler_ui import ProfilerUI
 from quests.quest_manager import QuestManager
 from game_state import *
+from headless import SCENARIOS, run_headless, run_save_benchmark
+from profiler import FrameProfiler
 
 class Game:
     def __init__(self):
@@ -31,26 +38,33 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Space Mining Game")
         
+        # Gameplay events for quests, HUD and telemetry
+        self.events = EventBus()
+        
         # Create sprite groups
         self.all_sprites = pygame.sprite.Group()
-        self.lasers = pygame.sprite.Group()
-        self.asteroids = pygame.sprite.Group()
-        self.flying_ores = pygame.sprite.Group()
+        self.lasers = ProjectileSystem()  # Pooled, moved outside all_sprites
         
         # Create player
         self.player = Player()
         self.all_sprites.add(self.player)
         
+        # Ore flying from destroyed asteroids to the player
+        self.flying_ores = OreStream(self.player)
+        
         # Create camera
         self.camera = Camera(SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Create map system
-        self.map_system = MapSystem(self.all_sprites, self.asteroids, self)
+        self.map_system = MapSystem(self.all_sprites, self)
         
         # Create quest manager (this needs to be created before UI elements)
         self.quest_manager = QuestManager(self)
         self.player.game = self
         
+        # Save games (autosaved from the game loop)
+        self.save_system = SaveSystem(self)
+        
         # Create UI elements
         self.inventory_ui = InventoryUI(self.player)
         self.hangar_ui = HangarUI(self.player)
@@ -61,6 +75,12 @@ class Game:
         self.jobs_board_ui = JobsBoardUI(self)
         self.text_dialog_ui = TextDialogUI("Information")
         self.npc_dialogue_ui = NPCDialogueUI()
+        self.profiler_ui = ProfilerUI(self)
+        
+        # HUD font and area name, refreshed when the area changes
+        self.hud_font = pygame.font.SysFont(None, 24)
+        self.hud_area_name = "Unknown Area"
+        self.events.subscribe(AreaChanged, self.on_area_changed)
         
         # Game states
         self.states = {
@@ -78,22 +98,23 @@ class Game:
         # Load initial area - Copernicus Belt
         if not self.map_system.change_area("copernicus-belt")[0]:
             # Create default asteroids if area load fails
-            for _ in range(40):
-                roll = random.random()
-                if roll < 0.5:
-                    asteroid_type = "regular"
-                elif roll < 0.8:
-                    asteroid_type = "dry"
-                else:
-                    asteroid_type = "rich"
-                    
-                asteroid = Asteroid(asteroid_type=asteroid_type)
-                self.all_sprites.add(asteroid)
-                self.asteroids.add(asteroid)
+            rng = self.map_system.generator.get_rng("copernicus-belt")
+            self.map_system.spawn_manager.generate_random_asteroids(40, rng)
         
         # Game loop variables
         self.running = True
         self.last_shot_time = 0
+        
+        # Fixed-timestep simulation tracking
+        self.tick = 0  # Simulation ticks since start
+        self.sim_time = 0.0  # Seconds spent simulating last frame
+        self.render_time = 0.0  # Seconds spent drawing last frame
+        
+        # Optional per-phase frame profiler (None = no instrumentation)
+        self.profiler = None
+        
+        # Scripted input replaces the keyboard when set (headless runs)
+        self.input_script = None
     
     def change_state(self, state_name):
         """Change to a different game state"""
@@ -101,6 +122,9 @@ class Game:
             self.current_state.exit()
             self.current_state = self.states[state_name]
             self.current_state.enter()
+            
+            # State changes are a good moment to persist flag changes
+            self.quest_manager.flags.flush()
     
     def show_text_dialog(self, title, text):
         """Show a text dialog with the given title and text"""
@@ -108,18 +132,25 @@ class Game:
         self.text_dialog_ui.set_text(text)
         self.change_state("text_dialog")
     
+    def get_keys(self):
+        """Get the pressed keys from the keyboard or the input script"""
+        if self.input_script:
+            return self.input_script.get_pressed(self.tick)
+        return pygame.key.get_pressed()
+    
+    def get_time(self):
+        """Get simulated time in milliseconds"""
+        return self.tick * 1000 // FPS
+    
     def handle_player_shooting(self):
         """Handle player shooting weapons"""
-        keys = pygame.key.get_pressed()
+        keys = self.get_keys()
         can_shoot = self.current_state == self.states["running"] and not self.jump_ui.visible
         
         if keys[pygame.K_SPACE] and can_shoot:
-            current_time = pygame.time.get_ticks()
+            current_time = self.get_time()
             if current_time - self.last_shot_time > self.player.get_weapon_cooldown():
-                projectile = self.player.shoot()
-                if projectile:
-                    self.all_sprites.add(projectile)
-                    self.lasers.add(projectile)
+                if self.player.shoot():
                     self.last_shot_time = current_time
     
     def handle_jump(self):
@@ -140,29 +171,43 @@ class Game:
             self.player.rect.center = self.player.position
             
             # Set weapon cooldown
-            self.last_shot_time = pygame.time.get_ticks()
+            self.last_shot_time = self.get_time()
     
     def handle_collision_detection(self):
         """Handle laser hits on asteroids"""
-        hits = pygame.sprite.groupcollide(self.lasers, self.asteroids, True, False)
-        for projectile, asteroid_list in hits.items():
+        asteroid_field = self.map_system.spawn_manager.asteroid_field
+        for projectile in self.lasers:
+            # Only test asteroids in nearby grid cells
+            asteroid_list = asteroid_field.query_rect(projectile.rect)
+            if not asteroid_list:
+                continue
+            
+            self.lasers.release(projectile)
             for asteroid in asteroid_list:
                 if asteroid.damage(1):  # Apply damage
                     # Get ore drops
                     ore_drops = asteroid.get_ore_drops()
                     for ore_item in ore_drops:
                         # Create flying ore animation
-                        flying_ore = FlyingOre(asteroid.rect.center, ore_item, self.player)
-                        self.all_sprites.add(flying_ore)
-                        self.flying_ores.add(flying_ore)
+                        self.flying_ores.spawn(asteroid.rect.center, ore_item)
                     
                     # Schedule asteroid respawn
-                    if self.map_system.current_area_id and self.map_system.areas[self.map_system.current_area_id]["type"] == "asteroid_field":
+                    area_id = self.map_system.current_area_id
+                    if area_id and self.map_system.get_area_type(area_id) == "asteroid_field":
                         respawn_time = random.randint(30, 90) * FPS  # 30-90 seconds
-                        asteroid.schedule_respawn(respawn_time)
+                        self.map_system.schedule_respawn(asteroid.asteroid_type, respawn_time)
                     
+                    self.events.publish(AsteroidDestroyed(asteroid.asteroid_type, asteroid.rect.center, area_id))
                     asteroid.kill()
     
+    def get_visible_sprites(self):
+        """Get the sprites overlapping the camera view, in draw order"""
+        spawn_manager = self.map_system.spawn_manager
+        return self.camera.get_visible_sprites(
+            (spawn_manager.station_grid, spawn_manager.asteroid_field),
+            (self.flying_ores, self.lasers, (self.player,))
+        )
+    
     def draw_hud(self):
         """Draw heads-up display during gameplay"""
         # HUD background
@@ -171,27 +216,26 @@ class Game:
         hud_bg.fill(DARK_GREY)
         self.screen.blit(hud_bg, (0, 0))
         
-        # Get area name
-        area_name = "Unknown Area"
-        if self.map_system.current_area_id and self.map_system.current_area_id in self.map_system.areas:
-            area_name = self.map_system.areas[self.map_system.current_area_id].get("name", self.map_system.current_area_id)
-        
         # Get inventory stats
         used_slots, total_slots = self.player.get_inventory_capacity()
         
         # Draw area name
-        hud_area = pygame.font.SysFont(None, 24).render(f"Area: {area_name}", True, WHITE)
+        hud_area = self.hud_font.render(f"Area: {self.hud_area_name}", True, WHITE)
         self.screen.blit(hud_area, (10, 5))
         
         # Draw silver
-        hud_silver = pygame.font.SysFont(None, 24).render(f"Silver: {self.player.stats.silver}", True, SILVER)
+        hud_silver = self.hud_font.render(f"Silver: {self.player.stats.silver}", True, SILVER)
         silver_x = SCREEN_WIDTH // 2 - hud_silver.get_width() // 2
         self.screen.blit(hud_silver, (silver_x, 5))
         
         # Draw inventory stats
-        hud_inv = pygame.font.SysFont(None, 24).render(f"Cargo: {used_slots}/{total_slots}", True, WHITE)
+        hud_inv = self.hud_font.render(f"Cargo: {used_slots}/{total_slots}", True, WHITE)
         self.screen.blit(hud_inv, (SCREEN_WIDTH - hud_inv.get_width() - 10, 5))
     
+    def on_area_changed(self, event):
+        """Look up the new area's name for the HUD"""
+        self.hud_area_name = self.map_system.get_area_name(event.area_id)
+    
     def draw_fps(self):
         """Draw FPS counter"""
         fps = int(clock.get_fps())
@@ -199,37 +243,176 @@ class Game:
                                                      GREEN if fps >= 55 else 
                                                      YELLOW if fps >= 30 else RED)
         self.screen.blit(fps_text, (SCREEN_WIDTH - fps_text.get_width() - 5, 35))
+        
+        # Draw culling stats
+        sprite_text = pygame.font.SysFont(None, 20).render(
+            f"Drawn: {self.camera.drawn_sprites} Culled: {self.camera.culled_sprites}", True, SILVER)
+        self.screen.blit(sprite_text, (SCREEN_WIDTH - sprite_text.get_width() - 5, 50))
+        
+        # Draw simulation and render cost of the last frame
+        cost_text = pygame.font.SysFont(None, 20).render(
+            f"Sim: {self.sim_time * 1000:.1f} ms Render: {self.render_time * 1000:.1f} ms", True, SILVER)
+        self.screen.blit(cost_text, (SCREEN_WIDTH - cost_text.get_width() - 5, 65))
+    
+    def toggle_profiler(self):
+        """Turn the profiler overlay and its instrumentation on or off"""
+        if self.profiler:
+            self.profiler = None
+        else:
+            # Start timing straight away, as this can happen mid-frame
+            self.profiler = FrameProfiler(history=PROFILER_HISTORY)
+            self.profiler.begin_frame()
+    
+    def dump_profiler_trace(self, trace_dir=PROFILER_TRACE_DIR):
+        """Write the profiler's recent frames to a new CSV trace"""
+        if not self.profiler:
+            print("Profiler is off: press F3 to start recording, then F4 to dump a trace")
+            return
+        
+        path = os.path.join(trace_dir, time.strftime("profile_%Y%m%d-%H%M%S") + f"-{self.tick}.csv")
+        try:
+            os.makedirs(trace_dir, exist_ok=True)
+            self.profiler.write_csv(path)
+        except OSError as e:
+            print(f"Error writing profiler trace: {e}")
+            return
+        print(f"Wrote profiler trace to {path}")
+    
+    def handle_events(self):
+        """Pass pending pygame events to the current state"""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.toggle_profiler()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                self.dump_profiler_trace()
+            else:
+                self.current_state.handle_event(event)
+    
+    def update_simulation(self):
+        """Advance the game by one fixed simulation tick"""
+        profiler = self.profiler
+        
+        # Handle shooting (continuous input)
+        self.handle_player_shooting()
+        if profiler:
+            profiler.mark("shooting")
+        
+        # Update current state
+        self.current_state.update()
+        if profiler:
+            profiler.mark("state_update")
+        
+        if self.current_state == self.states["running"]:
+            # Handle asteroid respawning
+            self.map_system.update_respawns()
+            if profiler:
+                profiler.mark("respawns")
+            
+            # Handle collision detection
+            self.handle_collision_detection()
+            if profiler:
+                profiler.mark("collisions")
+        
+        self.tick += 1
     
     def run(self):
+        tick_length = 1.0 / FPS
+        accumulator = 0.0
+        previous_time = time.perf_counter()
+        
         # Game loop
         while self.running:
+            profiler = self.profiler
+            if profiler:
+                profiler.begin_frame()
+            
+            frame_start = time.perf_counter()
+            accumulator += frame_start - previous_time
+            previous_time = frame_start
+            
             # Event handling
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                else:
-                    self.current_state.handle_event(event)
+            self.handle_events()
+            if profiler:
+                profiler.mark("events")
+            
+            # Run as many fixed ticks as real time has passed
+            ticks = 0
+            while accumulator >= tick_length and ticks < MAX_TICKS_PER_FRAME:
+                self.update_simulation()
+                accumulator -= tick_length
+                ticks += 1
             
-            # Handle shooting (continuous input)
-            self.handle_player_shooting()
+            # Drop any backlog we couldn't catch up on instead of spiralling
+            if ticks == MAX_TICKS_PER_FRAME:
+                accumulator = min(accumulator, tick_length)
             
-            # Update current state
-            self.current_state.update()
+            # Write flag changes that have been pending long enough
+            self.quest_manager.flags.update()
+            
+            # Autosave in the background
+            self.save_system.update()
+            
+            render_start = time.perf_counter()
+            self.sim_time = render_start - frame_start
+            
+            # Interpolate moving sprites between the last two ticks
+            if self.current_state == self.states["running"]:
+                self.camera.interpolation = accumulator / tick_length
+            else:
+                self.camera.interpolation = 1.0
             
             # Draw current state
             self.current_state.draw(self.screen)
+            if profiler:
+                self.profiler_ui.draw(self.screen)
+                profiler.mark("draw")
             
             # Update display
             pygame.display.flip()
+            self.render_time = time.perf_counter() - render_start
+            if profiler:
+                profiler.mark("flip")
+                profiler.end_frame()
             
-            # Maintain framerate
-            clock.tick(FPS)
+            # Cap the render framerate
+            clock.tick(DISPLAY_FPS)
         
         # Quit
+        self.save_system.save()
+        self.save_system.close()
+        self.quest_manager.flags.close()
         pygame.quit()
         sys.exit()
 
 # Main entry point
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Space Mining Game")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run a scripted benchmark without a window and print phase timings as JSON")
+    parser.add_argument("--frames", type=int, default=600,
+                        help="Number of frames to run in headless mode")
+    parser.add_argument("--scenario", default="mining", choices=sorted(SCENARIOS),
+                        help="Headless benchmark scenario")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Random seed for headless runs")
+    parser.add_argument("--output",
+                        help="Write the headless JSON report to this file instead of stdout")
+    parser.add_argument("--trace",
+                        help="Also write per-frame headless phase timings to this CSV file")
+    parser.add_argument("--save-benchmark", action="store_true",
+                        help="Time saving and loading universes of increasing size and print them as JSON")
+    parser.add_argument("--new-game", action="store_true",
+                        help="Start a new game instead of loading the autosave")
+    args = parser.parse_args()
+    
+    if args.save_benchmark:
+        run_save_benchmark(Game, args)
+    elif args.headless:
+        run_headless(Game, args)
+    else:
+        game = Game()
+        if not args.new_game and game.save_system.has_save():
+            game.save_system.load()
+        game.run()
\ No newline at end of file
@@ -0,0 +1,80 @@
+import csv
+import time
+from collections import deque
+
+# Phases of a frame, in the order Game runs them
+PHASES = ("events", "shooting", "state_update", "respawns", "collisions", "draw", "flip")
+
+def percentile(values, fraction):
+    """Get a percentile from a list of values (fraction in 0-1)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+class FrameProfiler:
+    """Collects the time spent in each phase of every frame
+
+    Call begin_frame() at the top of the frame, mark(phase) after each phase
+    finishes, and end_frame() once the frame is presented. Time between two
+    marks is charged to the phase named by the second one, so a phase that
+    runs several times per frame (e.g. multiple simulation ticks) adds up.
+    """
+    def __init__(self, history=None):
+        # Completed frames as {phase: seconds}; history=None keeps them all
+        self.frames = deque(maxlen=history)
+        self.current = None
+        self.last_mark = 0.0
+
+    def begin_frame(self):
+        """Start timing a new frame"""
+        self.current = {}
+        self.last_mark = time.perf_counter()
+
+    def mark(self, phase):
+        """Charge the time since the last mark to a phase"""
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + now - self.last_mark
+        self.last_mark = now
+
+    def end_frame(self):
+        """Store the timings of the current frame"""
+        self.frames.append(self.current)
+        self.current = None
+
+    def get_phase_times(self, phase):
+        """Get a phase's time in every stored frame (0 if it didn't run)"""
+        return [frame.get(phase, 0.0) for frame in self.frames]
+
+    def get_rolling_stats(self, phase):
+        """Get (p50, p99) of a phase over the stored frames, in milliseconds"""
+        times = self.get_phase_times(phase)
+        return percentile(times, 0.50) * 1000, percentile(times, 0.99) * 1000
+
+    def write_csv(self, path):
+        """Dump the stored frames to a CSV trace, one row per frame in milliseconds"""
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(("frame",) + PHASES + ("total",))
+            for index, frame in enumerate(self.frames):
+                times = [frame.get(phase, 0.0) * 1000 for phase in PHASES]
+                writer.writerow([index] + [f"{t:.4f}" for t in times] + [f"{sum(times):.4f}"])
+
+    def summary(self):
+        """Summarise stored frames as per-phase statistics in milliseconds"""
+        report = {}
+        for phase in PHASES + ("frame",):
+            if phase == "frame":
+                times = [sum(frame.values()) for frame in self.frames]
+            else:
+                times = self.get_phase_times(phase)
+
+            report[phase] = {
+                "mean_ms": sum(times) / len(times) * 1000 if times else 0.0,
+                "p50_ms": percentile(times, 0.50) * 1000,
+                "p99_ms": percentile(times, 0.99) * 1000,
+                "max_ms": max(times) * 1000 if times else 0.0,
+                "total_ms": sum(times) * 1000
+            }
+        return report
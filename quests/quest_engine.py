@@ -0,0 +1,281 @@
+"""Data-driven quest engine that tracks objectives from gameplay events."""
+
+import glob
+import json
+import os
+from components.events import OreCollected, AsteroidDestroyed, AreaChanged, FlagChanged
+
+# Quest status flag values
+NOT_STARTED = 0
+IN_PROGRESS = 1
+COMPLETED = 2
+FAILED = 3
+
+class ObjectiveTracker:
+    """One quest objective with its progress kept up to date incrementally"""
+    def __init__(self, quest, data):
+        self.quest = quest
+        self.id = data["id"]
+        self.description = data.get("description", "")
+        self.type = data["type"]
+        self.unit = data.get("unit", "")
+        self.required = data.get("completion_value", 1)
+        
+        # What this objective counts: an item held or collected, an asteroid
+        # type destroyed (None for any) or an area arrived in
+        if self.type in ("hold_item", "collect_item"):
+            self.target = data["item"]
+        elif self.type == "destroy_asteroids":
+            self.target = data.get("asteroid_type")
+        elif self.type == "visit_area":
+            self.target = data["area"]
+        else:
+            raise ValueError(f"Unknown objective type '{self.type}' in quest '{quest.id}'")
+        
+        # Flags mirroring progress and completion, so dialogue can read them
+        self.completion_flag = data.get("completion_flag")
+        self.condition_flag = data.get("condition_flag")
+        
+        self.progress = 0
+    
+    def is_complete(self):
+        """Check if the objective's required progress has been reached"""
+        return self.progress >= self.required
+    
+    def get_progress_text(self):
+        """Describe progress, e.g. '3/5 ore'"""
+        text = f"{min(self.progress, self.required)}/{self.required}"
+        return f"{text} {self.unit}" if self.unit else text
+
+class Quest:
+    """A quest definition compiled from quests/<id>.json"""
+    def __init__(self, data):
+        self.id = data["id"]
+        self.name = data.get("name", self.id)
+        self.description = data.get("description", "")
+        
+        # Where the quest is offered
+        self.station = data.get("station")
+        self.npc = data.get("npc")
+        self.dialogue = data.get("dialogue")
+        
+        # Flag holding NOT_STARTED / IN_PROGRESS / COMPLETED / FAILED
+        self.status_flag = data.get("status_flag", self.id)
+        
+        # Status -> dialogue node the NPC starts at
+        self.start_nodes = {int(status): node for status, node in data.get("start_nodes", {}).items()}
+        
+        self.initial_flags = data.get("initial_flags", {})
+        self.objectives = [ObjectiveTracker(self, objective) for objective in data.get("objectives", [])]
+        
+        # Items taken when the quest is completed, and what it pays
+        self.turn_in = data.get("turn_in", {})
+        self.rewards = data.get("rewards", {})
+
+class QuestEngine:
+    """Loads every quest definition and tracks active objectives
+    
+    Only objectives of quests in progress are indexed, by (type, target),
+    so an event or inventory change costs one dict lookup plus the
+    objectives it actually advances, and nothing is polled per frame.
+    Quests start, complete and fail when their status flag is set, e.g.
+    by dialogue triggers.
+    """
+    def __init__(self, flags, game, quests_folder="quests"):
+        self.flags = flags
+        self.game = game
+        self.quests_folder = quests_folder
+        
+        # Quest id -> Quest, plus lookups by station, dialogue and status flag
+        self.quests = {}
+        self.station_quests = {}
+        self.dialogue_quests = {}
+        self.status_quests = {}
+        
+        # Ids of quests being tracked, and (objective type, target) -> their trackers
+        self.started = set()
+        self.active = {}
+        
+        self.load_quests()
+        self.init_flags()
+        
+        # Track objectives of quests already in progress
+        for quest in self.quests.values():
+            if self.get_status(quest) == IN_PROGRESS:
+                self.activate(quest)
+        
+        events = game.events
+        events.subscribe(OreCollected, self.on_ore_collected)
+        events.subscribe(AsteroidDestroyed, self.on_asteroid_destroyed)
+        events.subscribe(AreaChanged, self.on_area_changed)
+        events.subscribe(FlagChanged, self.on_flag_changed)
+        game.player.inventory.add_listener(self.on_inventory_changed)
+    
+    def load_quests(self):
+        """Compile every quest file in the quests folder"""
+        for path in sorted(glob.glob(os.path.join(self.quests_folder, "*.json"))):
+            try:
+                with open(path, 'r') as f:
+                    quest = Quest(json.load(f))
+            except (OSError, ValueError, KeyError) as e:
+                print(f"Error loading quest {path}: {e}")
+                continue
+            
+            self.quests[quest.id] = quest
+            self.status_quests[quest.status_flag] = quest
+            if quest.station:
+                self.station_quests.setdefault(quest.station, []).append(quest)
+            if quest.dialogue:
+                self.dialogue_quests[quest.dialogue] = quest
+        
+        print(f"Loaded {len(self.quests)} quests")
+    
+    def init_flags(self):
+        """Give quests that have never been seen their starting flags"""
+        for quest in self.quests.values():
+            if quest.status_flag not in self.flags.flags:
+                self.flags.set_flag(quest.status_flag, NOT_STARTED)
+                for flag_name, value in quest.initial_flags.items():
+                    self.flags.set_flag(flag_name, value)
+    
+    def get_status(self, quest):
+        """Get a quest's status flag value"""
+        return self.flags.get_flag(quest.status_flag, NOT_STARTED)
+    
+    def get_station_quests(self, station_name):
+        """Get the quests offered at a station"""
+        return self.station_quests.get(station_name, [])
+    
+    def get_start_node(self, dialogue_id):
+        """Get the node a dialogue starts at for its quest's status"""
+        quest = self.dialogue_quests.get(dialogue_id)
+        if not quest:
+            return "root"
+        return quest.start_nodes.get(self.get_status(quest), "root")
+    
+    def get_progress_text(self, quest):
+        """Describe progress on a quest's objectives, e.g. '3/5 ore'"""
+        return ", ".join(objective.get_progress_text() for objective in quest.objectives)
+    
+    def activate(self, quest):
+        """Start tracking a quest's objectives"""
+        if quest.id in self.started:
+            return
+        self.started.add(quest.id)
+        
+        for objective in quest.objectives:
+            self.active.setdefault((objective.type, objective.target), []).append(objective)
+            
+            # Held items are counted now; other progress carries on from its flag
+            if objective.type == "hold_item":
+                self.set_progress(objective, self.game.player.inventory.count(objective.target))
+            elif objective.completion_flag:
+                self.set_progress(objective, self.flags.get_flag(objective.completion_flag, 0))
+            else:
+                self.set_progress(objective, objective.progress)
+    
+    def deactivate(self, quest):
+        """Stop tracking a quest's objectives"""
+        if quest.id not in self.started:
+            return
+        self.started.discard(quest.id)
+        
+        for objective in quest.objectives:
+            key = (objective.type, objective.target)
+            trackers = self.active[key]
+            trackers.remove(objective)
+            if not trackers:
+                del self.active[key]
+    
+    def reset(self):
+        """Stop tracking every quest and zero its progress (e.g. before loading a save)
+        
+        Quests in progress are tracked again when their status flag is
+        next seen, e.g. on a FlagChanged event for every flag.
+        """
+        for quest in self.quests.values():
+            self.deactivate(quest)
+            for objective in quest.objectives:
+                objective.progress = 0
+    
+    def set_progress(self, objective, progress):
+        """Update an objective and the flags that mirror it"""
+        if objective.completion_flag and self.flags.get_flag(objective.completion_flag, None) != progress:
+            self.flags.set_flag(objective.completion_flag, progress)
+        objective.progress = progress
+        
+        if objective.condition_flag:
+            complete = objective.is_complete()
+            if self.flags.get_flag(objective.condition_flag, None) != complete:
+                self.flags.set_flag(objective.condition_flag, complete)
+    
+    def advance(self, objective_type, target, amount=1):
+        """Add progress to every active objective counting this event"""
+        for objective in self.active.get((objective_type, target), ()):
+            self.set_progress(objective, objective.progress + amount)
+    
+    def complete(self, quest):
+        """Take the quest's turn-in items and pay its rewards
+        
+        Returns:
+            bool: Whether the player had everything to turn in
+        """
+        player = self.game.player
+        inputs = list(quest.turn_in.items())
+        if not player.inventory.exchange(inputs, []):
+            print(f"Can't complete {quest.name}: missing turn-in items")
+            return False
+        player.total_ore -= sum(count for item_name, count in inputs)
+        
+        silver = quest.rewards.get("silver", 0)
+        player.stats.silver += silver
+        for flag_name, value in quest.rewards.get("flags", {}).items():
+            self.flags.set_flag(flag_name, value)
+        
+        print(f"{quest.name} completed! Awarded {silver} silver.")
+        return True
+    
+    def on_flag_changed(self, event):
+        """Start, complete or drop quests when their status flag changes"""
+        if event.flag_name is None:
+            # Any flag may have changed; re-check every quest
+            for quest in self.quests.values():
+                self.update_status(quest)
+            return
+        
+        quest = self.status_quests.get(event.flag_name)
+        if quest:
+            self.update_status(quest)
+    
+    def update_status(self, quest):
+        """Track, complete or drop a quest to match its status flag"""
+        status = self.get_status(quest)
+        if status == IN_PROGRESS:
+            self.activate(quest)
+            return
+        
+        # Completing is only valid from in progress
+        if status == COMPLETED and quest.id in self.started:
+            if not self.complete(quest):
+                self.flags.set_flag(quest.status_flag, IN_PROGRESS)
+                return
+        self.deactivate(quest)
+    
+    def on_inventory_changed(self, item_names):
+        """Recount held items that active objectives track"""
+        for item_name in item_names:
+            trackers = self.active.get(("hold_item", item_name))
+            if trackers:
+                count = self.game.player.inventory.count(item_name)
+                for objective in trackers:
+                    self.set_progress(objective, count)
+    
+    def on_ore_collected(self, event):
+        self.advance("collect_item", event.item.name, event.count)
+    
+    def on_asteroid_destroyed(self, event):
+        self.advance("destroy_asteroids", event.asteroid_type)
+        self.advance("destroy_asteroids", None)
+    
+    def on_area_changed(self, event):
+        self.advance("visit_area", event.area_id)
\ No newline at end of file
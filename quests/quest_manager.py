@@ -1,9 +1,10 @@
 """Quest manager for the game, handling dialogue and quest systems."""
 
 import os
-import json
 from components.dialogue_system.flags import FlagSystem
 from components.dialogue_system.npc import NPC
+from components.events import FlagChanged
+from quests.quest_engine import QuestEngine, NOT_STARTED, IN_PROGRESS, COMPLETED
 
 class QuestManager:
     """Manages quests and dialogue for the game."""
@@ -14,34 +15,32 @@ class QuestManager:
         os.makedirs("flags", exist_ok=True)
         self.flags = FlagSystem("flags/game_flags.json")
         
-        # Initialize default quest state if needed
-        if not os.path.exists("flags/game_flags.json"):
-            self.init_default_quest_states()
+        # Quest definitions and objective tracking
+        self.quests = QuestEngine(self.flags, game)
         
         # Active dialogue tracking
         self.current_station = None
         self.current_npc = None
         
+        # Republish flag changes on the game's event bus
+        self.flags.add_listener(self.on_flag_changed)
+        
         print("Quest manager initialized with flags:", self.flags.flags)
     
-    def init_default_quest_states(self):
-        """Initialize default quest states."""
-        default_flags = {
-            "mining_quest": 0  # 0=not started, 1=in progress, 2=completed, 3=failed
-        }
-        self.flags.flags = default_flags
-        self.flags.save_flags()
+    def on_flag_changed(self, flag_name):
+        """Publish flag changes on the game's event bus."""
+        value = self.flags.get_flag(flag_name, None) if flag_name else None
+        self.game.events.publish(FlagChanged(flag_name, value))
     
     def add_dialogue_to_station(self, station):
-        """Add dialogue handlers to a station."""
-        # Only handle Copernicus Station for now
-        if station.name == "Copernicus Station":
-            # Add Mining Foreman NPC
-            station._dialogue_handler = {
-                "npcs": {
-                    "Mining Foreman": NPC("Mining Foreman", "mining_foreman_dialogue", self.flags, self.game)
-                }
-            }
+        """Add dialogue handlers for the NPCs giving quests at a station."""
+        npcs = {}
+        for quest in self.quests.get_station_quests(station.name):
+            if quest.npc and quest.npc not in npcs:
+                npcs[quest.npc] = NPC(quest.npc, quest.dialogue, self.flags, self.game)
+        
+        if npcs:
+            station._dialogue_handler = {"npcs": npcs}
             print(f"Added dialogue handlers to {station.name}")
             return station._dialogue_handler
         return None
@@ -99,18 +98,19 @@ class QuestManager:
         if self.current_npc:
             return self.current_npc.get_dialogue_options()
         
-        # Default station options
-        if self.current_station and self.current_station.name == "Copernicus Station":
-            return [
-                {
-                    "text": "I'd like to speak with the Mining Foreman.",
-                    "index": 0
-                },
-                {
-                    "text": "Just passing through.",
-                    "index": 1
-                }
-            ]
+        # Default station options: one per quest giver, then leave
+        if self.current_station and hasattr(self.current_station, '_dialogue_handler'):
+            options = []
+            for npc_name in self.current_station._dialogue_handler["npcs"]:
+                options.append({
+                    "text": f"I'd like to speak with the {npc_name}.",
+                    "index": len(options)
+                })
+            options.append({
+                "text": "Just passing through.",
+                "index": len(options)
+            })
+            return options
         
         return []
     
@@ -122,39 +122,22 @@ class QuestManager:
             return result
         
         # Handle station dialogue options
-        if self.current_station:
-            # Handle Mining Foreman option for Copernicus Station
-            if option_index == 0 and self.current_station.name == "Copernicus Station":
-                return self.start_direct_npc_dialogue("Mining Foreman")
+        if self.current_station and hasattr(self.current_station, '_dialogue_handler'):
+            npc_names = list(self.current_station._dialogue_handler["npcs"])
+            if 0 <= option_index < len(npc_names):
+                return self.start_direct_npc_dialogue(npc_names[option_index])
         
         return False
     
-    def get_mining_quest_progress(self):
-        """Get mining quest progress."""
-        status = self.flags.get_flag("mining_quest", 0)
-        if status == 0:
-            return "Not Started"
-        elif status == 1:
-            # In progress - count rare ore
-            ore_count = self.count_rare_ore()
-            return f"In Progress ({ore_count}/5 ore)"
-        elif status == 2:
+    def get_quest_status_text(self, quest):
+        """Get a quest's status for display, with progress while in progress."""
+        status = self.quests.get_status(quest)
+        if status == NOT_STARTED:
+            return "Available"
+        elif status == IN_PROGRESS:
+            progress = self.quests.get_progress_text(quest)
+            return f"In Progress ({progress})" if progress else "In Progress"
+        elif status == COMPLETED:
             return "Completed"
         else:
-            return "Failed"
-    
-    def count_rare_ore(self):
-        """Count how much rare ore the player has."""
-        try:
-            rare_ore_count = 0
-            
-            # Check inventory for Rare Ore
-            for row in self.game.player.inventory:
-                for slot in row:
-                    if slot["item"] and slot["item"].name == "Rare Ore":
-                        rare_ore_count += slot["count"]
-            
-            return rare_ore_count
-        except Exception as e:
-            print(f"Error counting ore: {e}")
-            return 0
\ No newline at end of file
+            return "Failed"
\ No newline at end of file
@@ -33,19 +33,15 @@ class JobsBoardUI(BaseUI):
         if not station:
             return
             
-        # Add Copernicus Station quests
-        if station.name == "Copernicus Station":
-            # Mining Task
-            mining_status = self.game.quest_manager.flags.get_flag("mining_quest", 0)
-            
-            # Get status info
-            status_text = self.get_quest_status_text(mining_status)
-            status_color = self.get_quest_status_color(mining_status)
+        # Add the station's quests
+        quest_manager = self.game.quest_manager
+        for i, quest in enumerate(quest_manager.quests.get_station_quests(station.name)):
+            status = quest_manager.quests.get_status(quest)
             
             # Create quest button
             button_rect = pygame.Rect(
                 self.quest_area.x,
-                self.quest_area.y,
+                self.quest_area.y + i * 70,
                 self.quest_area.width,
                 60
             )
@@ -53,28 +49,14 @@ class JobsBoardUI(BaseUI):
             # Add to button list
             self.quest_buttons.append({
                 "rect": button_rect,
-                "name": "Mining Task",
-                "description": "Collect 5 rare ore for the Mining Foreman.",
-                "npc": "Mining Foreman",
-                "status": status_text,
-                "color": status_color,
-                "status_code": mining_status
+                "name": quest.name,
+                "description": quest.description,
+                "npc": quest.npc,
+                "status": quest_manager.get_quest_status_text(quest),
+                "color": self.get_quest_status_color(status),
+                "status_code": status
             })
     
-    def get_quest_status_text(self, status_code):
-        """Get display text for quest status."""
-        if status_code == 0:
-            return "Available"
-        elif status_code == 1:
-            # In progress - show ore count
-            if hasattr(self.game, 'quest_manager'):
-                return self.game.quest_manager.get_mining_quest_progress()
-            return "In Progress"
-        elif status_code == 2:
-            return "Completed"
-        else:
-            return "Failed"
-    
     def get_quest_status_color(self, status_code):
         """Get color for quest status."""
         if status_code == 0:
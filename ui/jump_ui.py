@@ -32,6 +32,9 @@ class JumpUI:
                 self.visible = True
                 self.direction = can_jump_dir
                 self.target_area = target_area_id
+                
+                # Get the area ready while the player decides
+                self.map_system.prefetch(target_area_id)
                 return
         
         # No valid jump available
@@ -55,8 +58,8 @@ class JumpUI:
         dir_text_surf = self.font.render(f"Jump {direction_text}", True, WHITE)
         
         # Target area text
-        if self.target_area and self.target_area in self.map_system.areas:
-            area_name = self.map_system.areas[self.target_area].get("name", self.target_area)
+        if self.target_area and self.map_system.map_loader.has_area(self.target_area):
+            area_name = self.map_system.get_area_name(self.target_area)
             target_text = f"to {area_name}"
         else:
             target_text = "to Unknown Area"
@@ -2,6 +2,7 @@ import pygame
 from game_config import *
 from ui.base_ui import BaseUI
 from components.items import MERCHANT_ITEMS
+from components.events import ItemSold
 
 class MerchantUI(BaseUI):
     def __init__(self, player):
@@ -20,6 +21,9 @@ class MerchantUI(BaseUI):
         self.buy_buttons = []
         self.sell_buttons = []
         
+        # Inventory version the sell buttons were built from
+        self.sell_version = None
+        
         # Initialize buy and sell items
         self.update_buy_buttons()
         self.update_sell_buttons()
@@ -47,27 +51,16 @@ class MerchantUI(BaseUI):
         for key in sell_keys:
             self.remove_clickable(key)
         
-        # Collect all unique items from player inventory
-        sell_items = []
-        item_counts = {}
-        
-        for row in self.player.inventory:
-            for slot in row:
-                if slot["item"]:
-                    item_name = slot["item"].name
-                    if item_name not in item_counts:
-                        sell_items.append(slot["item"])
-                        item_counts[item_name] = slot["count"]
-                    else:
-                        item_counts[item_name] += slot["count"]
+        inventory = self.player.inventory
+        self.sell_version = inventory.version
         
         # Create buttons for each item type
-        for i, item in enumerate(sell_items):
+        for i, item in enumerate(inventory.get_items()):
             button_rect = pygame.Rect(self.sell_rect.x + 10, self.sell_rect.y + 40 + i * 50, 
                                     self.sell_rect.width - 20, 40)
             self.sell_buttons.append({
                 "item": item,
-                "count": item_counts[item.name],
+                "count": inventory.count(item.name),
                 "rect": button_rect
             })
             # Add to clickable elements
@@ -93,8 +86,9 @@ class MerchantUI(BaseUI):
                 self.hover_item = button["item"]
                 break
         
-        # Update sell buttons to reflect current inventory
-        self.update_sell_buttons()
+        # Rebuild sell buttons only when the inventory has changed
+        if self.player.inventory.version != self.sell_version:
+            self.update_sell_buttons()
     
     def draw(self, screen):
         # Draw base UI
@@ -160,7 +154,7 @@ class MerchantUI(BaseUI):
             # Item name, count and value
             name_text = self.small_font.render(item.name, True, WHITE)
             count_text = self.small_font.render(f"x{count}", True, WHITE)
-            value_text = self.small_font.render(f"+{item.value} silver each", True, SILVER)
+            value_text = self.small_font.render(f"+{item.value} silver each (shift: all)", True, SILVER)
             
             screen.blit(name_text, (rect.x + 40, rect.y + 5))
             screen.blit(count_text, (rect.right - count_text.get_width() - 10, rect.y + 5))
@@ -184,10 +178,13 @@ class MerchantUI(BaseUI):
                 self.buy_item(button["item"])
                 return None
         
-        # Check sell buttons
+        # Check sell buttons (shift-click sells the whole stock)
         for i, button in enumerate(self.sell_buttons):
             if button["rect"].collidepoint(pos):
-                self.sell_item(button["item"])
+                if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                    self.sell_item(button["item"], self.player.inventory.count(button["item"].name))
+                else:
+                    self.sell_item(button["item"])
                 return None
                 
         return None
@@ -195,31 +192,21 @@ class MerchantUI(BaseUI):
     def buy_item(self, item):
         """Buy an item from the merchant"""
         if self.player.stats.silver >= item.value:
-            if self.player.add_ore(item):  # Add item to inventory
+            if self.player.add_ore(item, collected=False):  # Add item to inventory
                 self.player.stats.silver -= item.value
             else:
                 print("Inventory full!")
         else:
             print("Not enough silver!")
     
-    def sell_item(self, item):
-        """Sell an item to the merchant"""
-        # Find the item in player inventory
-        for row in range(INVENTORY_ROWS):
-            for col in range(INVENTORY_COLS):
-                slot = self.player.inventory[row][col]
-                if slot["item"] and slot["item"].name == item.name:
-                    # Remove one item and add value to silver
-                    slot["count"] -= 1
-                    self.player.stats.silver += item.value
-                    
-                    # If stack is empty, remove item type
-                    if slot["count"] <= 0:
-                        slot["item"] = None
-                        slot["count"] = 0
-                    
-                    self.player.total_ore -= 1
-                    
-                    # Update sell buttons after selling
-                    self.update_sell_buttons()
-                    return
\ No newline at end of file
+    def sell_item(self, item, count=1):
+        """Sell items to the merchant, or none if the player has fewer than count"""
+        if count > 0 and self.player.inventory.remove_many(item.name, count):
+            self.player.stats.silver += item.value * count
+            self.player.total_ore -= count
+            
+            if self.player.game:
+                self.player.game.events.publish(ItemSold(item, count, item.value * count))
+            
+            # Update sell buttons after selling
+            self.update_sell_buttons()
\ No newline at end of file
@@ -0,0 +1,98 @@
+import pygame
+from game_config import *
+from profiler import PHASES
+
+# Colour of each phase in the frame-time graph
+PHASE_COLORS = {
+    "events": (120, 120, 255),
+    "shooting": (255, 120, 120),
+    "state_update": (0, 200, 0),
+    "respawns": (200, 0, 200),
+    "collisions": (255, 160, 0),
+    "draw": (0, 200, 200),
+    "flip": (200, 200, 200)
+}
+
+class ProfilerUI:
+    """Overlay showing per-phase frame timings, sprite counts and a frame-time graph"""
+    def __init__(self, game):
+        self.game = game
+        self.font = pygame.font.SysFont(None, 18)
+
+        # Panel layout
+        self.bg_rect = pygame.Rect(5, 35, 300, 250)
+        self.graph_rect = pygame.Rect(self.bg_rect.x + 10, self.bg_rect.bottom - 70,
+                                      self.bg_rect.width - 20, 60)
+        self.pixels_per_ms = self.graph_rect.height / (1000 / FPS * 2)  # Two frame budgets tall
+
+        self.background = pygame.Surface(self.bg_rect.size)
+        self.background.set_alpha(200)
+        self.background.fill(DARK_GREY)
+
+        # Text is re-rendered every few frames rather than every frame
+        self.refresh_interval = 10
+        self.frames_until_refresh = 0
+        self.text_rows = []
+
+    def refresh_text(self):
+        """Re-render the timing and sprite count text"""
+        profiler = self.game.profiler
+
+        # Each row is a list of (text, color, x offset) columns
+        rows = [[("Phase", WHITE, 0), ("p50 ms", WHITE, 120), ("p99 ms", WHITE, 200)]]
+        for phase in PHASES:
+            p50, p99 = profiler.get_rolling_stats(phase)
+            color = PHASE_COLORS[phase]
+            rows.append([(phase, color, 0), (f"{p50:.2f}", color, 120), (f"{p99:.2f}", color, 200)])
+
+        spawn_manager = self.game.map_system.spawn_manager
+        rows.append([(f"Sprites: {len(self.game.all_sprites)}  Asteroids: {len(spawn_manager.asteroids)}"
+                      f"  Stations: {len(spawn_manager.stations)}", SILVER, 0)])
+        rows.append([(f"Lasers: {len(self.game.lasers)}  Ores: {len(self.game.flying_ores)}"
+                      f"  Drawn: {self.game.camera.drawn_sprites}", SILVER, 0)])
+
+        self.text_rows = [[(self.font.render(text, True, color), x) for text, color, x in row]
+                          for row in rows]
+
+    def draw(self, screen):
+        """Draw the overlay if profiling is enabled"""
+        profiler = self.game.profiler
+        if not profiler:
+            return
+
+        self.frames_until_refresh -= 1
+        if self.frames_until_refresh <= 0:
+            self.refresh_text()
+            self.frames_until_refresh = self.refresh_interval
+
+        screen.blit(self.background, self.bg_rect)
+        pygame.draw.rect(screen, WHITE, self.bg_rect, 1)
+
+        for i, row in enumerate(self.text_rows):
+            for text_surf, x in row:
+                screen.blit(text_surf, (self.bg_rect.x + 10 + x, self.bg_rect.y + 8 + i * 15))
+
+        self.draw_graph(screen, profiler)
+
+    def draw_graph(self, screen, profiler):
+        """Draw a stacked bar per recent frame, newest on the right"""
+        graph = self.graph_rect
+        pygame.draw.rect(screen, BLACK, graph)
+
+        frames = list(profiler.frames)[-graph.width:]
+        x = graph.right - len(frames)
+        for frame in frames:
+            y = graph.bottom
+            for phase in PHASES:
+                height = frame.get(phase, 0.0) * 1000 * self.pixels_per_ms
+                if height <= 0:
+                    continue
+                top = max(graph.top, y - height)
+                pygame.draw.line(screen, PHASE_COLORS[phase], (x, y), (x, top))
+                y = top
+            x += 1
+
+        # Frame budget line
+        budget_y = graph.bottom - (1000 / FPS) * self.pixels_per_ms
+        pygame.draw.line(screen, RED, (graph.left, budget_y), (graph.right, budget_y))
+        pygame.draw.rect(screen, WHITE, graph, 1)
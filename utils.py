@@ -1,5 +1,6 @@
 import pygame
 from game_config import *
+from components.asset_registry import asset_registry
 
 def load_image(name, size=40, prefix="", fallback_color=(100, 100, 100), 
               is_circle=False, first_letter=True):
@@ -15,36 +16,30 @@ def load_image(name, size=40, prefix="", fallback_color=(100, 100, 100),
         first_letter (bool): Whether to add the first letter to fallback
     
     Returns:
-        pygame.Surface: Loaded and scaled image or fallback
+        pygame.Surface: Loaded and scaled image or fallback (shared, do not draw on it)
     """
     # Format the filename based on the name
     filename = name.lower().replace(" ", "_")
-    path = f"assets/{prefix}{filename}.png"
     
-    try:
-        # Try to load the image
-        image = pygame.image.load(path).convert_alpha()
-        
-        # Scale to requested size (if the original is a different size)
-        if image.get_width() != size or image.get_height() != size:
-            image = pygame.transform.scale(image, (size, size))
-            
-        return image
-    except:
+    def draw_fallback(width, height):
         # Create fallback image
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
         # Draw either circle or rectangle
         if is_circle:
-            pygame.draw.circle(surface, fallback_color, (size // 2, size // 2), size // 2)
+            pygame.draw.circle(surface, fallback_color, (width // 2, height // 2), min(width, height) // 2)
         else:
-            pygame.draw.rect(surface, fallback_color, (0, 0, size, size))
+            pygame.draw.rect(surface, fallback_color, (0, 0, width, height))
         
         # Add first letter if requested
         if first_letter and name:
-            font = pygame.font.SysFont(None, size // 2)
+            font = pygame.font.SysFont(None, height // 2)
             text = font.render(name[0], True, WHITE)
-            surface.blit(text, (size // 2 - text.get_width() // 2, 
-                               size // 2 - text.get_height() // 2))
+            surface.blit(text, (width // 2 - text.get_width() // 2, 
+                               height // 2 - text.get_height() // 2))
         
-        return surface
\ No newline at end of file
+        return surface
+    
+    # Loaded, scaled and fallback images are all cached by the registry
+    return asset_registry.get_image(f"{prefix}{filename}.png", size, draw_fallback,
+                                    fallback_style=(fallback_color, is_circle, first_letter, name[:1]))
\ No newline at end of file